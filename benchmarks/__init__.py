@@ -0,0 +1 @@
+# Benchmark suite for the theming hot paths (run with `python -m benchmarks`)
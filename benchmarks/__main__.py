@@ -0,0 +1,38 @@
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from .harness import run_benchmarks, write_results, check_regressions
+from . import bench_theming  # noqa: F401 (registers benchmarks)
+
+HERE = Path(__file__).parent
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Run the nice_design benchmark suite.')
+    parser.add_argument('-k', '--filter', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimum seconds per timing run')
+    parser.add_argument('--output', type=Path, default=None,
+                        help='results JSON (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--budgets', type=Path, default=HERE / 'budgets.yaml',
+                        help='YAML mapping of benchmark name -> max median ms')
+    parser.add_argument('--baseline', type=Path, default=None, help='previous results JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown relative to the baseline (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.filter, repeat=args.repeat, min_time=args.min_time)
+
+    output = args.output or HERE / 'results' / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    print(f"\nResults written to {write_results(results, output)}")
+
+    problems = check_regressions(results, args.budgets, args.baseline, args.tolerance)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Benchmarks of the theming hot paths.
+"""
+import json
+
+from nicegui import Client
+from nicegui.page import page
+
+import nice_design as nice
+from nice_design.core.engine import ThemeEngine
+from nice_design.core.registry import ThemeRegistry
+from nice_design.core.styles import generate_theme_css
+from nice_design.core.manager import theme_manager
+from nice_design.components.atoms.theme_icons.palette_icon import palette_icon
+from nice_design.components.atoms.theme_icons.texture_icon import texture_icon
+
+from .harness import benchmark, quiet
+
+_state = {}
+
+
+def _load():
+    """Discovers the shipped library once and picks a representative theme."""
+    if _state:
+        return
+    nice.registry.discover_plugins()
+    theme = nice.registry.get_theme('nice-solarized')
+    _state['theme'] = theme
+    _state['alternate'] = nice.registry.get_palette(theme.palette.name, mode='light')
+    _state['engine'] = ThemeEngine()
+
+
+@benchmark('engine.compile', setup=_load)
+def bench_engine_compile():
+    t = _state['theme']
+    _state['engine'].compile(t.palette, t.texture, t.typography, t.layout)
+
+
+@benchmark('styles.generate_theme_css', setup=_load)
+def bench_generate_theme_css():
+    generate_theme_css(_state['theme'])
+
+
+@benchmark('styles.generate_theme_css[auto]', setup=_load)
+def bench_generate_theme_css_auto():
+    generate_theme_css(_state['theme'], _state['alternate'])
+
+
+@benchmark('manager.build_payload', setup=_load)
+def bench_build_payload():
+    payload = theme_manager.build_payload(_state['theme'], _state['alternate'], 'auto')
+    json.dumps(payload)
+
+
+@benchmark('registry.discover_plugins')
+def bench_discover_plugins():
+    ThemeRegistry(validate=False).discover_plugins()
+
+
+@benchmark('registry.discover_plugins[validate]')
+def bench_discover_plugins_validated():
+    # Silence the validation warnings logged on every discovery
+    with quiet():
+        ThemeRegistry(validate=True).discover_plugins()
+
+
+@benchmark('palette_icon.to_html', setup=_load)
+def bench_palette_icon_html():
+    palette_icon._cached_content.cache_clear()  # cold: measure the render, not a cache hit
+    palette_icon.to_html(_state['theme'].palette, size='20px')
+
+
+@benchmark('palette_icon.to_html[cached]', setup=_load)
+def bench_palette_icon_html_cached():
+    palette_icon.to_html(_state['theme'].palette, size='20px')
+
+
+@benchmark('texture_icon.to_html', setup=_load)
+def bench_texture_icon_html():
+    texture_icon._render.cache_clear()  # cold: measure the render, not a cache hit
+    texture_icon.to_html(_state['theme'].texture, _state['theme'].palette, size='20px')
+
+
+@benchmark('texture_icon.to_html[cached]', setup=_load)
+def bench_texture_icon_html_cached():
+    texture_icon.to_html(_state['theme'].texture, _state['theme'].palette, size='20px')
+
+
+@benchmark('theme_selector.construct', setup=_load)
+def bench_theme_selector():
+    client = Client(page('/'), request=None)
+    with client:
+        nice.theme_selector()
+    client.delete()
@@ -0,0 +1,166 @@
+"""
+Minimal benchmark harness: registration, timing, JSON results and regression checks.
+"""
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import yaml
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[[], None]
+    setup: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class Result:
+    name: str
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    number: int   # calls per timing run
+    repeat: int   # timing runs
+
+
+_BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+@contextlib.contextmanager
+def quiet():
+    """Silences discovery output: printed load errors and logged validation warnings."""
+    logger = logging.getLogger('nice_design')
+    level = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logger.setLevel(level)
+
+
+def benchmark(name: str, setup: Optional[Callable[[], None]] = None):
+    """Registers a zero-argument callable as a benchmark."""
+    def decorator(func):
+        _BENCHMARKS[name] = Benchmark(name=name, func=func, setup=setup)
+        return func
+    return decorator
+
+
+def _time_benchmark(bench: Benchmark, repeat: int, min_time: float) -> Result:
+    if bench.setup:
+        bench.setup()
+    bench.func()  # Warm-up (imports, caches)
+
+    # Grow the number of calls per run until one run lasts at least `min_time`
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            bench.func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    runs = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            bench.func()
+        runs.append((time.perf_counter() - start) / number)
+
+    return Result(
+        name=bench.name,
+        min_ms=min(runs) * 1e3,
+        median_ms=statistics.median(runs) * 1e3,
+        mean_ms=statistics.fmean(runs) * 1e3,
+        number=number,
+        repeat=repeat,
+    )
+
+
+def run_benchmarks(pattern: str = '', repeat: int = 5, min_time: float = 0.05) -> List[Result]:
+    """
+    Runs all registered benchmarks whose name contains `pattern`.
+    They run inside an event loop so NiceGUI elements can be created.
+    """
+    from nicegui import core
+
+    async def main():
+        core.loop = asyncio.get_running_loop()
+        results = []
+        for name, bench in _BENCHMARKS.items():
+            if pattern in name:
+                results.append(_time_benchmark(bench, repeat, min_time))
+                print(f"{name:<40} {results[-1].median_ms:10.4f} ms  (x{results[-1].number})")
+        return results
+
+    return asyncio.run(main())
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL, cwd=Path(__file__).parent).strip()
+    except Exception:
+        return None
+
+
+def write_results(results: List[Result], path: Path) -> Path:
+    """Writes results plus environment metadata to a JSON file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+def check_regressions(results: List[Result],
+                      budgets_path: Optional[Path] = None,
+                      baseline_path: Optional[Path] = None,
+                      tolerance: float = 0.25) -> List[str]:
+    """
+    Returns a message per benchmark whose median exceeds its absolute budget (ms, from a
+    YAML mapping) or the baseline JSON's median by more than `tolerance`.
+    """
+    problems = []
+
+    budgets = {}
+    if budgets_path and budgets_path.exists():
+        budgets = yaml.safe_load(budgets_path.read_text()) or {}
+
+    baseline = {}
+    if baseline_path and baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text()).get('results', {})
+
+    for r in results:
+        budget = budgets.get(r.name)
+        if budget is not None and r.median_ms > budget:
+            problems.append(f"{r.name}: {r.median_ms:.4f} ms exceeds budget of {budget} ms")
+
+        previous = baseline.get(r.name)
+        if previous:
+            limit = previous['median_ms'] * (1 + tolerance)
+            if r.median_ms > limit:
+                change = (r.median_ms / previous['median_ms'] - 1) * 100
+                problems.append(f"{r.name}: {r.median_ms:.4f} ms is {change:.0f}% slower than baseline "
+                                f"({previous['median_ms']:.4f} ms)")
+    return problems
@@ -0,0 +1,251 @@
+"""
+Headless multi-client load test for theme switching.
+
+Simulates many clients in-process: each opens a page with a `theme_selector`,
+then drags sliders and switches bundles/palettes with random think times, all
+concurrently on one event loop. Reports server-side `apply_theme` latency
+(from the instrumentation spans), bytes each client would receive over the
+websocket, and event-loop lag (sampled by a 1 ms ticker and by every client
+waking up from its think time, so the sample count grows with the load).
+
+    python -m benchmarks.load_test --clients 200 --actions 20
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import statistics
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from nicegui import Client, core
+from nicegui.json import dumps as ng_dumps
+from nicegui.page import page
+
+import nice_design as nice
+from nice_design.instrumentation import InMemoryExporter
+
+from .harness import quiet
+
+
+@dataclass
+class ClientStats:
+    initial_bytes: int = 0     # elements of the first render
+    update_bytes: int = 0      # element updates and messages after the first render
+    messages: int = 0
+    actions: int = 0
+
+
+@dataclass
+class LoadReport:
+    clients: int
+    actions: int
+    wall_s: float
+    apply_theme_ms: Dict[str, float] = field(default_factory=dict)
+    action_ms: Dict[str, float] = field(default_factory=dict)
+    loop_lag_ms: Dict[str, float] = field(default_factory=dict)
+    initial_kib_per_client: float = 0.0
+    update_kib_per_client: float = 0.0
+    bytes_per_action: float = 0.0
+    messages_per_action: float = 0.0
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    values = sorted(values)
+    pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]
+    return {
+        'count': len(values),
+        'mean': statistics.fmean(values),
+        'p50': pick(0.50),
+        'p95': pick(0.95),
+        'p99': pick(0.99),
+        'max': values[-1],
+    }
+
+
+def _drain(client: Client) -> tuple:
+    """
+    Serializes and clears what the outbox would send over the websocket.
+    (Without a socket connection the outbox loop leaves it queued.)
+    """
+    outbox = client.outbox
+    size, count = 0, 0
+    if outbox.updates:
+        data = {element_id: element._to_dict() if hasattr(element, '_to_dict') else None
+                for element_id, element in outbox.updates.items()}
+        size += len(ng_dumps(data))
+        count += 1
+        outbox.updates.clear()
+    for _, _, payload in outbox.messages:
+        size += len(ng_dumps(payload))
+        count += 1
+    outbox.messages.clear()
+    return size, count
+
+
+class _LagMonitor:
+    """Measures how late a periodic `asyncio.sleep(interval)` wakes up."""
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.lags: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, time.perf_counter() - start - self.interval) * 1e3)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+
+def _actions(client: Client, selector) -> Dict[str, callable]:
+    """
+    The interactions a simulated user performs on a theme_selector. Each one is
+    delivered like the websocket would: a 'change' event with the component's
+    JSON payload, dispatched through the client to the element's listener.
+    """
+    listener_id = next(event['listener_id'] for event in selector._to_dict()['events']
+                       if event['type'] == 'change')
+
+    def emit(patch: dict):
+        client.handle_event({'id': selector.id, 'listener_id': listener_id, 'args': [json.dumps(patch)]})
+
+    def drag(key, lo, hi, steps=5):
+        def run(rng: random.Random):
+            for _ in range(steps):
+                emit({key: round(rng.uniform(lo, hi), 2)})
+        return run
+
+    def pick(key, catalog):
+        options = [opt['value'] for opt in selector._props['catalog'][catalog]]
+        def run(rng: random.Random):
+            emit({key: rng.choice(options)})
+        return run
+
+    actions = {
+        'drag_roundness': drag('roundness', 0, 2.5),
+        'drag_spacing': drag('spacing', 0.5, 2.0),
+        'drag_text_scale': drag('scale', 1.0, 1.6),
+        'switch_palette': pick('palette', 'palettes'),
+    }
+    if selector._props['catalog']['bundles']:
+        actions['switch_bundle'] = pick('bundle', 'bundles')
+    return actions
+
+
+async def _simulate_client(client: Client, selector, stats: ClientStats, actions: int,
+                           think_ms: float, rng: random.Random, action_times: List[float],
+                           lags: List[float]):
+    available = _actions(client, selector)
+    names = list(available)
+    for _ in range(actions):
+        think = rng.uniform(0, 2 * think_ms) / 1e3
+        start = time.perf_counter()
+        await asyncio.sleep(think)
+        lags.append(max(0.0, time.perf_counter() - start - think) * 1e3)  # how late this client woke up
+        name = rng.choice(names)
+        start = time.perf_counter()
+        available[name](rng)
+        action_times.append((time.perf_counter() - start) * 1e3)
+        stats.actions += 1
+        await asyncio.sleep(0)  # let fire-and-forget calls (run_method) enqueue their messages
+        size, count = _drain(client)
+        stats.update_bytes += size
+        stats.messages += count
+
+
+async def run_load_test(clients: int = 100, actions: int = 20, think_ms: float = 50.0,
+                        client_bundles: bool = False, seed: int = 0) -> LoadReport:
+    """Runs the simulation on the current event loop and returns aggregated metrics."""
+    core.loop = asyncio.get_running_loop()
+    if not nice.registry.list_themes():
+        with quiet():
+            nice.registry.discover_plugins()
+
+    rng = random.Random(seed)
+    sessions = []
+    for _ in range(clients):
+        client = Client(page('/'), request=None)
+        with client:
+            selector = nice.theme_selector(client_bundles=client_bundles)
+        stats = ClientStats()
+        stats.initial_bytes = len(ng_dumps({e.id: e._to_dict() for e in client.elements.values()}))
+        _drain(client)
+        sessions.append((client, selector, stats))
+
+    action_times: List[float] = []
+    monitor = _LagMonitor()
+    start = time.perf_counter()
+    with InMemoryExporter() as exporter:
+        monitor.start()
+        await asyncio.gather(*(
+            _simulate_client(client, selector, stats, actions, think_ms,
+                             random.Random(rng.random()), action_times, monitor.lags)
+            for client, selector, stats in sessions
+        ))
+        await monitor.stop()
+    wall = time.perf_counter() - start
+
+    all_stats = [stats for _, _, stats in sessions]
+    total_actions = sum(s.actions for s in all_stats) or 1
+    for client, _, _ in sessions:
+        client.delete()
+
+    return LoadReport(
+        clients=clients,
+        actions=total_actions,
+        wall_s=wall,
+        apply_theme_ms=_percentiles([e.duration_ms for e in exporter.find('apply_theme')]),
+        action_ms=_percentiles(action_times),
+        loop_lag_ms=_percentiles(monitor.lags),
+        initial_kib_per_client=statistics.fmean(s.initial_bytes for s in all_stats) / 1024,
+        update_kib_per_client=statistics.fmean(s.update_bytes for s in all_stats) / 1024,
+        bytes_per_action=sum(s.update_bytes for s in all_stats) / total_actions,
+        messages_per_action=sum(s.messages for s in all_stats) / total_actions,
+    )
+
+
+def _print_report(report: LoadReport):
+    print(f"{report.clients} clients, {report.actions} actions in {report.wall_s:.2f} s")
+    for label, stats in (('apply_theme', report.apply_theme_ms), ('action', report.action_ms),
+                         ('loop lag', report.loop_lag_ms)):
+        if stats:
+            print(f"  {label:<12} p50 {stats['p50']:8.2f} ms  p95 {stats['p95']:8.2f} ms  "
+                  f"p99 {stats['p99']:8.2f} ms  max {stats['max']:8.2f} ms  (n={stats['count']})")
+    print(f"  first render {report.initial_kib_per_client:8.1f} KiB/client")
+    print(f"  updates      {report.update_kib_per_client:8.1f} KiB/client  "
+          f"({report.bytes_per_action:.0f} B and {report.messages_per_action:.1f} messages per action)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless multi-client load test for theme switching.')
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--actions', type=int, default=20, help='interactions per client')
+    parser.add_argument('--think-ms', type=float, default=50.0, help='mean pause between interactions')
+    parser.add_argument('--client-bundles', action='store_true', help='use client-side bundle switching')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=None, help='write the report as JSON')
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(args.clients, args.actions, args.think_ms,
+                                       client_bundles=args.client_bundles, seed=args.seed))
+    _print_report(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(asdict(report), indent=2))
+
+
+if __name__ == '__main__':
+    main()
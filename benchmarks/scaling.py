@@ -0,0 +1,144 @@
+"""
+Scaling harness: discovery time, memory and selector rendering against library size.
+
+    python -m benchmarks.scaling --shape small_files --sizes 10 100 1000 --plot scaling.png
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from nice_design.core.registry import ThemeRegistry
+
+from .harness import quiet
+from .synthetic import SHAPES, generate_shape
+
+
+def _discover(themes_dir: Path) -> ThemeRegistry:
+    registry = ThemeRegistry(themes_dir=themes_dir)
+    with quiet():  # Validation warnings of random palettes
+        registry.discover_plugins()
+    return registry
+
+
+def _time_selector(registry: ThemeRegistry) -> float:
+    """Seconds to build one theme_selector against `registry` (swapped in as the global one)."""
+    from nicegui import Client, core
+    from nicegui.page import page
+    import nice_design as nice
+
+    async def build():
+        core.loop = asyncio.get_running_loop()
+        client = Client(page('/'), request=None)
+        start = time.perf_counter()
+        with client:
+            nice.theme_selector()
+        elapsed = time.perf_counter() - start
+        client.delete()
+        return elapsed
+
+    previous, nice.registry = nice.registry, registry
+    try:
+        return asyncio.run(build())
+    finally:
+        nice.registry = previous
+
+
+def measure(themes_dir: Path, selector: bool = True) -> Dict[str, float]:
+    """Measures one library. Times are in milliseconds, memory in KiB."""
+    start = time.perf_counter()
+    registry = _discover(themes_dir)
+    discover_ms = (time.perf_counter() - start) * 1e3
+
+    # Memory is measured in a separate run: tracemalloc slows allocation down
+    tracemalloc.start()
+    _discover(themes_dir)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for listing in (registry.list_themes, registry.list_palettes, registry.list_textures,
+                    registry.list_layouts, registry.list_typographies):
+        listing()
+    list_ms = (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    for name in registry.list_themes():
+        registry.get_theme(name)
+    resolve_ms = (time.perf_counter() - start) * 1e3
+
+    row = {
+        'files': sum(1 for p in themes_dir.rglob('*') if p.is_file()),
+        'discover_ms': discover_ms,
+        'peak_kib': peak / 1024,
+        'list_ms': list_ms,
+        'resolve_ms': resolve_ms,
+    }
+    if selector:
+        row['selector_ms'] = _time_selector(registry) * 1e3
+    return row
+
+
+def run_scaling(shape: str, sizes: Sequence[int], selector: bool = True, seed: int = 0) -> List[Dict]:
+    """Generates and measures a library of each size."""
+    rows = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix='nd-scaling-') as tmp:
+            themes_dir = generate_shape(tmp, shape, size, seed=seed)
+            row = {'shape': shape, 'size': size, **measure(themes_dir, selector=selector)}
+        rows.append(row)
+        print('  '.join(f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}" for k, v in row.items()))
+    return rows
+
+
+def plot(rows: List[Dict], path: Path) -> Optional[Path]:
+    """Plots time and memory against size, per shape. Requires matplotlib (optional)."""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed; skipping the plot")
+        return None
+
+    metrics = [m for m in ('discover_ms', 'resolve_ms', 'selector_ms', 'peak_kib') if m in rows[0]]
+    fig, axes = plt.subplots(1, len(metrics), figsize=(4 * len(metrics), 3.5))
+    for ax, metric in zip(axes, metrics):
+        for shape in dict.fromkeys(r['shape'] for r in rows):
+            data = [r for r in rows if r['shape'] == shape]
+            ax.plot([r['size'] for r in data], [r[metric] for r in data], marker='o', label=shape)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('library size')
+        ax.set_title(metric)
+    axes[0].legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure how the registry scales with library size.')
+    parser.add_argument('--shape', choices=[*SHAPES, 'all'], default='all')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--no-selector', action='store_true', help='skip theme_selector rendering')
+    parser.add_argument('--output', type=Path, default=None, help='write rows as JSON')
+    parser.add_argument('--plot', type=Path, default=None, help='write a PNG plot (needs matplotlib)')
+    args = parser.parse_args()
+
+    shapes = list(SHAPES) if args.shape == 'all' else [args.shape]
+    rows = [row for shape in shapes for row in run_scaling(shape, args.sizes, selector=not args.no_selector)]
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(rows, indent=2))
+    if args.plot and plot(rows, args.plot):
+        print(f"Plot written to {args.plot}")
+
+
+if __name__ == '__main__':
+    main()
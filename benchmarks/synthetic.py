@@ -0,0 +1,155 @@
+"""
+Synthetic theme-library generator for scaling tests.
+
+Writes a ``themes/`` tree (palettes/, textures/, layouts/, fonts/ and bundle YAMLs)
+in the layout `ThemeRegistry` discovers, sized and shaped by a `LibraryShape`.
+"""
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Union
+
+import yaml
+
+from nice_design.core.validation import COLOR_ROLES
+
+_COLOR_NAMES = ('yellow', 'orange', 'red', 'magenta', 'violet', 'blue', 'cyan', 'green')
+
+
+@dataclass
+class LibraryShape:
+    palettes: int = 10           # palette names (each with a dark and a light variant)
+    palettes_per_file: int = 1   # >1 packs several palettes into one YAML list
+    textures: int = 5
+    layouts: int = 5
+    fonts: int = 3
+    bundles: int = 10            # theme combinations
+    inline_pillars: bool = False # define pillars inside bundle files instead of pillar folders
+    chain: int = 1               # bundle i references pillars defined `chain` bundle files earlier
+
+
+# Shape presets: size -> LibraryShape
+SHAPES: Dict[str, Callable[[int], LibraryShape]] = {
+    # One small YAML per palette / layout, one CSS per texture
+    'small_files': lambda n: LibraryShape(
+        palettes=n, textures=max(1, n // 4), layouts=max(1, n // 4),
+        fonts=max(1, n // 10), bundles=n,
+    ),
+    # Palettes packed into a handful of large multi-palette files
+    'large_files': lambda n: LibraryShape(
+        palettes=n, palettes_per_file=max(1, n // 4), textures=max(1, n // 4),
+        layouts=max(1, n // 4), fonts=max(1, n // 10), bundles=n,
+    ),
+    # Every pillar lives in a legacy bundle file; themes reference pillars of other bundles
+    'deep_bundles': lambda n: LibraryShape(
+        palettes=n, textures=n, layouts=n, fonts=max(1, n // 10), bundles=n,
+        inline_pillars=True, chain=max(1, n // 2),
+    ),
+}
+
+
+def _hex(rng: random.Random, lightness: range = range(0, 256)) -> str:
+    return '#' + ''.join(f'{rng.choice(lightness):02x}' for _ in range(3))
+
+
+def _palette(name: str, mode: str, rng: random.Random) -> dict:
+    dark = mode == 'dark'
+    data = {'name': name, 'mode': mode, 'colors': {c: _hex(rng) for c in _COLOR_NAMES}}
+    for role in COLOR_ROLES:
+        if role.startswith('surface'):
+            data[role] = _hex(rng, range(0, 64) if dark else range(200, 256))
+        elif role.startswith('content') or role.startswith('on_'):
+            data[role] = _hex(rng, range(200, 256) if dark else range(0, 64))
+        else:
+            data[role] = _hex(rng)
+    return data
+
+
+def _texture(name: str, rng: random.Random) -> dict:
+    return {
+        'name': name,
+        'texture_cls': f'-nd-t-{name}',
+        'opacity': round(rng.uniform(0.5, 1.0), 2),
+        'shadow_intensity': round(rng.uniform(0.0, 2.0), 2),
+        'highlight_intensity': round(rng.uniform(0.0, 2.0), 2),
+        'roundness': round(rng.uniform(0.0, 2.5), 2),
+        'border_width': rng.randint(0, 3),
+    }
+
+
+def _texture_css(name: str, rng: random.Random) -> str:
+    return (
+        f".-nd-t-{name} {{\n"
+        f"    background: rgba(255, 255, 255, {rng.uniform(0.05, 0.3):.2f}) !important;\n"
+        f"    backdrop-filter: blur({rng.randint(2, 20)}px) !important;\n"
+        f"}}\n"
+    )
+
+
+def _layout(name: str, rng: random.Random) -> dict:
+    return {'name': name, 'base_space': round(rng.uniform(0.5, 2.0), 2),
+            'transition_speed': round(rng.uniform(0.1, 0.6), 2)}
+
+
+def _dump(path: Path, data) -> None:
+    path.write_text(yaml.safe_dump(data, sort_keys=False))
+
+
+def generate_library(root: Union[str, Path], shape: LibraryShape, seed: int = 0) -> Path:
+    """
+    Writes a synthetic library under ``root/themes`` and returns that folder.
+    Pass it to ``ThemeRegistry(themes_dir=...)``. Output is deterministic for a given seed.
+    """
+    rng = random.Random(seed)
+    themes = Path(root) / 'themes'
+    for folder in ('palettes', 'textures', 'layouts', 'fonts'):
+        (themes / folder).mkdir(parents=True, exist_ok=True)
+
+    palette_names = [f'synth-palette-{i}' for i in range(shape.palettes)]
+    texture_names = [f'synth-texture-{i}' for i in range(shape.textures)]
+    layout_names = [f'synth-layout-{i}' for i in range(shape.layouts)]
+    font_names = [f'synth-font-{i}' for i in range(shape.fonts)]
+
+    palettes = [_palette(name, mode, rng) for name in palette_names for mode in ('dark', 'light')]
+    textures = [_texture(name, rng) for name in texture_names]
+    layouts = [_layout(name, rng) for name in layout_names]
+
+    # Font files are placeholders: discovery only looks at their names
+    for name in font_names:
+        (themes / 'fonts' / f'{name}.woff2').write_bytes(rng.randbytes(256))
+    for name in texture_names:
+        (themes / 'textures' / f'{name}.css').write_text(_texture_css(name, rng))
+
+    if not shape.inline_pillars:
+        per_file = max(1, shape.palettes_per_file) * 2  # dark + light
+        for i in range(0, len(palettes), per_file):
+            _dump(themes / 'palettes' / f'synth-palettes-{i // per_file}.yaml', palettes[i:i + per_file])
+        for data in textures:
+            _dump(themes / 'textures' / f"{data['name']}.yaml", data)
+        for data in layouts:
+            _dump(themes / 'layouts' / f"{data['name']}.yaml", data)
+
+    for i in range(shape.bundles):
+        ref = (i - shape.chain) % shape.bundles if shape.inline_pillars else i
+        bundle = {}
+        if shape.inline_pillars:
+            # Bundle i carries pillar set i, its theme uses the set of bundle i - chain
+            bundle['palettes'] = palettes[2 * (i % shape.palettes):2 * (i % shape.palettes) + 2]
+            bundle['textures'] = [textures[i % shape.textures]] if textures else []
+            bundle['layouts'] = [layouts[i % shape.layouts]] if layouts else []
+        theme = {'name': f'synth-theme-{i}', 'palette': palette_names[ref % shape.palettes]}
+        if texture_names:
+            theme['texture'] = texture_names[ref % shape.textures]
+        if layout_names:
+            theme['layout'] = layout_names[ref % shape.layouts]
+        if font_names:
+            theme['typography'] = font_names[ref % shape.fonts].replace('-', ' ').title()
+        bundle['theme'] = theme
+        _dump(themes / f'synth-theme-{i}.yaml', bundle)
+
+    return themes
+
+
+def generate_shape(root: Union[str, Path], shape: str, size: int, seed: int = 0) -> Path:
+    """Generates one of the `SHAPES` presets at the given size."""
+    return generate_library(root, SHAPES[shape](size), seed=seed)
@@ -5,6 +5,8 @@ from .core.engine import ThemeEngine
 from .core.registry import ThemeRegistry
 from .core.definitions import Theme, CompiledTheme
 from .core.manager import theme_manager
+from .core.fonts import FontManager
+from .core.font_pipeline import FONT_CACHE_ROUTE
 
 # Standard Exports
 from .components.atoms.button import button
@@ -31,8 +33,25 @@ def configure_defaults():
     """Configures global defaults via ThemeManager."""
     theme_manager.configure_defaults()
 
-def load_design_system():
-    """Injects the library's CSS and discovered theme assets into the NiceGUI head."""
+def load_design_system(preload_textures: bool = False, preload_fonts: bool = False, font_display: str = 'swap',
+                       low_power: str = 'auto', optimize_fonts: bool = False):
+    """
+    Injects the library's CSS and discovered theme assets into the NiceGUI head.
+
+    Args:
+        preload_textures: Inject the CSS of every discovered texture up front. By default
+            a texture's CSS is only injected once it is used on a page (see ThemeManager.ensure_textures).
+        preload_fonts: Declare every local font up front. By default a font is only declared
+            once a typography uses it or the theme selector previews it (see FontManager.ensure_fonts).
+        font_display: The `font-display` strategy of the injected fonts.
+        low_power: When to use the cheaper low-power textures: 'auto' (client signals),
+            'on' or 'off' (see ThemeManager.configure_low_power).
+        optimize_fonts: Serve local fonts as cached WOFF2 unicode-range subsets
+            (requires the `fonts` extra, see font_pipeline).
+    """
+    FontManager.configure(font_display)
+    theme_manager.configure_low_power(low_power, theme_manager.low_power_min_fps)
+
     # 1. Core library assets
     css_path = Path(__file__).parent / 'assets' / 'css'
     for css_file in ['global.css', 'textures.css', 'atoms.css', 'quasar_overrides.css']:
@@ -51,21 +70,30 @@ def load_design_system():
     if themes_dir.exists():
         app.add_static_files('/nd_themes', str(themes_dir))
         
+    # Serve the optimized (WOFF2 subset) fonts, including the ones built later on
+    registry.optimize_fonts = optimize_fonts
+    if optimize_fonts:
+        registry.font_cache_dir.mkdir(parents=True, exist_ok=True)
+        app.add_static_files(FONT_CACHE_ROUTE, str(registry.font_cache_dir))
+
     registry.discover_plugins()
     
-    # Inject Texture CSS from themes/textures/*.css
-    texture_css = registry.get_texture_css()
-    if texture_css:
-        ui.add_head_html(f"<style>{texture_css}</style>")
+    # Inject Texture CSS from themes/textures/*.css (otherwise done on demand)
+    if preload_textures:
+        theme_manager.ensure_textures(registry.get_texture(name).texture_cls for name in registry.list_textures())
         
-    # Inject Font CSS from themes/fonts/
-    font_css = registry.get_font_css()
-    if font_css:
-        ui.add_head_html(f"<style>{font_css}</style>")
+    # Inject Font CSS from themes/fonts/ (otherwise done on demand)
+    if preload_fonts:
+        FontManager.ensure_fonts(registry.list_font_families())
 
-def apply_theme(theme: Theme):
-    """Applies a theme using the ThemeManager."""
-    theme_manager.apply_theme(theme)
+def apply_theme(theme: Theme, alternate=None, mode: Optional[str] = None, wait_for_fonts: bool = False,
+                instant: bool = False):
+    """
+    Applies a theme using the ThemeManager (optionally with its other light/dark variant).
+    With `wait_for_fonts`, the theme is applied once its web fonts have loaded in the browser.
+    With `instant`, the swap does not animate (transitions are suspended for a frame).
+    """
+    theme_manager.apply_theme(theme, alternate=alternate, mode=mode, wait_for_fonts=wait_for_fonts, instant=instant)
 
 def setup(theme: Optional[Theme] = None):
     """
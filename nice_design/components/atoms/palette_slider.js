@@ -0,0 +1,44 @@
+// Color selection bar: hover, selection and the flex animation run in the browser.
+// Emits a single "change" event with the selected color.
+export default {
+  template: `
+    <div
+      class="relative w-full rounded-full overflow-hidden flex row no-wrap cursor-pointer"
+      :style="{ height: height, boxShadow: 'var(--nd-shadow-sm)' }"
+    >
+      <div
+        v-for="color in colors"
+        :key="color"
+        class="h-full transition-all duration-300 ease-out relative hover:opacity-90"
+        :style="{ backgroundColor: color, flex: color === selected ? 4 : 1 }"
+        @click="select(color)"
+      >
+        <div
+          v-if="color === selected"
+          class="absolute-center w-1.5 h-1.5 rounded-full bg-white/90 ring-1 ring-black/10"
+          style="box-shadow: var(--nd-shadow-sm)"
+        ></div>
+      </div>
+    </div>
+  `,
+  props: {
+    colors: Array,
+    value: String,
+    height: String,
+  },
+  data() {
+    return { selected: this.value };
+  },
+  watch: {
+    value(value) {
+      this.selected = value;
+    },
+  },
+  methods: {
+    select(color) {
+      if (color === this.selected) return;
+      this.selected = color;
+      this.$emit("change", color);
+    },
+  },
+};
@@ -16,7 +16,7 @@ class slider(ui.slider):
 
 
 
-class split_slider(ui.element):
+class split_slider(ui.element, component='split_slider.js'):
     """
     A unified slider component with TWO distinct handles, splitting from a central zero.
     Controls TWO independent values (Left Value and Right Value).
@@ -25,6 +25,7 @@ class split_slider(ui.element):
     [ Left Slider (Max -> 0) ] | [ Right Slider (0 -> Max) ]
     
     The Left Slider is visually reversed so that its '0' is at the right end (center of component).
+    Dragging and the value labels are handled by a Vue component in the browser.
     """
     def __init__(self,
                  limit: float = 2.0,
@@ -33,10 +34,24 @@ class split_slider(ui.element):
                  value_right: float = 0.0,
                  color_left: str = 'primary',
                  color_right: str = 'secondary',
-                 on_change: Optional[Callable[[Dict[str, float]], None]] = None):
-        super().__init__('div')
-        self.classes('relative-position w-full flex items-center justify-center my-1 gap-0 row no-wrap')
-        # self.style('height: 40px;') 
+                 on_change: Optional[Callable[[Dict[str, float]], None]] = None,
+                 *,
+                 label_left: Optional[str] = None,
+                 label_right: Optional[str] = None,
+                 decimals: int = 1,
+                 lazy: bool = False,
+                 throttle_ms: int = 0):
+        """
+        Args:
+            color_left / color_right: Quasar palette names ('primary', 'red-5') or raw
+                colors ('#ff8800', 'var(--nd-secondary)').
+            label_left / label_right: Captions shown above each side with the live value.
+            decimals: Digits of the value labels.
+            lazy: Notify the server only when a handle is released.
+            throttle_ms: Notify at most every N ms while dragging (and on release).
+        """
+        super().__init__()
+        self.classes('w-full')
 
         self._limit = limit
         self._step = step
@@ -45,68 +60,58 @@ class split_slider(ui.element):
         self._color_left = color_left
         self._color_right = color_right
         self._on_change = on_change
-        
-        with self:
-            # --- Left Side Container ---
-            with ui.row().classes('col flex items-center justify-end relative-position px-0').style('height: 32px;'):
-                # Left Slider (Reverse Mode)
-                self.slider_left = ui.slider(min=0, max=limit, step=step, value=value_left, on_change=self._handle_change_left)
-                # 'reverse' prop makes 0 be at the right side.
-                self.slider_left.props(f'reverse label track-size="4px" thumb-size="16px" :label-value="modelValue.toFixed(1)"')
-                
-                # Apply color (handle hex or var)
-                if color_left.startswith('#') or color_left.startswith('var('):
-                    self.slider_left.props(f':active-color="\'{color_left}\'" :thumb-color="\'{color_left}\'" :track-color="\'{color_left}\'"')
-                else:
-                    self.slider_left.props(f'color="{color_left}"')
-                
-                self.slider_left.classes('w-full')
-                
-            # --- Center Divider ---
-            ui.element('div').classes('bg-grey-4').style('width: 2px; height: 12px; z-index: 10;')
-
-            # --- Right Side Container ---
-            with ui.row().classes('col flex items-center justify-start relative-position px-0').style('height: 32px;'):
-                # Right Slider (Normal Mode)
-                self.slider_right = ui.slider(min=0, max=limit, step=step, value=value_right, on_change=self._handle_change_right)
-                self.slider_right.props(f'label track-size="4px" thumb-size="16px" :label-value="modelValue.toFixed(1)"')
-                
-                # Apply color (handle hex or var)
-                if color_right.startswith('#') or color_right.startswith('var('):
-                    self.slider_right.props(f':active-color="\'{color_right}\'" :thumb-color="\'{color_right}\'" :track-color="\'{color_right}\'"')
-                else:
-                    self.slider_right.props(f'color="{color_right}"')
-                
-                self.slider_right.classes('w-full')
 
-    def _handle_change_left(self, e):
-        self._value_left = e.value
-        self._notify()
-
-    def _handle_change_right(self, e):
-        self._value_right = e.value
+        self._props['limit'] = limit
+        self._props['step'] = step
+        self._props['value_left'] = value_left
+        self._props['value_right'] = value_right
+        self._props['color_left'] = color_left
+        self._props['color_right'] = color_right
+        self._props['label_left'] = label_left
+        self._props['label_right'] = label_right
+        self._props['decimals'] = decimals
+        self._props['lazy'] = lazy
+        self._props['throttle_ms'] = throttle_ms
+
+        self.on('change', self._handle_change)
+
+    @property
+    def value_left(self) -> float:
+        return self._value_left
+
+    @property
+    def value_right(self) -> float:
+        return self._value_right
+
+    def _handle_change(self, e):
+        """Values changed in the browser (already displayed there)."""
+        self._value_left = e.args['left']
+        self._value_right = e.args['right']
+        with self._props.suspend_updates():
+            self._props['value_left'] = self._value_left
+            self._props['value_right'] = self._value_right
         self._notify()
         
     def _notify(self):
         if self._on_change:
             self._on_change({'left': self._value_left, 'right': self._value_right})
 
+    def set_values(self, value_left: float, value_right: float):
+        """Moves both handles without notifying `on_change`."""
+        self._value_left = value_left
+        self._value_right = value_right
+        self._props['value_left'] = value_left
+        self._props['value_right'] = value_right
+
     def set_colors(self, color_left: str, color_right: str):
         """Updates the colors of the sliders."""
         self._color_left = color_left
         self._color_right = color_right
-        
-        for s, c in [(self.slider_left, color_left), (self.slider_right, color_right)]:
-            # Clear old color props
-            # Quasar props are additive in NiceGUI unless we are careful, 
-            # but setting color="new" or :active-color="new" usually overrides.
-            if c.startswith('#') or c.startswith('var('):
-                s.props(f':active-color="\'{c}\'" :thumb-color="\'{c}\'" :track-color="\'{c}\'"')
-            else:
-                s.props(f'color="{c}"')
+        self._props['color_left'] = color_left
+        self._props['color_right'] = color_right
 
 
-class palette_slider(ui.element):
+class palette_slider(ui.element, component='palette_slider.js'):
     """
     A horizontal color selection bar resembling a slider.
     Displays a set of colors and emphasizes the selected one by expanding it.
@@ -114,90 +119,64 @@ class palette_slider(ui.element):
     
     Visual Structure:
     [  ][  ][    SELECTED    ][  ][  ]
+
+    Hover, selection and the flex animation are handled by a Vue component in the
+    browser; the server only receives the picked color.
     """
     def __init__(self, 
                  colors: list,
                  value: Optional[str] = None, 
                  height: str = '12px',
                  on_change: Optional[Callable[[str], None]] = None):
-        super().__init__('div')
-        # Container styling
-        self.classes('relative w-full rounded-full overflow-hidden flex row no-wrap cursor-pointer')
-        self.style(f'height: {height}; box-shadow: var(--nd-shadow-sm);')
+        super().__init__()
         
         # Validations
         if not colors:
              colors = ['#cccccc'] # Fallback
              
-        self._colors = colors
+        self._colors = list(colors)
         self._value = value if value in colors else colors[0]
         self._on_change = on_change
-        self._items = {} # Map color -> element
-        
-        self._render_items()
-
-    def _render_items(self):
-        self.clear()
-        self._items = {}
-        with self:
-            for color in self._colors:
-                # We use specific flex styles for animation
-                # Flex-1 for unselected, Flex-4 for selected
-                is_selected = (color == self._value)
-                flex_val = '4' if is_selected else '1'
-                
-                item = ui.element('div').classes('h-full transition-all duration-300 ease-out relative hover:opacity-90')
-                item.style(f'background-color: {color}; flex: {flex_val};')
-                
-                # Selection indicator
-                if is_selected:
-                    self._inject_indicator(item)
-                    
-                # Click event
-                # Note: Capture color in lambda default arg
-                item.on('click', lambda _, c=color: self.set_value(c))
-                
-                self._items[color] = item
 
-    def _inject_indicator(self, container):
-        with container:
-            # A subtle dot to indicate active state clearly
-             ui.element('div').classes('absolute-center w-1.5 h-1.5 rounded-full bg-white/90 ring-1 ring-black/10').style('box-shadow: var(--nd-shadow-sm);')
+        self._props['colors'] = self._colors
+        self._props['value'] = self._value
+        self._props['height'] = height
+
+        self.on('change', self._handle_change)
+
+    @property
+    def value(self) -> Optional[str]:
+        return self._value
+
+    def _handle_change(self, e):
+        """Selection made in the browser (already displayed there)."""
+        if e.args not in self._colors or e.args == self._value:
+            return
+        self._value = e.args
+        with self._props.suspend_updates():  # The browser already shows it
+            self._props['value'] = e.args
+        if self._on_change:
+            self._on_change(e.args)
 
     def set_value(self, value: str):
-        if value == self._value:
+        if value == self._value or value not in self._colors:
             return
-        if value not in self._items:
-            # If the value is not in our keys, try to find it or ignore
-            if value not in self._colors:
-                return
             
         self._value = value
-        self._update_selection_visuals()
+        self._props['value'] = value
                 
         if self._on_change:
             self._on_change(value)
 
     def set_colors(self, colors: list, value: Optional[str] = None):
-        """Updates the available colors and optionally the current value."""
-        self._colors = colors
+        """Updates the available colors and optionally the current value (only the color array is sent)."""
+        if colors == self._colors and (not value or value == self._value):
+            return  # Nothing changed
+        self._colors = list(colors)
         if value:
             self._value = value
         elif self._value not in colors:
             self._value = colors[0] if colors else None
-            
-        self._render_items()
-
-    def _update_selection_visuals(self):
-        """Updates the transition and selection indicators without full re-render."""
-        for color, item in self._items.items():
-            item.clear() # Remove any indicators
-            
-            if color == self._value:
-                # Expand
-                item.style(f'background-color: {color}; flex: 4;')
-                self._inject_indicator(item)
-            else:
-                # Contract
-                item.style(f'background-color: {color}; flex: 1;')
 
+        self._props['colors'] = self._colors
+        self._props['value'] = self._value
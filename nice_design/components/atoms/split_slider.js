@@ -0,0 +1,117 @@
+// Two sliders splitting from a central zero (the left one reversed).
+// Value labels are rendered in the browser. The server receives a "change" event
+// on every tick, at most every `throttle_ms`, or only on release (`lazy`).
+export default {
+  template: `
+    <div class="w-full">
+      <div v-if="label_left || label_right" class="row w-full justify-between" style="margin-bottom: -10px">
+        <div class="column nd-gap-0">
+          <div class="text-xs opacity-60">{{ label_left }}</div>
+          <div class="text-xs font-bold">{{ format(left) }}</div>
+        </div>
+        <div class="column items-end nd-gap-0">
+          <div class="text-xs opacity-60">{{ label_right }}</div>
+          <div class="text-xs font-bold">{{ format(right) }}</div>
+        </div>
+      </div>
+      <div class="relative-position w-full flex items-center justify-center my-1 gap-0 row no-wrap">
+        <div class="col flex items-center justify-end relative-position px-0" style="height: 32px">
+          <q-slider
+            v-model="left"
+            reverse
+            label
+            :min="0"
+            :max="limit"
+            :step="step"
+            track-size="4px"
+            thumb-size="16px"
+            :label-value="format(left)"
+            v-bind="colorProps(color_left)"
+            class="w-full"
+            @update:model-value="onInput"
+            @change="emitChange"
+          />
+        </div>
+        <div class="bg-grey-4" style="width: 2px; height: 12px; z-index: 10"></div>
+        <div class="col flex items-center justify-start relative-position px-0" style="height: 32px">
+          <q-slider
+            v-model="right"
+            label
+            :min="0"
+            :max="limit"
+            :step="step"
+            track-size="4px"
+            thumb-size="16px"
+            :label-value="format(right)"
+            v-bind="colorProps(color_right)"
+            class="w-full"
+            @update:model-value="onInput"
+            @change="emitChange"
+          />
+        </div>
+      </div>
+    </div>
+  `,
+  props: {
+    limit: Number,
+    step: Number,
+    value_left: Number,
+    value_right: Number,
+    color_left: String,
+    color_right: String,
+    label_left: String,
+    label_right: String,
+    decimals: Number,
+    lazy: Boolean,
+    throttle_ms: Number,
+  },
+  data() {
+    return {
+      left: this.value_left,
+      right: this.value_right,
+      sent: [this.value_left, this.value_right],
+      lastEmit: 0,
+      timer: null,
+    };
+  },
+  watch: {
+    value_left(value) {
+      this.left = value;
+      this.sent[0] = value;
+    },
+    value_right(value) {
+      this.right = value;
+      this.sent[1] = value;
+    },
+  },
+  beforeUnmount() {
+    clearTimeout(this.timer);
+  },
+  methods: {
+    format(value) {
+      return Number(value).toFixed(this.decimals);
+    },
+    colorProps(color) {
+      // Quasar's color props take palette names ("primary", "red-5");
+      // raw colors are passed as a CSS variable that atoms.css applies to the track and thumb.
+      if (color.startsWith("#") || color.startsWith("var(")) {
+        return { class: "nd-split-slider--raw-color", style: { "--nd-slider-color": color } };
+      }
+      return { color: color, "thumb-color": color };
+    },
+    onInput() {
+      if (this.lazy) return;
+      const wait = (this.throttle_ms || 0) - (Date.now() - this.lastEmit);
+      if (wait <= 0) this.emitChange();
+      else if (!this.timer) this.timer = setTimeout(this.emitChange, wait);
+    },
+    emitChange() {
+      clearTimeout(this.timer);
+      this.timer = null;
+      if (this.left === this.sent[0] && this.right === this.sent[1]) return;
+      this.sent = [this.left, this.right];
+      this.lastEmit = Date.now();
+      this.$emit("change", { left: this.left, right: this.right });
+    },
+  },
+};
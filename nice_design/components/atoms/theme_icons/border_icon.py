@@ -33,7 +33,9 @@ class border_icon(ui.element):
                 border-radius: 50%;
                 box-sizing: border-box;
                 background: transparent;
-                transition: all var(--nd-transition-speed) ease;
+                transition-property: var(--nd-transition-properties, all);
+                transition-duration: var(--nd-transition-speed);
+                transition-timing-function: ease;
             ''')
     
     @staticmethod
@@ -49,7 +51,9 @@ class border_icon(ui.element):
             display: inline-block;
             box-sizing: border-box;
             background: transparent;
-            transition: all var(--nd-transition-speed) ease;
+            transition-property: var(--nd-transition-properties, all);
+            transition-duration: var(--nd-transition-speed);
+            transition-timing-function: ease;
         '''.strip().replace('\n', ' ')
         
         return f'<div class="-nd-c-border-icon" style="{style}"></div>'
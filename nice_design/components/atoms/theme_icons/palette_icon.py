@@ -1,26 +1,30 @@
 from nicegui import ui
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 from nice_design.core.definitions import Palette
+from .rendering import icon_palette, theme_color
 
 class palette_icon(ui.element):
     """
     A custom SVG icon that displays a visual representation of a theme palette.
     Features two half-disks in the center (background and foreground) surrounded by 
     arcs of the 8 named colors.
+    With `follow_theme`, fills reference the theme's CSS variables so the icon
+    restyles with the active theme without being re-rendered.
     """
     def __init__(
         self, 
         palette: Palette,
         *, 
         size: str = "24px",
-        circular: bool = True
+        circular: bool = True,
+        follow_theme: bool = False
     ):
         super().__init__('svg')
+        self._follow_theme = follow_theme
         
         # Extract colors from the palette (which now includes semantics)
-        background_color = palette.surface_base
-        foreground_color = palette.content_main
-        colors = palette.colors
+        background_color, foreground_color, colors = self._snapshot(palette, follow_theme)
         
         # Set SVG attributes
         self._props['viewBox'] = '0 0 24 24'
@@ -33,10 +37,30 @@ class palette_icon(ui.element):
         
         # Generate the SVG content
         self._generate_icon(background_color, foreground_color, colors)
+
+    def update(self, *, palette: Optional[Palette] = None) -> None:
+        """
+        Re-renders the SVG content in place for a new palette.
+        Nothing is sent when the drawn colors did not change.
+        """
+        if palette is not None:
+            content = self._cached_content(*self._snapshot(palette, self._follow_theme))
+            if content == self._props.get('innerHTML'):
+                return
+            self._props['innerHTML'] = content
+        super().update()
     
     @staticmethod
-    def _generate_content(bg_color: str, fg_color: str, colors: Dict[str, str]) -> str:
-        """Generate the SVG content (paths) for the theme icon."""
+    def _snapshot(palette: Palette, follow_theme: bool = False) -> tuple:
+        """Hashable (background, foreground, colors) of a palette; None values follow the theme."""
+        p = icon_palette(palette, follow_theme)
+        return p.surface_base, p.content_main, p.colors
+
+    @staticmethod
+    def _generate_content(bg_color: Optional[str], fg_color: Optional[str], colors: Dict[str, Optional[str]]) -> str:
+        """Generate the SVG content (paths) for the theme icon. None colors reference theme variables."""
+        bg_color = theme_color('surface-base', bg_color)
+        fg_color = theme_color('content-main', fg_color)
         
         # Center point
         cx, cy = 12, 12
@@ -91,7 +115,7 @@ class palette_icon(ui.element):
                 Z
             """.strip()
             
-            svg_content.append(f'<path d="{path_d}" fill="{color}" />')
+            svg_content.append(f'<path d="{path_d}" fill="{theme_color(f"color-{color_name}", color)}" />')
             i += 1
         
         # Draw center background half-disk (left side)
@@ -121,20 +145,27 @@ class palette_icon(ui.element):
         return '\n'.join(svg_content)
  
     @staticmethod
-    def to_html(palette: Palette, *, size: str = "24px", circular: bool = True) -> str:
-        """Returns the full HTML (SVG) string for this component."""
-        background_color = palette.surface_base
-        foreground_color = palette.content_main
-        colors = palette.colors
-        
-        content = palette_icon._generate_content(background_color, foreground_color, colors)
-        
+    @lru_cache(maxsize=512)
+    def _cached_content(bg_color: str, fg_color: str, colors: Tuple[Tuple[str, str], ...]) -> str:
+        return palette_icon._generate_content(bg_color, fg_color, dict(colors))
+
+    @staticmethod
+    def render(bg_color: str, fg_color: str, colors: Tuple[Tuple[str, str], ...], *,
+               size: str = "24px", circular: bool = True) -> str:
+        """Returns the SVG string from hashable inputs (`colors` as (name, hex) pairs). Content is cached."""
+        content = palette_icon._cached_content(bg_color, fg_color, colors)
+
         style = f'width: {size}; height: {size};'
         if circular:
             style += ' border-radius: 50%;'
-            
+
         return f'<svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg" class="-nd-c-theme-icon" style="{style}">{content}</svg>'
+
+    @staticmethod
+    def to_html(palette: Palette, *, size: str = "24px", circular: bool = True, follow_theme: bool = False) -> str:
+        """Returns the full HTML (SVG) string for this component."""
+        return palette_icon.render(*palette_icon._snapshot(palette, follow_theme), size=size, circular=circular)
  
-    def _generate_icon(self, bg_color: str, fg_color: str, colors: Dict[str, str]):
+    def _generate_icon(self, bg_color: Optional[str], fg_color: Optional[str], colors: Tuple[Tuple[str, Optional[str]], ...]):
         """Generate the SVG elements for the theme icon."""
-        self._props['innerHTML'] = self._generate_content(bg_color, fg_color, colors)
+        self._props['innerHTML'] = self._cached_content(bg_color, fg_color, colors)
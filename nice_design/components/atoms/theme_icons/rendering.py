@@ -0,0 +1,93 @@
+"""
+Shared, cached HTML/CSS builders of the theme icons.
+
+Palettes and textures are mutable dataclasses, so the builders are keyed on
+hashable snapshots of the fields an icon actually draws (`IconPalette`,
+`IconTexture`). Identical icons (same colors, texture and size) are only
+rendered once per process.
+
+A snapshot taken with ``follow_theme=True`` leaves the colors out (None): the
+same builders then emit ``var(--nd-...)`` references instead of baked values,
+so the icon restyles with the active theme and its HTML never changes.
+"""
+import re
+from collections import namedtuple
+from typing import Optional
+
+from ....core.definitions import Palette, Texture
+from ....core.color import hex_to_rgb
+
+IconPalette = namedtuple('IconPalette', 'surface_base content_main colors shadow')
+IconTexture = namedtuple('IconTexture', 'texture_cls opacity shadow_intensity highlight_intensity '
+                                        'roundness border_width shadows_enabled')
+
+_SIZE_PATTERN = re.compile(r'([0-9.]+)(.+)')
+
+
+def icon_palette(palette: Palette, follow_theme: bool = False) -> IconPalette:
+    if follow_theme:
+        return IconPalette(None, None, tuple((name, None) for name in palette.colors), None)
+    return IconPalette(palette.surface_base, palette.content_main, tuple(palette.colors.items()), palette.shadow)
+
+
+def icon_texture(texture: Texture) -> IconTexture:
+    return IconTexture(texture.texture_cls, texture.opacity, texture.shadow_intensity,
+                       texture.highlight_intensity, texture.roundness, texture.border_width,
+                       texture.shadows_enabled)
+
+
+def theme_color(var: str, value: Optional[str]) -> str:
+    """A baked color, or a reference to the theme variable `--nd-<var>` when `value` is None."""
+    return value if value is not None else f'var(--nd-{var}, currentColor)'
+
+
+def drop_shadow(shadow: Optional[str], texture: IconTexture, size: str) -> str:
+    """
+    The `filter: drop-shadow(...)` declaration for a texture's shadow (empty if none).
+    Without a `shadow` color the theme's `--nd-shadow-rgb` is used.
+    """
+    if not texture.shadows_enabled or texture.shadow_intensity <= 0:
+        return ''
+    rgb = ', '.join(map(str, hex_to_rgb(shadow))) if shadow is not None else 'var(--nd-shadow-rgb)'
+    si = texture.shadow_intensity
+
+    # Calculate size factor for the shadow (base 24px)
+    size_val = 24.0
+    size_match = _SIZE_PATTERN.match(size)
+    if size_match:
+        try: size_val = float(size_match.group(1))
+        except ValueError: pass
+    sf = size_val / 24.0
+
+    # Use tight values scaled by icon size
+    if si > 1.5:
+        shadow_def = f'0 {10*sf:.1f}px {12*sf:.1f}px rgba({rgb}, {0.4 * si:.2f})'
+    elif si > 1.0:
+        shadow_def = f'0 {6*sf:.1f}px {8*sf:.1f}px rgba({rgb}, {0.35 * si:.2f})'
+    elif si > 0.5:
+        shadow_def = f'0 {3*sf:.1f}px {4*sf:.1f}px rgba({rgb}, {0.3 * si:.2f})'
+    else:
+        shadow_def = f'0 {1*sf:.1f}px {2*sf:.1f}px rgba({rgb}, {0.3 * si:.2f})'
+    return f' filter: drop-shadow({shadow_def});'
+
+
+def border_radius(roundness: float) -> str:
+    if roundness == 0:
+        return '0'
+    if roundness >= 2.0:
+        return '50%'  # Circle
+    return f'{(roundness / 2.0) * 50}%'
+
+
+def border_width(texture: IconTexture) -> str:
+    return f"{max(1.0, float(texture.border_width) * 0.5)}px"  # Scaled for visual balance
+
+
+def gloss_html(texture: IconTexture) -> str:
+    """A subtle gloss overlay for the texture's highlight intensity."""
+    if texture.highlight_intensity <= 0:
+        return ''
+    return (f'<div style="position: absolute; top: 0; left: 0; width: 100%; height: 50%; '
+            f'background: linear-gradient(to bottom, rgba(255,255,255,{0.1 * texture.highlight_intensity}), transparent); '
+            f'pointer-events: none; z-index: 10;"></div>')
+
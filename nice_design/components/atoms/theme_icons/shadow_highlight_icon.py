@@ -50,7 +50,9 @@ class shadow_highlight_icon(ui.element):
                 background: var(--nd-surface-layer);
                 border-radius: 50%;
                 box-shadow: {shadow_style}, {highlight_style};
-                transition: all var(--nd-transition-speed) ease;
+                transition-property: var(--nd-transition-properties, all);
+                transition-duration: var(--nd-transition-speed);
+                transition-timing-function: ease;
             ''')
     
     @staticmethod
@@ -82,7 +84,9 @@ class shadow_highlight_icon(ui.element):
             border-radius: 50%;
             display: inline-block;
             box-shadow: {shadow_style}, {highlight_style};
-            transition: all var(--nd-transition-speed) ease;
+            transition-property: var(--nd-transition-properties, all);
+            transition-duration: var(--nd-transition-speed);
+            transition-timing-function: ease;
         '''.strip().replace('\n', ' ')
         
         return f'<div class="-nd-c-shadow-icon" style="{style}"></div>'
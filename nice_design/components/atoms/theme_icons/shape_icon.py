@@ -44,7 +44,9 @@ class shape_icon(ui.element):
                 border: {border_width} solid var(--nd-content-main);
                 border-radius: {border_radius};
                 background: transparent;
-                transition: all var(--nd-transition-speed) ease;
+                transition-property: var(--nd-transition-properties, all);
+                transition-duration: var(--nd-transition-speed);
+                transition-timing-function: ease;
             ''')
             
             # Add hover effect
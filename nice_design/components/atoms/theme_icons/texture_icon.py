@@ -1,179 +1,92 @@
 from nicegui import ui
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from ....core.definitions import Texture, Palette
-from ....core.utils import hex_to_rgb
+from ....core.manager import theme_manager
+from .rendering import IconTexture, icon_texture, drop_shadow, border_radius, border_width, gloss_html
 
 class texture_icon(ui.element):
     """
     A custom HTML/CSS icon that displays a visual representation of a texture.
     Features a circle styled like a card showing the texture's visual properties
     (opacity, shadows, glossy/flat effects).
+    Rendered as a single element: the circle and gloss are cached inner HTML.
+    With `follow_theme`, the shadow uses the theme's `--nd-shadow-rgb`.
     (Category: Texture)
     """
     def __init__(
-        self, 
+        self,
         texture: Texture,
         palette: Palette,
-        *, 
-        size: str = "24px"
+        *,
+        size: str = "24px",
+        follow_theme: bool = False
     ):
         super().__init__('div')
-        
+
         # Apply base styling
         self.classes('-nd-c-texture-icon')
-        
-        # Calculate shadow directly from texture intensity
-        wrapper_style = f'width: {size}; height: {size}; position: relative;'
-        if texture.shadows_enabled and texture.shadow_intensity > 0:
-            # Get shadow color from palette
-            r, g, b = hex_to_rgb(palette.shadow)
-            # Calculate actual shadow based on intensity
-            si = texture.shadow_intensity
-            
-            # Calculate size factor for the shadow (base 24px)
-            import re
-            size_match = re.match(r'([0-9.]+)(.+)', size)
-            size_val = 24.0
-            if size_match:
-                try: size_val = float(size_match.group(1))
-                except: pass
-            sf = size_val / 24.0
 
-            # Use tight values scaled by icon size
-            if si > 1.5:
-                shadow_def = f'0 {10*sf:.1f}px {12*sf:.1f}px rgba({r}, {g}, {b}, {0.4 * si:.2f})'
-            elif si > 1.0:
-                shadow_def = f'0 {6*sf:.1f}px {8*sf:.1f}px rgba({r}, {g}, {b}, {0.35 * si:.2f})'
-            elif si > 0.5:
-                shadow_def = f'0 {3*sf:.1f}px {4*sf:.1f}px rgba({r}, {g}, {b}, {0.3 * si:.2f})'
-            else:
-                shadow_def = f'0 {1*sf:.1f}px {2*sf:.1f}px rgba({r}, {g}, {b}, {0.3 * si:.2f})'
-            
-            wrapper_style += f' filter: drop-shadow({shadow_def});'
-        
-        self.style(wrapper_style)
-        
-        # Create the circle element
-        with self:
-            circle = ui.element('div').classes('-nd-c-texture-icon__circle')
-            
-            # Apply texture class
-            circle.classes(texture.texture_cls)
-            
-            # Apply opacity
-            if texture.opacity < 1.0:
-                # Create glassmorphism effect
-                circle.style(f'''
-                    background: rgba(128, 128, 128, {texture.opacity});
-                    backdrop-filter: blur(10px);
-                    -webkit-backdrop-filter: blur(10px);
-                ''')
-            else:
-                # Solid background
-                circle.style('background: var(--nd-surface-layer);')
-            
-            # Apply border and transitions
-            # Apply shape-based border and roundness
-            border_width_px = f"{max(1.0, float(texture.border_width) * 0.5)}px"
-            
-            if texture.roundness == 0:
-                border_radius = '0'
-            elif texture.roundness >= 2.0:
-                border_radius = '50%'
-            else:
-                radius_percent = (texture.roundness / 2.0) * 50
-                border_radius = f'{radius_percent}%'
+        self._size = size
+        self._follow_theme = follow_theme
+        self._key = (icon_texture(texture), None if follow_theme else palette.shadow)
+        self._apply()
+
+    def _apply(self):
+        # The circle carries the texture class: make sure its CSS is on the page
+        theme_manager.ensure_textures([self._key[0].texture_cls])
+        wrapper_style, inner_html = texture_icon._render(*self._key, self._size)
+        self.style(replace=wrapper_style)
+        self._props['innerHTML'] = inner_html
 
-            circle.style(f'''
-                position: relative;
-                border: {border_width_px} solid rgba(255, 255, 255, 0.1);
-                border-radius: {border_radius};
-                width: 100%;
-                height: 100%;
-                overflow: hidden;
-                transition: all var(--nd-transition-speed) ease;
-            ''')
-            
-            with circle:
-                 # Apply highlight density if applicable
-                if texture.highlight_intensity > 0:
-                    # Add a subtle gloss effect
-                    ui.element('div').style(f'''
-                        position: absolute;
-                        top: 0; left: 0; width: 100%; height: 50%;
-                        background: linear-gradient(to bottom, rgba(255,255,255,{0.1 * texture.highlight_intensity}), transparent);
-                        pointer-events: none;
-                        z-index: 10;
-                    ''')
-            
-            # Add hover effect
-            circle.classes('-nd-c-texture-icon__circle--interactive')
+    def update(self, *, texture: Optional[Texture] = None, palette: Optional[Palette] = None) -> None:
+        """
+        Re-renders in place for a new texture and/or palette.
+        Nothing is sent when the drawn values did not change.
+        """
+        if texture is None and palette is None:
+            super().update()
+            return
+        shadow = self._key[1]
+        if palette is not None and not self._follow_theme:
+            shadow = palette.shadow
+        key = (icon_texture(texture) if texture is not None else self._key[0], shadow)
+        if key != self._key:
+            self._key = key
+            self._apply()
+            super().update()
 
     @staticmethod
-    def to_html(texture: Texture, palette: Palette, *, size: str = "24px") -> str:
-        """Returns the full HTML string for this component."""
-        
+    @lru_cache(maxsize=512)
+    def _render(texture: IconTexture, shadow: Optional[str], size: str) -> Tuple[str, str]:
+        """Returns the wrapper style and inner HTML. Cached by texture snapshot, shadow color and size."""
         # Wrapper styles with shadow
         wrapper_style = f'width: {size}; height: {size}; position: relative; display: inline-block;'
-        
-        # Calculate shadow directly from texture intensity  
-        if texture.shadows_enabled and texture.shadow_intensity > 0:
-            r, g, b = hex_to_rgb(palette.shadow)
-            si = texture.shadow_intensity
+        wrapper_style += drop_shadow(shadow, texture, size)
 
-            # Calculate size factor for the shadow (base 24px)
-            import re
-            size_match = re.match(r'([0-9.]+)(.+)', size)
-            size_val = 24.0
-            if size_match:
-                try: size_val = float(size_match.group(1))
-                except: pass
-            sf = size_val / 24.0
-
-            # Use tight values scaled by icon size
-            if si > 1.5:
-                shadow_def = f'0 {10*sf:.1f}px {12*sf:.1f}px rgba({r}, {g}, {b}, {0.4 * si:.2f})'
-            elif si > 1.0:
-                shadow_def = f'0 {6*sf:.1f}px {8*sf:.1f}px rgba({r}, {g}, {b}, {0.35 * si:.2f})'
-            elif si > 0.5:
-                shadow_def = f'0 {3*sf:.1f}px {4*sf:.1f}px rgba({r}, {g}, {b}, {0.3 * si:.2f})'
-            else:
-                shadow_def = f'0 {1*sf:.1f}px {2*sf:.1f}px rgba({r}, {g}, {b}, {0.3 * si:.2f})'
-            wrapper_style += f' filter: drop-shadow({shadow_def});'
-        
         # Circle styles
         circle_style = ''
-        
+
         # Opacity/Backdrop
         if texture.opacity < 1.0:
+            # Glassmorphism effect
             circle_style += f'background: rgba(128, 128, 128, {texture.opacity}); backdrop-filter: blur(10px); -webkit-backdrop-filter: blur(10px);'
         else:
-             circle_style += 'background: var(--nd-surface-layer);'
-             
-             
-        # Shape styling
-        border_width_px = f"{max(1.0, float(texture.border_width) * 0.5)}px"
-        
-        if texture.roundness == 0:
-            border_radius = '0'
-        elif texture.roundness >= 2.0:
-            border_radius = '50%'
-        else:
-            radius_percent = (texture.roundness / 2.0) * 50
-            border_radius = f'{radius_percent}%'
+            # Solid background
+            circle_style += 'background: var(--nd-surface-layer);'
+
+        # Border and general (shape-based border and roundness)
+        circle_style += (f' position: relative; border: {border_width(texture)} solid rgba(255, 255, 255, 0.1);'
+                         f' border-radius: {border_radius(texture.roundness)}; width: 100%; height: 100%;'
+                         f' overflow: hidden; transition-property: var(--nd-transition-properties, all); transition-duration: var(--nd-transition-speed); transition-timing-function: ease;')
 
-        # Border and general
-        circle_style += f' position: relative; border: {border_width_px} solid rgba(255, 255, 255, 0.1); border-radius: {border_radius}; width: 100%; height: 100%; overflow: hidden; transition: all var(--nd-transition-speed) ease;'
-        
-        # Clean up
-        circle_style = circle_style.replace('\n', ' ').strip()
-        
-        # Gloss effect HTML if highlight_intensity is high
-        gloss_html = ""
-        if texture.highlight_intensity > 0:
-             gloss_html = f'<div style="position: absolute; top: 0; left: 0; width: 100%; height: 50%; background: linear-gradient(to bottom, rgba(255,255,255,{0.1 * texture.highlight_intensity}), transparent); pointer-events: none; z-index: 10;"></div>'
+        # The circle div (with hover effect and gloss overlay)
+        circle_html = (f'<div class="-nd-c-texture-icon__circle {texture.texture_cls} -nd-c-texture-icon__circle--interactive" '
+                       f'style="{circle_style}">{gloss_html(texture)}</div>')
+        return wrapper_style, circle_html
 
-        # The circle div
-        circle_html = f'<div class="-nd-c-texture-icon__circle {texture.texture_cls}" style="{circle_style}">{gloss_html}</div>'
-        
-        return f'<div class="-nd-c-texture-icon" style="{wrapper_style}">{circle_html}</div>'
+    @staticmethod
+    def to_html(texture: Texture, palette: Palette, *, size: str = "24px", follow_theme: bool = False) -> str:
+        """Returns the full HTML string for this component."""
+        wrapper_style, inner_html = texture_icon._render(icon_texture(texture), None if follow_theme else palette.shadow, size)
+        return f'<div class="-nd-c-texture-icon" style="{wrapper_style}">{inner_html}</div>'
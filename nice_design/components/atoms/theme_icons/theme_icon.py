@@ -1,192 +1,99 @@
 from nicegui import ui
+from functools import lru_cache
+from typing import Optional, Tuple
 from ....core.definitions import Palette, Texture, Typography, Layout
-from ....core.utils import hex_to_rgb
 from .palette_icon import palette_icon
+from .rendering import (
+    IconPalette, IconTexture, icon_palette, icon_texture,
+    drop_shadow, border_radius, border_width, gloss_html,
+)
 
 class theme_icon(ui.element):
     """
     A comprehensive icon that displays a visual representation of a complete theme.
     Combines palette, texture, typography, and layout by composing visuals.
     (Note: Typography and Layout are represented subtly or through spacing).
+    Rendered as a single element: the texture container, palette disk and gloss
+    are cached inner HTML. With `follow_theme`, colors and shadow reference the
+    theme's CSS variables (for icons showing the active theme).
     """
     def __init__(
-        self, 
+        self,
         palette: Palette,
         texture: Texture,
-        *, 
-        size: str = "24px"
+        *,
+        size: str = "24px",
+        follow_theme: bool = False
     ):
         super().__init__('div')
-        
+
         # Apply base styling
         self.classes('-nd-c-theme-icon')
-        
-        # Calculate shadow directly from texture intensity and apply to wrapper (like texture_icon)
-        wrapper_style = f'width: {size}; height: {size}; position: relative; display: inline-flex; align-items: center; justify-content: center;'
-        if texture.shadows_enabled and texture.shadow_intensity > 0:
-            # Get shadow color from palette
-            r, g, b = hex_to_rgb(palette.shadow)
-            # Calculate actual shadow based on intensity
-            si = texture.shadow_intensity
-            
-            # Calculate size factor for the shadow (base 24px)
-            import re
-            size_match = re.match(r'([0-9.]+)(.+)', size)
-            size_val = 24.0
-            if size_match:
-                try: size_val = float(size_match.group(1))
-                except: pass
-            sf = size_val / 24.0
 
-            # Use tight values scaled by icon size
-            if si > 1.5:
-                shadow_def = f'0 {10*sf:.1f}px {12*sf:.1f}px rgba({r}, {g}, {b}, {0.4 * si:.2f})'
-            elif si > 1.0:
-                shadow_def = f'0 {6*sf:.1f}px {8*sf:.1f}px rgba({r}, {g}, {b}, {0.35 * si:.2f})'
-            elif si > 0.5:
-                shadow_def = f'0 {3*sf:.1f}px {4*sf:.1f}px rgba({r}, {g}, {b}, {0.3 * si:.2f})'
-            else:
-                shadow_def = f'0 {1*sf:.1f}px {2*sf:.1f}px rgba({r}, {g}, {b}, {0.3 * si:.2f})'
-            
-            wrapper_style += f' filter: drop-shadow({shadow_def});'
-        
-        self.style(wrapper_style)
-        
-        # Create a container with texture effects applied
-        with self:
-            # Apply texture-based effects to the container
-            # Make the visible disk slightly smaller (85%) to match standard icon scale
-            texture_container = ui.element('div').classes('nd-theme-icon__container')
-            # Ensure container is centered and 85% of parent
-            texture_container.style('width: 85%; height: 85%; display: flex; align-items: center; justify-content: center;')
-            
-            # Apply texture opacity 
-            if texture.opacity < 1.0:
-                texture_container.style(f'opacity: {texture.opacity};')
-            
-            # Apply shape-based border and roundness (from Texture category)
-            border_width_px = f"{max(1.0, float(texture.border_width) * 0.5)}px"  # Scaled for visual balance
-            
-            # Calculate border radius based on texture.roundness
-            if texture.roundness == 0:
-                border_radius = '0'
-            elif texture.roundness >= 2.0:
-                border_radius = '50%'  # Circle
-            else:
-                radius_percent = (texture.roundness / 2.0) * 50
-                border_radius = f'{radius_percent}%'
-            
-            # The palette icon as the core visual
-            with texture_container:
-                container = ui.element('div').style(f'''
-                    position: relative;
-                    width: 100%;
-                    height: 100%;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    border-radius: {border_radius};
-                    border: {border_width_px} solid rgba(255, 255, 255, 0.15);
-                    overflow: hidden;
-                    transition: all var(--nd-transition-speed) ease;
-                ''')
-                container.classes('-nd-c-theme-icon__palette-container')
-                
-                with container:
-                    # Reuse the palette_icon for color visualization
-                    # Set to 100% so it fills the texture_container and reaches the corners
-                    palette_icon(palette, size="100%", circular=False)
+        self._size = size
+        self._follow_theme = follow_theme
+        self._key = (icon_palette(palette, follow_theme), icon_texture(texture))
+        self._apply()
+
+    def _apply(self):
+        wrapper_style, inner_html = theme_icon._render(*self._key, self._size)
+        self.style(replace=wrapper_style)
+        self._props['innerHTML'] = inner_html
 
-                    # Apply highlight density if applicable - moved here to be inside clipped container
-                    if texture.highlight_intensity > 0:
-                        # Add a subtle gloss effect
-                        ui.element('div').style(f'''
-                            position: absolute;
-                            top: 0; left: 0; width: 100%; height: 50%;
-                            background: linear-gradient(to bottom, rgba(255,255,255,{0.1 * texture.highlight_intensity}), transparent);
-                            pointer-events: none;
-                            z-index: 10;
-                        ''')
+    def update(self, *, palette: Optional[Palette] = None, texture: Optional[Texture] = None) -> None:
+        """
+        Re-renders in place for a new palette and/or texture.
+        Nothing is sent when the drawn values did not change.
+        """
+        if palette is None and texture is None:
+            super().update()
+            return
+        key = (icon_palette(palette, self._follow_theme) if palette is not None else self._key[0],
+               icon_texture(texture) if texture is not None else self._key[1])
+        if key != self._key:
+            self._key = key
+            self._apply()
+            super().update()
 
     @staticmethod
-    def to_html(
-        palette: Palette,
-        texture: Texture,
-        *, 
-        size: str = "24px"
-    ) -> str:
-        """Returns the full HTML string for this component."""
-        
+    @lru_cache(maxsize=512)
+    def _render(palette: IconPalette, texture: IconTexture, size: str) -> Tuple[str, str]:
+        """Returns the wrapper style and inner HTML. Cached by palette/texture snapshot and size."""
         # Wrapper styles with shadow (match texture_icon behavior)
         wrapper_style = f'width: {size}; height: {size}; position: relative; display: inline-flex; align-items: center; justify-content: center;'
-        
-        # Calculate shadow directly from texture intensity and apply to wrapper
-        if texture.shadows_enabled and texture.shadow_intensity > 0:
-            r, g, b = hex_to_rgb(palette.shadow)
-            si = texture.shadow_intensity
-
-            # Calculate size factor for the shadow (base 24px)
-            import re
-            size_match = re.match(r'([0-9.]+)(.+)', size)
-            size_val = 24.0
-            if size_match:
-                try: size_val = float(size_match.group(1))
-                except: pass
-            sf = size_val / 24.0
+        wrapper_style += drop_shadow(palette.shadow, texture, size)
 
-            # Use tight values scaled by icon size
-            if si > 1.5:
-                shadow_def = f'0 {10*sf:.1f}px {12*sf:.1f}px rgba({r}, {g}, {b}, {0.4 * si:.2f})'
-            elif si > 1.0:
-                shadow_def = f'0 {6*sf:.1f}px {8*sf:.1f}px rgba({r}, {g}, {b}, {0.35 * si:.2f})'
-            elif si > 0.5:
-                shadow_def = f'0 {3*sf:.1f}px {4*sf:.1f}px rgba({r}, {g}, {b}, {0.3 * si:.2f})'
-            else:
-                shadow_def = f'0 {1*sf:.1f}px {2*sf:.1f}px rgba({r}, {g}, {b}, {0.3 * si:.2f})'
-            wrapper_style += f' filter: drop-shadow({shadow_def});'
-        
-        # Texture styling - scaled down to 85% and centered
+        # Texture styling - scaled down to 85% (standard icon scale) and centered
         texture_style = 'width: 85%; height: 85%; display: flex; align-items: center; justify-content: center;'
         if texture.opacity < 1.0:
             texture_style += f' opacity: {texture.opacity};'
-            
+
         # Shape styling (from Texture)
-        border_width_px = f"{max(1.0, float(texture.border_width) * 0.5)}px"
-        
-        if texture.roundness == 0:
-            border_radius = '0'
-        elif texture.roundness >= 2.0:
-            border_radius = '50%'
-        else:
-            radius_percent = (texture.roundness / 2.0) * 50
-            border_radius = f'{radius_percent}%'
-            
-        container_style = f'''
-            position: relative;
-            width: 100%;
-            height: 100%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border-radius: {border_radius};
-            border: {border_width_px} solid rgba(255, 255, 255, 0.15);
-            overflow: hidden;
-            transition: all var(--nd-transition-speed) ease;
-        '''.strip().replace('\n', ' ')
+        container_style = (
+            'position: relative; width: 100%; height: 100%; display: flex; align-items: center; '
+            f'justify-content: center; border-radius: {border_radius(texture.roundness)}; '
+            f'border: {border_width(texture)} solid rgba(255, 255, 255, 0.15); overflow: hidden; '
+            'transition-property: var(--nd-transition-properties, all); transition-duration: var(--nd-transition-speed); transition-timing-function: ease;'
+        )
 
         # Inner palette icon HTML (set to 100% to fill corners)
-        inner_html = palette_icon.to_html(palette, size="100%", circular=False)
-        
-        # Gloss effect HTML if highlight_intensity is high
-        gloss_html = ""
-        if texture.highlight_intensity > 0:
-             gloss_html = f'<div style="position: absolute; top: 0; left: 0; width: 100%; height: 50%; background: linear-gradient(to bottom, rgba(255,255,255,{0.1 * texture.highlight_intensity}), transparent); pointer-events: none; z-index: 10;"></div>'
+        inner_html = palette_icon.render(palette.surface_base, palette.content_main, palette.colors,
+                                         size="100%", circular=False)
+
+        # Inner Container (Palette Container), gloss inside so it is clipped
+        html_palette_container = f'<div class="-nd-c-theme-icon__palette-container" style="{container_style}">{inner_html}{gloss_html(texture)}</div>'
 
-        # Inner Container (Palette Container)
-        html_palette_container = f'<div class="-nd-c-theme-icon__palette-container" style="{container_style}">{inner_html}{gloss_html}</div>'
-        
         # Texture Container
-        html_texture_container = f'<div class="nd-theme-icon__container" style="{texture_style}">{html_palette_container}</div>'
-        
-        # Outer Wrapper (wrapper_style already includes shadow)
-        return f'<div class="-nd-c-theme-icon" style="{wrapper_style}">{html_texture_container}</div>'
+        return wrapper_style, f'<div class="nd-theme-icon__container" style="{texture_style}">{html_palette_container}</div>'
+
+    @staticmethod
+    def to_html(
+        palette: Palette,
+        texture: Texture,
+        *,
+        size: str = "24px",
+        follow_theme: bool = False
+    ) -> str:
+        """Returns the full HTML string for this component."""
+        wrapper_style, inner_html = theme_icon._render(icon_palette(palette, follow_theme), icon_texture(texture), size)
+        return f'<div class="-nd-c-theme-icon" style="{wrapper_style}">{inner_html}</div>'
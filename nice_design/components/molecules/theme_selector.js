@@ -0,0 +1,456 @@
+// The whole theme selector (trigger, preview and the four pillar menus) as one component.
+// Option catalogs arrive once as the `catalog` prop; the configuration lives in `s`,
+// seeded from the `state` prop and patched by the server through `patch()`.
+// User edits are sent as a single "change" event carrying only the changed keys;
+// slider drags are merged and sent at most every `throttle_ms` (and on release).
+import paletteSlider from "palette_slider";
+import splitSlider from "split_slider";
+
+const MODES = [
+  { icon: "mdi-white-balance-sunny", value: "light", color: "var(--nd-color-orange)" },
+  { icon: "mdi-brightness-auto", value: "auto", color: "var(--nd-content-subtle)" },
+  { icon: "mdi-moon-waning-crescent", value: "dark", color: "var(--nd-color-blue)" },
+];
+
+// [text-transform, slider label]
+const TITLE_CASES = [
+  ["lowercase", "lower"],
+  ["none", "none"],
+  ["capitalize", "title"],
+  ["uppercase", "ALL"],
+];
+
+// Font catalog entries are [name, css font-family, local?]
+const fontOptions = (fonts) =>
+  fonts.map(([value, font, local]) => ({
+    value: value,
+    label: value,
+    font: font,
+    icon: local ? "mdi-folder-outline" : "mdi-google",
+    color: local ? "primary" : "accent",
+  }));
+
+// q-select with the rich option rendering of the `select` atom (html/icon + label in its font)
+const richSelect = {
+  inheritAttrs: false,
+  template: `
+    <q-select
+      v-bind="$attrs"
+      color="primary"
+      emit-value
+      map-options
+      popup-content-class="nd-select-menu"
+    >
+      <template v-slot:option="props">
+        <q-item v-bind="props.itemProps">
+          <q-item-section avatar v-if="props.opt.icon || props.opt.html">
+            <div v-if="props.opt.html" v-html="props.opt.html"></div>
+            <q-icon v-else :name="props.opt.icon" :color="props.opt.color" size="sm" />
+          </q-item-section>
+          <q-item-section>
+            <q-item-label :style="props.opt.font ? { 'font-family': props.opt.font } : {}">
+              {{ props.opt.label }}
+            </q-item-label>
+          </q-item-section>
+        </q-item>
+      </template>
+      <template v-slot:selected-item="props">
+        <div class="row items-center no-wrap nd-gap-2" v-if="props.opt">
+          <div v-if="props.opt.html" v-html="props.opt.html"></div>
+          <q-icon v-else-if="props.opt.icon" :name="props.opt.icon" :color="props.opt.color" size="sm" />
+          <q-item-label :style="props.opt.font ? { 'font-family': props.opt.font } : {}">
+            {{ props.opt.label }}
+          </q-item-label>
+        </div>
+      </template>
+    </q-select>
+  `,
+};
+
+export default {
+  components: { paletteSlider, splitSlider, richSelect },
+  template: `
+    <div>
+      <q-btn
+        color="transparent"
+        align="between"
+        icon-right="arrow_drop_down"
+        class="nd-select-button nd-mode-icon-only"
+        :class="{ 'nd-state-rotated': open.main }"
+        style="overflow: visible"
+      >
+        <div class="row no-wrap items-center nd-gap-2" style="overflow: visible">
+          <div class="on-left flex flex-center order-first" style="overflow: visible">
+            <div class="flex items-center justify-center" v-html="s.icon_trigger"></div>
+          </div>
+        </div>
+        <q-menu v-model="open.main" class="nd-menu min-w-[280px] nd-p-0" transition-show="jump-down" transition-hide="jump-up">
+          <!-- 1. Preview -->
+          <div class="w-full">
+            <div class="nicegui-row w-full items-center nd-px-md nd-py-lg bg-black/5 mb-2 nd-gap-md">
+              <div v-html="s.icon_preview"></div>
+              <div class="nicegui-column nd-gap-0">
+                <h3 class="text-lg font-bold">{{ s.title }}</h3>
+                <div class="text-[10px] opacity-40 uppercase tracking-widest font-bold">Preview your theme here.</div>
+              </div>
+            </div>
+          </div>
+
+          <!-- 2. Controls -->
+          <div class="nicegui-column w-full nd-p-md nd-gap-md">
+            <rich-select
+              v-if="catalog.bundles.length"
+              class="w-full mb-2"
+              label="Theme Bundle Preset"
+              :options="catalog.bundles"
+              :model-value="s.bundle"
+              @update:model-value="pickBundle"
+            />
+
+            <div class="nicegui-row w-full nd-gap-sm justify-between">
+              <!-- Palette -->
+              <q-btn
+                color="transparent"
+                align="between"
+                icon-right="arrow_drop_down"
+                class="nd-select-button nd-mode-icon-only flex-1"
+                :class="{ 'nd-state-rotated': open.palette }"
+                style="overflow: visible"
+              >
+                <div class="row no-wrap items-center nd-gap-2" style="overflow: visible">
+                  <div class="on-left flex flex-center order-first" style="overflow: visible" v-html="s.icon_palette"></div>
+                </div>
+                <q-menu v-model="open.palette" class="nd-menu min-w-[240px] nd-p-md nd-gap-md" transition-show="jump-down" transition-hide="jump-up">
+                  <div class="nicegui-row w-full justify-center mb-4">
+                    <div
+                      class="flex items-stretch nd-rounded-md overflow-hidden nd-border-sm nd-gap-0 w-fit h-9"
+                      style="border-color: color-mix(in srgb, var(--nd-content-main), transparent 80%) !important"
+                    >
+                      <q-btn
+                        v-for="m in modes"
+                        :key="m.value"
+                        :icon="m.icon"
+                        color="primary"
+                        :flat="m.value !== s.mode"
+                        :unelevated="m.value === s.mode"
+                        class="rounded-none border-none nd-px-md h-full nd-border-none nd-shadow-none shadow-none"
+                        :class="m.value === s.mode ? '-nd-c-btn--primary' : '-nd-c-btn--ghost'"
+                        :style="modeStyle(m)"
+                        @click="pickMode(m.value)"
+                      />
+                    </div>
+                  </div>
+
+                  <div class="text-xs opacity-60 font-bold mb-1">Primary Accent</div>
+                  <palette-slider :colors="s.colors" :value="s.primary" height="12px" @change="(c) => set({ primary: c })" />
+
+                  <div class="text-xs opacity-60 font-bold mb-1">Secondary Accent</div>
+                  <palette-slider :colors="s.colors" :value="s.secondary" height="12px" @change="(c) => set({ secondary: c })" />
+
+                  <q-separator class="opacity-10 my-1" />
+
+                  <rich-select
+                    class="w-full"
+                    label="Palette Preset"
+                    :options="catalog.palettes"
+                    :model-value="s.palette"
+                    @update:model-value="(v) => set({ palette: v })"
+                  />
+                </q-menu>
+              </q-btn>
+
+              <!-- Texture -->
+              <q-btn
+                color="transparent"
+                align="between"
+                icon-right="arrow_drop_down"
+                class="nd-select-button nd-mode-icon-only flex-1"
+                :class="{ 'nd-state-rotated': open.texture }"
+                style="overflow: visible"
+              >
+                <div class="row no-wrap items-center nd-gap-2" style="overflow: visible">
+                  <div class="on-left flex flex-center order-first" style="overflow: visible" v-html="s.icon_texture"></div>
+                </div>
+                <q-menu v-model="open.texture" class="nd-menu min-w-[240px] nd-p-md nd-gap-md" transition-show="jump-down" transition-hide="jump-up">
+                  <rich-select
+                    class="w-full"
+                    label="Texture Base"
+                    :options="catalog.textures"
+                    :model-value="s.texture"
+                    @update:model-value="(v) => set({ texture: v })"
+                  />
+
+                  <div class="nicegui-column w-full nd-gap-xs mt-2">
+                    <split-slider
+                      :limit="2"
+                      :step="0.1"
+                      :value_left="s.shadow"
+                      :value_right="s.highlight"
+                      color_left="var(--nd-primary)"
+                      color_right="var(--nd-secondary)"
+                      label_left="Shadow"
+                      label_right="Highlight"
+                      :decimals="1"
+                      :throttle_ms="throttle_ms"
+                      @change="(v) => set({ shadow: v.left, highlight: v.right })"
+                    />
+                  </div>
+
+                  <q-separator class="opacity-10 my-1" />
+
+                  <div class="nicegui-column w-full nd-gap-xs">
+                    <div class="nicegui-row w-full justify-between">
+                      <div class="text-xs opacity-60">Border</div>
+                      <div class="text-xs font-bold">{{ s.border }}px</div>
+                    </div>
+                    <q-slider
+                      class="w-full"
+                      color="primary"
+                      label
+                      markers
+                      snap
+                      :min="0"
+                      :max="4"
+                      :step="1"
+                      :label-value="s.border + 'px'"
+                      :model-value="s.border"
+                      @update:model-value="(v) => drag({ border: v })"
+                      @change="flush"
+                    />
+                  </div>
+
+                  <div class="nicegui-column w-full nd-gap-xs">
+                    <div class="nicegui-row w-full justify-between">
+                      <div class="text-xs opacity-60">Roundness</div>
+                      <div class="text-xs font-bold">{{ s.roundness.toFixed(1) }}</div>
+                    </div>
+                    <q-slider
+                      class="w-full"
+                      color="primary"
+                      label
+                      :min="0"
+                      :max="2.5"
+                      :step="0.1"
+                      :label-value="s.roundness.toFixed(1)"
+                      :model-value="s.roundness"
+                      @update:model-value="(v) => drag({ roundness: v })"
+                      @change="flush"
+                    />
+                  </div>
+                </q-menu>
+              </q-btn>
+
+              <!-- Typography -->
+              <q-btn
+                color="transparent"
+                align="between"
+                icon="mdi-format-font"
+                icon-right="arrow_drop_down"
+                class="nd-select-button nd-mode-icon-only flex-1"
+                :class="{ 'nd-state-rotated': open.typography }"
+              >
+                <q-menu v-model="open.typography" class="nd-menu min-w-[240px] nd-p-md nd-gap-md" transition-show="jump-down" transition-hide="jump-up">
+                  <rich-select
+                    class="w-full"
+                    label="Primary Font"
+                    :options="fontOptions"
+                    :model-value="s.font_main"
+                    use-input
+                    fill-input
+                    hide-selected
+                    input-debounce="0"
+                    @filter="filterFonts"
+                    @update:model-value="(v) => set({ font_main: v })"
+                  />
+                  <rich-select
+                    class="w-full"
+                    label="Secondary Font"
+                    :options="fontOptions"
+                    :model-value="s.font_secondary"
+                    use-input
+                    fill-input
+                    hide-selected
+                    input-debounce="0"
+                    @filter="filterFonts"
+                    @update:model-value="(v) => set({ font_secondary: v })"
+                  />
+
+                  <q-separator class="opacity-10 my-1" />
+
+                  <div class="nicegui-column w-full nd-gap-xs">
+                    <div class="nicegui-row w-full justify-between">
+                      <div class="text-xs opacity-60">Text Scale</div>
+                      <div class="text-xs font-bold">{{ s.scale.toFixed(2) }}</div>
+                    </div>
+                    <q-slider
+                      class="w-full"
+                      color="primary"
+                      label
+                      :min="1"
+                      :max="1.6"
+                      :step="0.05"
+                      :label-value="s.scale.toFixed(2)"
+                      :model-value="s.scale"
+                      @update:model-value="(v) => drag({ scale: v })"
+                      @change="flush"
+                    />
+                  </div>
+
+                  <div class="nicegui-column w-full nd-gap-xs mt-2">
+                    <div class="nicegui-row w-full justify-between">
+                      <div class="text-xs opacity-60">Title Case</div>
+                      <div class="text-xs font-bold">{{ titleCases[titleCase][1] }}</div>
+                    </div>
+                    <q-slider
+                      class="w-full"
+                      color="primary"
+                      label
+                      markers
+                      snap
+                      :min="0"
+                      :max="3"
+                      :step="1"
+                      :label-value="titleCases[titleCase][1]"
+                      :model-value="titleCase"
+                      @update:model-value="(v) => drag({ title_transform: titleCases[v][0] })"
+                      @change="flush"
+                    />
+                  </div>
+                </q-menu>
+              </q-btn>
+
+              <!-- Layout -->
+              <q-btn
+                color="transparent"
+                align="between"
+                icon="mdi-view-quilt"
+                icon-right="arrow_drop_down"
+                class="nd-select-button nd-mode-icon-only flex-1"
+                :class="{ 'nd-state-rotated': open.layout }"
+              >
+                <q-menu v-model="open.layout" class="nd-menu min-w-[240px] nd-p-md nd-gap-md" transition-show="jump-down" transition-hide="jump-up">
+                  <rich-select
+                    class="w-full"
+                    label="Layout Preset"
+                    :options="catalog.layouts"
+                    :model-value="s.layout"
+                    @update:model-value="(v) => set({ layout: v })"
+                  />
+
+                  <q-separator class="opacity-10 my-1" />
+
+                  <div class="nicegui-column w-full nd-gap-xs mt-2">
+                    <div class="nicegui-row w-full justify-between">
+                      <div class="text-xs opacity-60">Spacing Density</div>
+                      <div class="text-xs font-bold">{{ s.spacing.toFixed(1) }}x</div>
+                    </div>
+                    <q-slider
+                      class="w-full"
+                      color="primary"
+                      label
+                      :min="0.5"
+                      :max="2"
+                      :step="0.1"
+                      :label-value="s.spacing.toFixed(1) + 'x'"
+                      :model-value="s.spacing"
+                      @update:model-value="(v) => drag({ spacing: v })"
+                      @change="flush"
+                    />
+                  </div>
+                </q-menu>
+              </q-btn>
+            </div>
+          </div>
+        </q-menu>
+      </q-btn>
+    </div>
+  `,
+  props: {
+    catalog: Object,
+    state: Object,
+    client_bundles: Boolean,
+    throttle_ms: Number,
+  },
+  data() {
+    return {
+      s: { ...this.state },
+      open: { main: false, palette: false, texture: false, typography: false, layout: false },
+      allFonts: fontOptions(this.catalog.fonts),
+      fontOptions: [],
+      modes: MODES,
+      titleCases: TITLE_CASES,
+      pending: {},
+      lastEmit: 0,
+      timer: null,
+    };
+  },
+  computed: {
+    titleCase() {
+      const index = TITLE_CASES.findIndex((c) => c[0] === this.s.title_transform);
+      return index < 0 ? 1 : index;
+    },
+  },
+  watch: {
+    state(value) {
+      this.s = { ...value };
+    },
+    catalog(value) {
+      this.allFonts = fontOptions(value.fonts);
+    },
+  },
+  beforeUnmount() {
+    clearTimeout(this.timer);
+  },
+  methods: {
+    // Called by the server with the keys it changed (e.g. all pillar values after a bundle switch)
+    patch(delta) {
+      Object.assign(this.s, delta);
+    },
+    set(delta) {
+      Object.assign(this.s, delta);
+      Object.assign(this.pending, delta);
+      this.flush();
+    },
+    drag(delta) {
+      Object.assign(this.s, delta);
+      Object.assign(this.pending, delta);
+      const wait = (this.throttle_ms || 0) - (Date.now() - this.lastEmit);
+      if (wait <= 0) this.flush();
+      else if (!this.timer) this.timer = setTimeout(this.flush, wait);
+    },
+    flush() {
+      clearTimeout(this.timer);
+      this.timer = null;
+      if (!Object.keys(this.pending).length) return;
+      this.lastEmit = Date.now();
+      this.$emit("change", this.pending);
+      this.pending = {};
+    },
+    pickBundle(value) {
+      // Precompiled bundles switch in the browser first; the server only syncs its state
+      if (this.client_bundles && value && window.ndSwitchBundle) window.ndSwitchBundle(value);
+      this.set({ bundle: value });
+    },
+    pickMode(mode) {
+      // Both variants are compiled into the stylesheet: the flip happens client-side (see mode_js)
+      document.documentElement.setAttribute("data-nd-mode", mode);
+      if (mode !== this.s.mode) this.set({ mode: mode });
+    },
+    modeStyle(mode) {
+      if (mode.value === this.s.mode) {
+        return {
+          color: "var(--nd-surface-base) !important",
+          backgroundColor: mode.color + " !important",
+          opacity: "1 !important",
+        };
+      }
+      return { color: mode.color + " !important", backgroundColor: "transparent !important" };
+    },
+    filterFonts(value, update) {
+      update(() => {
+        const query = value.toLowerCase();
+        this.fontOptions = query ? this.allFonts.filter((f) => f.value.toLowerCase().includes(query)) : this.allFonts;
+      });
+    },
+  },
+};
@@ -2,13 +2,10 @@ from typing import Optional, Callable, Dict, Any
 from nicegui import ui
 import copy
 
-from nice_design.components.atoms.select_button import select_button
-from nice_design.components.atoms.menu import menu
-from nice_design.components.atoms.select import select
 from nice_design.components.atoms.theme_icons.theme_icon import theme_icon
 from nice_design.components.atoms.theme_icons.palette_icon import palette_icon
 from nice_design.components.atoms.theme_icons.texture_icon import texture_icon
-from nice_design.core.fonts import FontManager
+from nice_design.core.fonts import FontManager, font_family_name
 from nice_design.core.definitions import Palette, Texture, Layout, Typography, Theme
 
 from nice_design.core.presets import (
@@ -17,23 +14,46 @@ from nice_design.core.presets import (
     STANDARD_LAYOUT,
     STANDARD_TYPO,
 )
-from nice_design.components.atoms.slider import slider, split_slider, palette_slider
-from nice_design.components.atoms.multi_button import multi_button
 from nice_design.core.manager import theme_manager
+from nice_design.core.styles import space_unit, radius_base, type_ratio
+from nice_design.instrumentation import span, current_span
 
 # Use the global registry
 import nice_design as nice
 
-class theme_selector(ui.element):
+class theme_selector(ui.element, component='theme_selector.js',
+                     dependencies=['../atoms/palette_slider.js', '../atoms/split_slider.js']):
     """
-    A molecule that combines a generic select_button and a menu to control the application theme.
+    A molecule that combines a select button and a menu to control the application theme.
     Displays a real-time 'theme_icon' preview of the configured theme.
     Supports 'Theme Bundles' (combinations of 4 pillars) and individual pillar adjustments.
+
+    The whole UI is a single Vue component: option catalogs are pushed once as JSON,
+    edits arrive as one 'change' event with the changed keys, and the server only
+    sends back the values it changed itself (e.g. all pillars after a bundle switch).
     """
-    def __init__(self, on_change: Optional[Callable[[Dict[str, Any]], None]] = None):
-        super().__init__('div')
+    def __init__(self, on_change: Optional[Callable[[Dict[str, Any]], None]] = None, client_bundles: bool = False,
+                 *, throttle_ms: int = 150, preload_textures: bool = True, preview_fonts: bool = True,
+                 wait_for_fonts: bool = False, instant: bool = False):
+        """
+        Args:
+            on_change: Called with the configured pillars after every change (and the
+                state keys the user changed, as 'changed').
+            client_bundles: Precompile all registry bundles so that picking one switches
+                it in the browser (see ThemeManager.enable_bundle_switching).
+            throttle_ms: While dragging a slider, send changes at most every N ms.
+            preload_textures: Inject the CSS of every texture shown as a preview in the
+                texture menu, so that previews render before the texture is ever applied.
+            preview_fonts: Declare the local fonts listed in the font menu so that their
+                options render in their own font (Google fonts load once picked).
+            wait_for_fonts: After picking a font, keep the previous typography until the
+                new font has loaded in the browser (see ThemeManager.apply_theme).
+            instant: Swap themes without transitions (see ThemeManager.apply_theme).
+        """
+        super().__init__()
         self.classes('w-fit')
         self._on_change = on_change
+        self._client_bundles = client_bundles
         
         # 1. State - Initialized from registry or presets
         self._current_theme_bundle_name = None
@@ -53,273 +73,121 @@ class theme_selector(ui.element):
         # 3. Dynamic Font Data
         self._all_font_opts = FontManager.get_font_options(nice.registry.list_typographies())
         
+        self._preload_textures = preload_textures
+        self._preview_fonts = preview_fonts
+        self._wait_for_fonts = wait_for_fonts
+        self._instant = instant
+        self._props['client_bundles'] = client_bundles
+        self._props['throttle_ms'] = throttle_ms
         self._render()
+        self.on('change', self._handle_change)
 
-    def _render_trigger_icon(self):
-        """Builder for the select_button icon. Creates a container we can update later."""
-        self.trigger_icon_container = ui.element('div').classes('flex items-center justify-center')
-        self._update_trigger_icon()
-        
-    def _update_trigger_icon(self):
-        """Updates the content of the trigger icon container."""
-        if hasattr(self, 'trigger_icon_container'):
-            self.trigger_icon_container.clear()
-            with self.trigger_icon_container:
-                theme_icon(
-                    self._palette,
-                    self._texture,
-                    size="24px"
-                )
-        
-    def _render_large_preview(self):
-        """Renders the large theme icon preview with title."""
-        with ui.row().classes('w-full items-center nd-px-md nd-py-lg bg-black/5 mb-2 nd-gap-md'):
-             theme_icon(
-                self._palette,
-                self._texture,
-                size="48px"
-            )
-             with ui.column().classes('nd-gap-0'):
-                 name = self._current_theme_bundle_name or "Theme configuration"
-                 l = ui.label(name.replace('-', ' ').title()).classes('text-lg font-bold')
-                 l.tag = 'h3'
-                 ui.label('Preview your theme here.').classes('text-[10px] opacity-40 uppercase tracking-widest font-bold')
+    def _preview_title(self) -> str:
+        name = self._current_theme_bundle_name or "Theme configuration"
+        return name.replace('-', ' ').title()
 
-    def _render(self):
-        self.clear()
-        
-        # Fetch fresh options from registry
+    def _catalog(self) -> Dict[str, list]:
+        """Option lists of the selects, as compact JSON-ready data."""
         themes = nice.registry.list_themes()
-        palettes = nice.registry.list_palettes()
-        textures = nice.registry.list_textures()
-        layouts = nice.registry.list_layouts()
-        fonts = nice.registry.list_typographies()
-        
-        with self:
-            # Main Trigger Button
-            self.btn = select_button(
-                icon_only=True,
-                custom_icon_builder=self._render_trigger_icon
-            )
-            
-            with self.btn:
-                with menu().classes('min-w-[280px] nd-p-0') as self.menu:
-                    self.menu.on('hide', self.btn.reset_rotation)
-                    
-                    # 1. Preview
-                    self._preview_container = ui.element('div').classes('w-full')
-                    with self._preview_container:
-                        self._render_large_preview()
-                        
-                    # 2. Controls Section
-                    with ui.column().classes('w-full nd-p-md nd-gap-md'):
-                        
-                        # A. Theme Bundles (Combination Dropdown)
-                        if themes:
-                             select(
-                                 options={t: t.replace('-', ' ').title() for t in themes},
-                                 value=self._current_theme_bundle_name,
-                                 label='Theme Bundle Preset',
-                                 on_change=lambda e: self._update_theme_bundle(e.value)
-                             ).classes('w-full mb-2')
-
-                        # Row of Submenu Buttons (The 4 Pillars)
-                        with ui.row().classes('w-full nd-gap-sm justify-between'):
-                            
-                            # --- B. Palette Submenu ---
-                            palette_icon_builder = lambda: palette_icon(self._palette, size="24px")
-                            with select_button(icon_only=True, custom_icon_builder=palette_icon_builder) as self.btn_palette:
-                                self.btn_palette.classes('flex-1')
-                                with menu().classes('min-w-[240px] nd-p-md nd-gap-md') as m:
-                                    m.on('hide', self.btn_palette.reset_rotation)
-                                    
-                                    # Theme Mode Multi-Button
-                                    with ui.row().classes('w-full justify-center mb-4'):
-                                        multi_button(
-                                            options=[
-                                                {'icon': 'mdi-white-balance-sunny', 'value': 'light', 'color': 'var(--nd-color-orange)'},
-                                                {'icon': 'mdi-brightness-auto', 'value': 'auto', 'color': 'var(--nd-content-subtle)'},
-                                                {'icon': 'mdi-moon-waning-crescent', 'value': 'dark', 'color': 'var(--nd-color-blue)'}
-                                            ],
-                                            value=self._current_mode,
-                                            on_change=self._update_theme_mode
-                                        )
-                                    
-                                    # Primary Accent
-                                    ui.label('Primary Accent').classes('text-xs opacity-60 font-bold mb-1')
-                                    self._primary_accent_slider = palette_slider(
-                                        colors=list(self._palette.colors.values()) or ["#002b36", "#fdf6e3"],
-                                        value=self._palette.primary,
-                                        on_change=self._update_primary_accent
-                                    )
-
-                                    # Secondary Accent
-                                    ui.label('Secondary Accent').classes('text-xs opacity-60 font-bold mb-1')
-                                    self._secondary_accent_slider = palette_slider(
-                                        colors=list(self._palette.colors.values()) or ["#002b36", "#fdf6e3"],
-                                        value=self._palette.secondary,
-                                        on_change=self._update_secondary_accent
-                                    )
-
-                                    ui.separator().classes('opacity-10 my-1')
-
-                                    # Palette Preset
-                                    palette_opts = {}
-                                    for name in palettes:
-                                        p = nice.registry.get_palette(name)
-                                        if p:
-                                            html = palette_icon.to_html(p, size="20px")
-                                            palette_opts[name] = {'label': name.title(), 'html': html}
-                                        
-                                    p_val = self._current_palette_name if self._current_palette_name in palette_opts else (next(iter(palette_opts.keys())) if palette_opts else None)
-                                        
-                                    self._palette_select = select(
-                                        options=palette_opts,
-                                        value=p_val,
-                                        label='Palette Preset',
-                                        with_icons=True,
-                                        on_change=lambda e: self._update_palette(e.value)
-                                    ).classes('w-full')
-                            
-                            # --- C. Texture Submenu ---
-                            texture_icon_builder = lambda: texture_icon(self._texture, self._palette, size="24px")
-                            with select_button(icon_only=True, custom_icon_builder=texture_icon_builder) as self.btn_texture:
-                                self.btn_texture.classes('flex-1')
-                                with menu().classes('min-w-[240px] nd-p-md nd-gap-md') as m:
-                                    m.on('hide', self.btn_texture.reset_rotation)
-                                    
-                                    # Texture Select
-                                    texture_opts = {}
-                                    for name in textures:
-                                        tex = nice.registry.get_texture(name)
-                                        if tex:
-                                            html = texture_icon.to_html(tex, self._palette, size="20px")
-                                            texture_opts[name] = {'label': name.title(), 'html': html}
-
-                                    t_val = self._current_texture_name if self._current_texture_name in texture_opts else (next(iter(texture_opts.keys())) if texture_opts else None)
-
-                                    self._texture_select = select(
-                                        options=texture_opts,
-                                        value=t_val,
-                                        label='Texture Base',
-                                        with_icons=True,
-                                        on_change=lambda e: self._update_texture_preset(e.value)
-                                    ).classes('w-full')
-                                    
-                                    # Shadow / Highlight (Effect Intensities)
-                                    with ui.column().classes('w-full nd-gap-xs mt-2'):
-                                        with ui.row().classes('w-full justify-between').style('margin-bottom: -10px'):
-                                            with ui.column().classes('nd-gap-0'):
-                                                ui.label('Shadow').classes('text-xs opacity-60')
-                                                self._shadow_label = ui.label(f'{self._texture.shadow_intensity:.1f}').classes('text-xs font-bold')
-                                            with ui.column().classes('items-end nd-gap-0'):
-                                                ui.label('Highlight').classes('text-xs opacity-60')
-                                                self._highlight_label = ui.label(f'{self._texture.highlight_intensity:.1f}').classes('text-xs font-bold')
-                                        
-                                        self._effect_slider = split_slider(
-                                            limit=2.0,
-                                            step=0.1,
-                                            value_left=self._texture.shadow_intensity, 
-                                            value_right=self._texture.highlight_intensity, 
-                                            color_left='var(--nd-primary)',
-                                            color_right='var(--nd-secondary)',
-                                            on_change=self._update_intensities
-                                        )
-
-                                    ui.separator().classes('opacity-10 my-1')
-                                    
-                                    # Border (Geometric)
-                                    with ui.column().classes('w-full nd-gap-xs'):
-                                        with ui.row().classes('w-full justify-between'):
-                                            ui.label('Border').classes('text-xs opacity-60')
-                                            self._border_label = ui.label(f'{self._texture.border_width}px').classes('text-xs font-bold')
-                                            
-                                        self._border_slider = slider(min=0, max=4, step=1, value=self._texture.border_width,
-                                                  on_change=self._update_border).props('markers snap label :label-value="modelValue + \'px\'"')
-
-                                    # Roundness (Geometric)
-                                    with ui.column().classes('w-full nd-gap-xs'):
-                                        with ui.row().classes('w-full justify-between'):
-                                            ui.label('Roundness').classes('text-xs opacity-60')
-                                            self._roundness_label = ui.label(f'{self._texture.roundness:.1f}').classes('text-xs font-bold')
-                                            
-                                        self._roundness_slider = slider(min=0, max=2.5, step=0.1, value=self._texture.roundness, 
-                                                  on_change=self._update_roundness).props('label :label-value="modelValue.toFixed(1)"')
-
-                            # --- D. Typography Submenu ---
-                            with select_button(icon='mdi-format-font', icon_only=True) as btn_typo:
-                                btn_typo.classes('flex-1')
-                                with menu().classes('min-w-[240px] nd-p-md nd-gap-md') as m:
-                                    m.on('hide', btn_typo.reset_rotation)
-                                    
-                                    f_main_val = self._current_font_main_name if self._current_font_main_name in self._all_font_opts else (next(iter(self._all_font_opts.keys())) if self._all_font_opts else None)
-
-                                    self._font_main_select = select(
-                                        options=self._all_font_opts,
-                                        value=f_main_val,
-                                        label='Primary Font',
-                                        on_change=lambda e: self._update_font(e.value, is_main=True),
-                                        on_filter=self._filter_fonts
-                                    ).classes('w-full')
-
-                                    f_sec_val = self._current_font_secondary_name if self._current_font_secondary_name in self._all_font_opts else (next(iter(self._all_font_opts.keys())) if self._all_font_opts else None)
-
-                                    self._font_secondary_select = select(
-                                        options=self._all_font_opts,
-                                        value=f_sec_val,
-                                        label='Secondary Font',
-                                        on_change=lambda e: self._update_font(e.value, is_main=False),
-                                        on_filter=self._filter_fonts
-                                    ).classes('w-full')
-
-                                    ui.separator().classes('opacity-10 my-1')
-
-                                    # Text Scale
-                                    with ui.column().classes('w-full nd-gap-xs'):
-                                        with ui.row().classes('w-full justify-between'):
-                                            ui.label('Text Scale').classes('text-xs opacity-60')
-                                            self._scale_label = ui.label(f'{self._typography.scale_ratio:.2f}').classes('text-xs font-bold')
-                                            
-                                        self._scale_slider = slider(min=1.0, max=1.6, step=0.05, value=self._typography.scale_ratio,
-                                                  on_change=self._update_text_scale).props('label :label-value="modelValue.toFixed(2)"')
-
-                                    # Title Capitalization
-                                    with ui.column().classes('w-full nd-gap-xs mt-2'):
-                                        with ui.row().classes('w-full justify-between'):
-                                            ui.label('Title Case').classes('text-xs opacity-60')
-                                            tf_map_rev = {0: 'lower', 1: 'none', 2: 'title', 3: 'ALL'}
-                                            tf_val_map = {'lowercase': 0, 'none': 1, 'capitalize': 2, 'uppercase': 3}
-                                            curr_tf_int = tf_val_map.get(self._typography.title_transform, 1)
-                                            self._tf_label = ui.label(tf_map_rev.get(curr_tf_int)).classes('text-xs font-bold')
-                                            
-                                        self._tf_slider = slider(min=0, max=3, step=1, value=curr_tf_int,
-                                                  on_change=self._update_capitalization).props('markers snap label :label-value="[\'lower\', \'none\', \'title\', \'ALL\'][modelValue]"')
+        palettes = {name: nice.registry.get_palette(name) for name in nice.registry.list_palettes()}
+        textures = {name: nice.registry.get_texture(name) for name in nice.registry.list_textures()}
+        return {
+            'bundles': [{'value': t, 'label': t.replace('-', ' ').title()} for t in themes],
+            'palettes': [{'value': name, 'label': name.title(), 'html': palette_icon.to_html(p, size="20px")}
+                         for name, p in palettes.items() if p],
+            'textures': [{'value': name, 'label': name.title(), 'html': texture_icon.to_html(tex, self._palette, size="20px")}
+                         for name, tex in textures.items() if tex],
+            'layouts': [{'value': name, 'label': name.title()} for name in nice.registry.list_layouts()],
+            # [name, font-family, local?]
+            'fonts': [[name, opt['font'], opt['icon'] == 'mdi-folder-outline'] for name, opt in self._all_font_opts.items()],
+        }
+
+    @staticmethod
+    def _option(value, options: list):
+        """`value` if it is one of the catalog options, else the first option."""
+        names = [opt['value'] if isinstance(opt, dict) else opt[0] for opt in options]
+        return value if value in names else (names[0] if names else None)
+
+    def _state(self) -> Dict[str, Any]:
+        """The configuration (and preview) shown by the component."""
+        catalog = self._props['catalog']
+        return {
+            'bundle': self._current_theme_bundle_name,
+            'palette': self._option(self._current_palette_name, catalog['palettes']),
+            'texture': self._option(self._current_texture_name, catalog['textures']),
+            'layout': self._option(self._current_layout_name, catalog['layouts']),
+            'font_main': self._option(self._current_font_main_name, catalog['fonts']),
+            'font_secondary': self._option(self._current_font_secondary_name, catalog['fonts']),
+            'mode': self._current_mode,
+            'colors': list(self._palette.colors.values()) or ["#002b36", "#fdf6e3"],
+            'primary': self._palette.primary,
+            'secondary': self._palette.secondary,
+            'shadow': self._texture.shadow_intensity,
+            'highlight': self._texture.highlight_intensity,
+            'border': self._texture.border_width,
+            'roundness': self._texture.roundness,
+            'scale': self._typography.scale_ratio,
+            'title_transform': self._typography.title_transform,
+            'spacing': self._layout.base_space,
+            'title': self._preview_title(),
+            # Icons follow the theme variables: only texture changes alter their HTML
+            'icon_trigger': theme_icon.to_html(self._palette, self._texture, size="24px", follow_theme=True),
+            'icon_preview': theme_icon.to_html(self._palette, self._texture, size="48px", follow_theme=True),
+            'icon_palette': palette_icon.to_html(self._palette, size="24px", follow_theme=True),
+            'icon_texture': texture_icon.to_html(self._texture, self._palette, size="24px", follow_theme=True),
+        }
 
-                            # --- E. Layout Submenu ---
-                            with select_button(icon='mdi-view-quilt', icon_only=True) as btn_layout:
-                                btn_layout.classes('flex-1')
-                                with menu().classes('min-w-[240px] nd-p-md nd-gap-md') as m:
-                                    m.on('hide', btn_layout.reset_rotation)
-                                    
-                                    layout_opts = {name: name.title() for name in layouts}
-                                    l_val = self._current_layout_name if self._current_layout_name in layout_opts else (next(iter(layout_opts.keys())) if layout_opts else None)
-
-                                    self._layout_select = select(
-                                        options=layout_opts,
-                                        value=l_val,
-                                        label='Layout Preset',
-                                        on_change=lambda e: self._update_layout_preset(e.value)
-                                    ).classes('w-full')
-                                    
-                                    ui.separator().classes('opacity-10 my-1')
-                                    
-                                    with ui.column().classes('w-full nd-gap-xs mt-2'):
-                                        with ui.row().classes('w-full justify-between'):
-                                            ui.label('Spacing Density').classes('text-xs opacity-60')
-                                            self._spacing_label = ui.label(f'{self._layout.base_space:.1f}x').classes('text-xs font-bold')
-                                            
-                                        self._spacing_slider = slider(min=0.5, max=2.0, step=0.1, value=self._layout.base_space,
-                                                  on_change=self._update_spacing).props('label :label-value="modelValue.toFixed(1) + \'x\'"')
+    def _render(self):
+        """Pushes fresh catalogs from the registry and the full state."""
+        self._props['catalog'] = self._catalog()
+        self._props['state'] = self._state()
+        if self._preload_textures:
+            textures = (nice.registry.get_texture(name) for name in nice.registry.list_textures())
+            theme_manager.ensure_textures(tex.texture_cls for tex in textures if tex)
+        if self._preview_fonts:
+            FontManager.ensure_fonts(nice.registry.list_font_families())
+        if self._client_bundles:
+            themes = nice.registry.list_themes()
+            bundles = {t: nice.registry.get_theme(t) for t in themes}
+            theme_manager.enable_bundle_switching({t: b for t, b in bundles.items() if b})
+
+    def _handle_change(self, e):
+        """Edits from the browser (already displayed there)."""
+        self._apply_patch(e.args)
+
+    def _apply_patch(self, patch: Dict[str, Any]):
+        """
+        Applies the changed keys to the working copies, then refreshes once.
+        Every handler returns None (nothing to do), False (refresh without recompiling,
+        the browser already switched) or True (refresh and re-apply the theme).
+        """
+        handlers = {
+            'bundle': self._update_theme_bundle,
+            'palette': self._update_palette,
+            'mode': self._update_theme_mode,
+            'primary': self._update_primary_accent,
+            'secondary': self._update_secondary_accent,
+            'texture': self._update_texture_preset,
+            'shadow': self._update_shadow,
+            'highlight': self._update_highlight,
+            'border': self._update_border,
+            'roundness': self._update_roundness,
+            'font_main': lambda value: self._update_font(value, is_main=True),
+            'font_secondary': lambda value: self._update_font(value, is_main=False),
+            'scale': self._update_text_scale,
+            'title_transform': self._update_capitalization,
+            'layout': self._update_layout_preset,
+            'spacing': self._update_spacing,
+        }
+        with span('theme_selector.patch') as s:
+            if s:
+                s.set('keys', sorted(patch))
+            results = [handlers[key](value) for key, value in patch.items() if key in handlers]
+            if any(r is not None for r in results):
+                self._refresh_components(apply=any(results), sent=patch)
+            else:
+                with self._props.suspend_updates():
+                    self._props['state'] = self._state()
 
     def _update_theme_bundle(self, bundle_name):
         """Applies a named 'Theme' bundle (combination of 4 pillars)."""
@@ -329,13 +197,17 @@ class theme_selector(ui.element):
         if not theme: return
         
         self._current_theme_bundle_name = bundle_name
+        # The names drive later lookups (e.g. the palette's other light/dark variant)
+        self._current_palette_name = theme.palette.name
+        self._current_texture_name = theme.texture.name
+        self._current_layout_name = theme.layout.name
         self._palette = copy.deepcopy(theme.palette)
         self._texture = copy.deepcopy(theme.texture)
         self._typography = copy.deepcopy(theme.typography)
         self._layout = copy.deepcopy(theme.layout)
         
-        # Update synced select values/labels (optional, for UI consistency)
-        self._refresh_components()
+        # With client-side bundles the browser has already switched the variables
+        return not self._client_bundles
 
     def _update_palette(self, value):
         if value:
@@ -348,40 +220,51 @@ class theme_selector(ui.element):
             p = nice.registry.get_palette(value, mode=effective_mode)
             if p:
                 self._palette = copy.deepcopy(p)
-                self._refresh_components()
+                return True
             
     def _update_primary_accent(self, color):
         self._palette.primary = color
-        self._refresh_components()
+        return True
 
     def _update_secondary_accent(self, color):
         self._palette.secondary = color
-        self._refresh_components()
+        return True
         
     def _update_theme_mode(self, mode):
-        """Handle theme mode selection using multi_button."""
+        """
+        Handle theme mode selection.
+        The browser already switched data-nd-mode; when the palette has both variants
+        in the stylesheet, only the working copy and icons are updated here.
+        """
         self._current_mode = mode
         
-        # Apply logic for 'auto' detection or hardcoded values
-        effective_mode = mode
+        # 'auto' follows the OS in the browser; the working copy keeps its current variant
         if mode == 'auto':
-            # For now, default to dark in 'auto'
-            effective_mode = 'dark' 
+            return
             
         # Try to find the matching palette in the registry for the target mode
-        p = nice.registry.get_palette(self._current_palette_name, mode=effective_mode)
-        if p:
-             # Store current active accents to preserve them across mode swaps
-             active_primary = self._palette.primary
-             active_secondary = self._palette.secondary
-             
-             self._palette = copy.deepcopy(p)
-             
-             # Re-apply active accents
-             self._palette.primary = active_primary
-             self._palette.secondary = active_secondary
-             
-        self._refresh_components()
+        p = nice.registry.get_palette(self._current_palette_name, mode=mode)
+        if p and p.mode != self._palette.mode:
+             # Recompile only if the applied stylesheet does not already carry this variant
+             compiled = theme_manager.current_alternate
+             has_variant = compiled is not None and compiled.name == p.name and compiled.mode == p.mode
+             self._palette = self._with_active_accents(p)
+             return not has_variant
+
+    def _with_active_accents(self, palette: Palette) -> Palette:
+        """Copies a palette variant, preserving the active accents across mode swaps."""
+        variant = copy.deepcopy(palette)
+        variant.primary = self._palette.primary
+        variant.secondary = self._palette.secondary
+        return variant
+
+    def _get_alternate_palette(self) -> Optional[Palette]:
+        """The current palette in the other mode (if registered), for client-side light/dark switching."""
+        other_mode = 'light' if self._palette.mode == 'dark' else 'dark'
+        p = nice.registry.get_palette(self._current_palette_name, mode=other_mode)
+        if not p or p.mode != other_mode:
+            return None
+        return self._with_active_accents(p)
         
     def _update_texture_preset(self, value):
         if value:
@@ -389,7 +272,7 @@ class theme_selector(ui.element):
             if tex:
                 self._current_texture_name = value
                 self._texture = copy.deepcopy(tex)
-                self._refresh_components()
+                return True
             
     def _update_layout_preset(self, value):
         if value:
@@ -397,32 +280,29 @@ class theme_selector(ui.element):
             if lay:
                 self._current_layout_name = value
                 self._layout = copy.deepcopy(lay)
-                self._refresh_components()
+                return True
         
-    def _update_roundness(self, e):
-        self._texture.roundness = e.value
-        self._roundness_label.text = f'{e.value:.1f}'
-        self._refresh_components()
-
-    def _update_border(self, e):
-        val = int(e.value)
-        self._texture.border_width = val
-        self._border_label.text = f'{val}px'
-        self._refresh_components()
-
-    def _update_spacing(self, e):
-        self._layout.base_space = e.value
-        self._spacing_label.text = f'{e.value:.1f}x'
-        self._refresh_components()
+    def _update_roundness(self, value):
+        self._texture.roundness = value
+        theme_manager.set_variable('radius-base', radius_base(self._texture))
+        return False
+
+    def _update_border(self, value):
+        self._texture.border_width = int(value)
+        return True
+
+    def _update_spacing(self, value):
+        self._layout.base_space = value
+        theme_manager.set_variable('space-unit', space_unit(self._layout))
+        return False
         
-    def _update_intensities(self, e):
-        si = e['left']
-        hi = e['right']
-        self._texture.shadow_intensity = si
-        self._texture.highlight_intensity = hi
-        self._shadow_label.text = f'{si:.1f}'
-        self._highlight_label.text = f'{hi:.1f}'
-        self._refresh_components()
+    def _update_shadow(self, value):
+        self._texture.shadow_intensity = value
+        return True
+
+    def _update_highlight(self, value):
+        self._texture.highlight_intensity = value
+        return True
 
     def _update_font(self, value, is_main: bool = True):
         if value:
@@ -431,106 +311,66 @@ class theme_selector(ui.element):
             else:
                 self._current_font_secondary_name = value
 
-            # 1. Load font if it's a Google Font
-            FontManager.load_font(value)
-            
-            # 2. Update Typography object
+            # 1. Update Typography object
             typo = nice.registry.get_typography(value)
             font_family = typo.font_main if typo else f"'{value}', sans-serif"
 
+            # 2. Load the font (local file or Google Font)
+            FontManager.load_font(font_family_name(font_family))
+
             if is_main:
                 self._typography.font_main = font_family
             else:
                 self._typography.font_secondary = font_family
             
-            self._refresh_components()
-
-    def _filter_fonts(self, val: str):
-        """Filters the font options based on search input."""
-        if not val:
-            return self._all_font_opts
-        return {k: v for k, v in self._all_font_opts.items() if val in k.lower()}
-
-    def _update_text_scale(self, e):
-        self._typography.scale_ratio = e.value
-        self._scale_label.text = f'{e.value:.2f}'
-        self._refresh_components()
-
-    def _update_capitalization(self, e):
-        tf_map = {0: 'lowercase', 1: 'none', 2: 'capitalize', 3: 'uppercase'}
-        tf_map_rev = {0: 'lower', 1: 'none', 2: 'title', 3: 'ALL'}
-        val = tf_map.get(int(e.value), 'none')
-        self._typography.title_transform = val
-        self._tf_label.text = tf_map_rev.get(int(e.value))
-        self._refresh_components()
-
-    def _refresh_components(self):
-        """Refreshes the dynamic visualizations and triggers change event."""
-        self._update_trigger_icon()
-        
-        self._preview_container.clear()
-        with self._preview_container:
-            self._render_large_preview()
-            
-        # Sync Controls UI to current state (useful after bundle changes)
-        if hasattr(self, '_effect_slider'):
-            # Update values
-            self._effect_slider.slider_left.value = self._texture.shadow_intensity
-            self._effect_slider.slider_right.value = self._texture.highlight_intensity
-            # Update labels
-            self._shadow_label.text = f'{self._texture.shadow_intensity:.1f}'
-            self._highlight_label.text = f'{self._texture.highlight_intensity:.1f}'
-            # Update colors (from current palette)
-            self._effect_slider.set_colors('var(--nd-primary)', 'var(--nd-secondary)')
-
-        if hasattr(self, '_primary_accent_slider'):
-            self._primary_accent_slider.set_colors(list(self._palette.colors.values()), value=self._palette.primary)
-        
-        if hasattr(self, '_secondary_accent_slider'):
-            self._secondary_accent_slider.set_colors(list(self._palette.colors.values()), value=self._palette.secondary)
-
-        if hasattr(self, '_border_slider'):
-            self._border_slider.value = self._texture.border_width
-            self._border_label.text = f'{self._texture.border_width}px'
-        
-        if hasattr(self, '_roundness_slider'):
-            self._roundness_slider.value = self._texture.roundness
-            self._roundness_label.text = f'{self._texture.roundness:.1f}'
-            
-        if hasattr(self, '_scale_slider'):
-            self._scale_slider.value = self._typography.scale_ratio
-            self._scale_label.text = f'{self._typography.scale_ratio:.2f}'
-            
-        if hasattr(self, '_spacing_slider'):
-            self._spacing_slider.value = self._layout.base_space
-            self._spacing_label.text = f'{self._layout.base_space:.1f}x'
-            
-        if hasattr(self, '_tf_slider'):
-            tf_val_map = {'lowercase': 0, 'none': 1, 'capitalize': 2, 'uppercase': 3}
-            tf_map_rev = {0: 'lower', 1: 'none', 2: 'title', 3: 'ALL'}
-            curr_val = tf_val_map.get(self._typography.title_transform, 1)
-            self._tf_slider.value = curr_val
-            self._tf_label.text = tf_map_rev.get(curr_val)
-
-        if hasattr(self, 'btn_palette'):
-            self.btn_palette.refresh()
-        if hasattr(self, 'btn_texture'):
-            self.btn_texture.refresh()
-
-        # 3. Apply Theme Globally via ThemeManager
-        new_theme = Theme(
-            name="Dynamic Theme",
-            palette=self._palette,
-            texture=self._texture,
-            typography=self._typography,
-            layout=self._layout
-        )
-        theme_manager.apply_theme(new_theme)
+            return True
+
+    def _update_text_scale(self, value):
+        self._typography.scale_ratio = value
+        theme_manager.set_variable('type-ratio', type_ratio(self._typography))
+        return False
+
+    def _update_capitalization(self, value):
+        self._typography.title_transform = value
+        return True
+
+    def _refresh_components(self, apply: bool = True, sent: Optional[Dict[str, Any]] = None):
+        """
+        Syncs the component, re-applies the theme and triggers the change event.
+        Only the state keys that differ from what the browser shows (`sent` being the
+        values it just reported) are pushed, as one small message.
+        """
+        sent = sent or {}
+        state = self._state()
+        shown = self._props['state']
+        changed = {k: v for k, v in state.items() if shown.get(k) != v and not (k in sent and sent[k] == v)}
+        # Keep the props current for reconnects without re-sending the whole element
+        with self._props.suspend_updates():
+            self._props['state'] = state
+        if changed:
+            self.run_method('patch', changed)
+            current_span().incr('run_method')
+
+        # Apply Theme Globally via ThemeManager (both light/dark variants when available)
+        alternate = self._get_alternate_palette()
+        if apply:
+            new_theme = Theme(
+                name="Dynamic Theme",
+                palette=self._palette,
+                texture=self._texture,
+                typography=self._typography,
+                layout=self._layout
+            )
+            theme_manager.apply_theme(new_theme, alternate=alternate, mode=self._current_mode,
+                                      wait_for_fonts=self._wait_for_fonts, instant=self._instant)
 
         if self._on_change:
             self._on_change({
                 'palette': self._palette,
+                'alternate': alternate,
+                'mode': self._current_mode,
                 'texture': self._texture,
                 'typography': self._typography,
-                'layout': self._layout
+                'layout': self._layout,
+                'changed': sorted(sent),
             })
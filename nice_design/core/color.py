@@ -0,0 +1,268 @@
+"""
+Vectorized color math for the NiceDesign core.
+
+Every conversion works on NumPy arrays shaped ``(..., 3)`` holding sRGB channels
+in ``[0, 1]``, so a whole palette (or a whole library of palettes) is converted
+in a single call instead of one hex string at a time.
+"""
+import re
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .definitions import Palette
+
+HEX_PATTERN = re.compile(r'^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$')
+
+# Tonal scale steps (Tailwind / Material naming)
+TONE_STEPS: Tuple[int, ...] = (50, 100, 200, 300, 400, 500, 600, 700, 800, 900)
+
+# OKLCH lightness target of each step, and the share of the seed chroma it keeps
+# (chroma tapers towards the extremes so tints and shades stay in gamut).
+TONE_LIGHTNESS = np.array([0.97, 0.93, 0.87, 0.79, 0.71, 0.63, 0.55, 0.47, 0.39, 0.30])
+TONE_CHROMA = np.array([0.15, 0.30, 0.55, 0.80, 0.95, 1.00, 0.95, 0.85, 0.70, 0.55])
+
+# WCAG relative luminance weights (applied to linear RGB)
+_LUMINANCE = np.array([0.2126, 0.7152, 0.0722])
+
+# OKLab matrices (Björn Ottosson)
+_RGB_TO_LMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+_LMS_TO_OKLAB = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+_OKLAB_TO_LMS = np.array([
+    [1.0, 0.3963377774, 0.2158037573],
+    [1.0, -0.1055613458, -0.0638541728],
+    [1.0, -0.0894841775, -1.2914855480],
+])
+_LMS_TO_RGB = np.array([
+    [4.0767416621, -3.3077115913, 0.2309699292],
+    [-1.2684380046, 2.6097574011, -0.3413193965],
+    [-0.0041960863, -0.7034186147, 1.7076147010],
+])
+
+
+# --- Parsing & Formatting ---
+
+def is_hex(color) -> bool:
+    """Returns True if `color` is a '#rgb' or '#rrggbb' hex string."""
+    return isinstance(color, str) and HEX_PATTERN.match(color) is not None
+
+
+def hex_to_rgb(hex_color: str) -> tuple:
+    """Convert a single hex color to an (r, g, b) tuple of integers (0-255)."""
+    h = hex_color.lstrip('#')
+    if len(h) == 3:
+        h = ''.join([c*2 for c in h])
+    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+
+
+def parse_hex(colors: Iterable[str], *, strict: bool = True) -> np.ndarray:
+    """
+    Parses hex strings into an ``(N, 3)`` float array in ``[0, 1]``.
+
+    With ``strict=False`` invalid entries become rows of NaN instead of raising.
+    """
+    colors = list(colors)
+    out = np.full((len(colors), 3), np.nan)
+    digits, rows, invalid = [], [], []
+
+    for i, color in enumerate(colors):
+        match = HEX_PATTERN.match(color) if isinstance(color, str) else None
+        if not match:
+            invalid.append(i)
+            continue
+        h = match.group(1)
+        if len(h) == 3:
+            h = h[0]*2 + h[1]*2 + h[2]*2
+        digits.append(h)
+        rows.append(i)
+
+    if invalid and strict:
+        raise ValueError(f"Invalid hex color(s): {', '.join(repr(colors[i]) for i in invalid)}")
+
+    if digits:
+        raw = np.frombuffer(bytes.fromhex(''.join(digits)), dtype=np.uint8)
+        out[rows] = raw.reshape(-1, 3) / 255.0
+    return out
+
+
+def to_hex(rgb: np.ndarray) -> List[str]:
+    """Formats an ``(..., 3)`` sRGB array as a flat list of '#rrggbb' strings."""
+    rgb = np.asarray(rgb, dtype=float).reshape(-1, 3)
+    raw = np.clip(np.round(rgb * 255), 0, 255).astype(np.uint8).tobytes().hex()
+    return ['#' + raw[i:i+6] for i in range(0, len(raw), 6)]
+
+
+# --- Conversions ---
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    rgb = np.asarray(rgb, dtype=float)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(lin: np.ndarray) -> np.ndarray:
+    lin = np.asarray(lin, dtype=float)
+    return np.where(lin <= 0.0031308, lin * 12.92, 1.055 * np.power(np.maximum(lin, 0), 1 / 2.4) - 0.055)
+
+
+def rgb_to_hsl(rgb: np.ndarray) -> np.ndarray:
+    """sRGB -> HSL with hue in degrees and saturation/lightness in ``[0, 1]``."""
+    rgb = np.asarray(rgb, dtype=float)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    mx, mn = rgb.max(axis=-1), rgb.min(axis=-1)
+    delta = mx - mn
+    light = (mx + mn) / 2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sat = np.where(delta == 0, 0.0, delta / (1 - np.abs(2 * light - 1)))
+        hue = np.select(
+            [mx == r, mx == g],
+            [((g - b) / delta) % 6, (b - r) / delta + 2],
+            (r - g) / delta + 4,
+        ) * 60
+    hue = np.where(delta == 0, 0.0, hue)
+    return np.stack([hue, np.nan_to_num(sat), light], axis=-1)
+
+
+def hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    hsl = np.asarray(hsl, dtype=float)
+    h, s, l = hsl[..., 0:1], hsl[..., 1:2], hsl[..., 2:3]
+    n = np.array([0, 8, 4])
+    k = (n + h / 30) % 12
+    a = s * np.minimum(l, 1 - l)
+    return l - a * np.clip(np.minimum(k - 3, 9 - k), -1, 1)
+
+
+def rgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    lms = srgb_to_linear(rgb) @ _RGB_TO_LMS.T
+    return np.cbrt(lms) @ _LMS_TO_OKLAB.T
+
+
+def oklab_to_rgb(lab: np.ndarray) -> np.ndarray:
+    """OKLab -> sRGB. Out-of-gamut results are returned unclipped."""
+    lms = (np.asarray(lab, dtype=float) @ _OKLAB_TO_LMS.T) ** 3
+    return linear_to_srgb(lms @ _LMS_TO_RGB.T)
+
+
+def rgb_to_oklch(rgb: np.ndarray) -> np.ndarray:
+    """sRGB -> OKLCH (lightness, chroma, hue in degrees)."""
+    lab = rgb_to_oklab(rgb)
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    hue = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360
+    return np.stack([lab[..., 0], chroma, hue], axis=-1)
+
+
+def _oklch_to_oklab(lch: np.ndarray) -> np.ndarray:
+    rad = np.radians(lch[..., 2])
+    return np.stack([lch[..., 0], lch[..., 1] * np.cos(rad), lch[..., 1] * np.sin(rad)], axis=-1)
+
+
+def oklch_to_rgb(lch: np.ndarray, *, iterations: int = 12) -> np.ndarray:
+    """
+    OKLCH -> sRGB, gamut-mapped by reducing chroma (hue and lightness are kept).
+    """
+    lch = np.array(lch, dtype=float)
+    rgb = oklab_to_rgb(_oklch_to_oklab(lch))
+    outside = np.any((rgb < -1e-4) | (rgb > 1 + 1e-4), axis=-1)
+
+    if np.any(outside):
+        # Bisect the chroma of every out-of-gamut entry at once
+        target = lch[outside]
+        lo = np.zeros(len(target))
+        hi = target[:, 1].copy()
+        for _ in range(iterations):
+            mid = (lo + hi) / 2
+            probe = oklab_to_rgb(_oklch_to_oklab(np.stack([target[:, 0], mid, target[:, 2]], axis=-1)))
+            fits = np.all((probe >= -1e-4) & (probe <= 1 + 1e-4), axis=-1)
+            lo = np.where(fits, mid, lo)
+            hi = np.where(fits, hi, mid)
+        target[:, 1] = lo
+        rgb[outside] = oklab_to_rgb(_oklch_to_oklab(target))
+
+    return np.clip(rgb, 0, 1)
+
+
+# --- Operations ---
+
+def mix(a: np.ndarray, b: np.ndarray, amount=0.5, *, space: str = 'srgb') -> np.ndarray:
+    """
+    Interpolates from `a` to `b` by `amount` (broadcastable), like CSS color-mix().
+    `space` is 'srgb' or 'oklab'.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    t = np.asarray(amount, dtype=float)
+    if t.ndim:
+        t = t[..., None]
+
+    if space == 'oklab':
+        return np.clip(oklab_to_rgb(rgb_to_oklab(a) * (1 - t) + rgb_to_oklab(b) * t), 0, 1)
+    if space != 'srgb':
+        raise ValueError(f"Unsupported mixing space '{space}'")
+    return a * (1 - t) + b * t
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG 2.x relative luminance."""
+    return srgb_to_linear(rgb) @ _LUMINANCE
+
+
+def contrast_ratio(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """WCAG contrast ratio (1 to 21) between broadcastable color arrays."""
+    la = relative_luminance(a)
+    lb = relative_luminance(b)
+    return (np.maximum(la, lb) + 0.05) / (np.minimum(la, lb) + 0.05)
+
+
+def tonal_scale(rgb: np.ndarray) -> np.ndarray:
+    """
+    Derives the 50-900 tonal scale of each input color.
+    Returns an array shaped ``(..., len(TONE_STEPS), 3)``.
+    """
+    lch = rgb_to_oklch(rgb)[..., None, :]
+    tones = np.empty(lch.shape[:-2] + (len(TONE_STEPS), 3))
+    tones[..., 0] = TONE_LIGHTNESS
+    tones[..., 1] = lch[..., 1] * TONE_CHROMA
+    tones[..., 2] = lch[..., 2]
+    return oklch_to_rgb(tones)
+
+
+# --- Palette Helpers ---
+
+def batch_tonal_scales(palettes: Sequence[Palette]) -> List[Dict[str, Dict[int, str]]]:
+    """
+    Derives tonal scales for every named color of every palette in one pass.
+    Returns, per palette, a mapping of color name -> {step: hex}. Invalid colors are skipped.
+    """
+    owners, names, values = [], [], []
+    for i, palette in enumerate(palettes):
+        for name, value in palette.colors.items():
+            owners.append(i)
+            names.append(name)
+            values.append(value)
+
+    results: List[Dict[str, Dict[int, str]]] = [{} for _ in palettes]
+    if not values:
+        return results
+
+    rgb = parse_hex(values, strict=False)
+    valid = ~np.isnan(rgb).any(axis=-1)
+    hexes = to_hex(tonal_scale(rgb[valid]))
+
+    n_steps = len(TONE_STEPS)
+    for k, row in enumerate(np.flatnonzero(valid)):
+        chunk = hexes[k * n_steps:(k + 1) * n_steps]
+        results[owners[row]][names[row]] = dict(zip(TONE_STEPS, chunk))
+    return results
+
+
+def tonal_scales(palette: Palette) -> Dict[str, Dict[int, str]]:
+    """Tonal scales (50-900) for every color in `palette.colors`."""
+    return batch_tonal_scales([palette])[0]
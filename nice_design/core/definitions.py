@@ -62,6 +62,9 @@ class Texture:
     # Flags
     shadows_enabled: bool = True
 
+    # Low-power tier: the (cheaper) texture used instead on low-power clients
+    fallback: Optional[str] = None # texture name; None just drops blur/filter effects
+
 @dataclass
 class Typography:
     """
@@ -82,6 +85,7 @@ class Layout:
     name: str = "default"
     base_space: float = 1.0        # rem multiplier
     transition_speed: float = 0.3  # seconds
+    transition_properties: str = "all"  # animated properties, e.g. "background-color, color, box-shadow"
 
 @dataclass
 class Theme:
@@ -1,4 +1,5 @@
 from .definitions import Theme, Palette, Texture, Layout, Typography, CompiledTheme
+from .color import hex_to_rgb
 
 class ThemeEngine:
     def __init__(self):
@@ -37,12 +38,6 @@ class ThemeEngine:
         })
 
         # 4. Calculate Shadow Color and Values
-        def hex_to_rgb(hex_color):
-            h = hex_color.lstrip('#')
-            if len(h) == 3: h = ''.join([c*2 for c in h])
-            r, g, b = tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
-            return r, g, b
-
         r, g, b = hex_to_rgb(palette.shadow)
         # Store as comma-separated for potential direct use
         tokens['shadow-color'] = f"{r}, {g}, {b}"
@@ -0,0 +1,91 @@
+"""
+Metric-compatible fallback faces for local fonts.
+
+While a web font loads, text renders in a fallback font with different metrics,
+and the page reflows once the web font arrives. A fallback `@font-face` maps a
+local system font onto the web font's metrics (`size-adjust`, `ascent-override`,
+`descent-override`, `line-gap-override`), so the swap causes no layout shift:
+
+    @font-face { font-family: 'Milkshake Fallback'; src: local('Arial'); size-adjust: 104.2%; ... }
+    font-family: 'Milkshake', 'Milkshake Fallback', sans-serif;
+
+The metrics are read with a minimal sfnt parser (TTF/OTF and WOFF 1.0; no
+dependencies). Fonts it cannot read (WOFF2, corrupt files) get no fallback.
+"""
+import struct
+import zlib
+from collections import namedtuple
+from typing import Dict, Optional
+
+FontMetrics = namedtuple('FontMetrics', 'units_per_em ascender descender line_gap avg_char_width')
+
+# Metrics of the system fonts used as fallbacks (with their metric-compatible alternates)
+SYSTEM_FALLBACKS = {
+    'sans-serif': (("Arial", "Liberation Sans", "Arimo"), FontMetrics(2048, 1854, -434, 67, 904)),
+    'serif': (("Times New Roman", "Liberation Serif", "Tinos"), FontMetrics(2048, 1825, -443, 87, 821)),
+    'monospace': (("Courier New", "Liberation Mono", "Cousine"), FontMetrics(2048, 1705, -615, 0, 1229)),
+}
+
+
+def _sfnt_tables(data: bytes) -> Dict[bytes, bytes]:
+    """The raw tables of a TTF/OTF or WOFF 1.0 file."""
+    tables = {}
+    signature = data[:4]
+    if signature == b'wOFF':
+        num_tables = struct.unpack_from('>H', data, 12)[0]
+        for i in range(num_tables):
+            tag, offset, comp_length, orig_length, _ = struct.unpack_from('>4sIIII', data, 44 + 20 * i)
+            table = data[offset:offset + comp_length]
+            tables[tag] = zlib.decompress(table) if comp_length < orig_length else table
+    elif signature in (b'\x00\x01\x00\x00', b'OTTO', b'true'):
+        num_tables = struct.unpack_from('>H', data, 4)[0]
+        for i in range(num_tables):
+            tag, _, offset, length = struct.unpack_from('>4sIII', data, 12 + 16 * i)
+            tables[tag] = data[offset:offset + length]
+    return tables
+
+
+def read_metrics(data: bytes) -> Optional[FontMetrics]:
+    """Vertical metrics (hhea) and average width (OS/2) of a font file, or None if unreadable."""
+    try:
+        tables = _sfnt_tables(data)
+        head, hhea = tables.get(b'head'), tables.get(b'hhea')
+        if not head or not hhea:
+            return None
+        units_per_em = struct.unpack_from('>H', head, 18)[0]
+        ascender, descender, line_gap = struct.unpack_from('>hhh', hhea, 4)
+        os2 = tables.get(b'OS/2')
+        avg_char_width = struct.unpack_from('>h', os2, 2)[0] if os2 else 0
+    except (struct.error, zlib.error):
+        return None
+    if not 16 <= units_per_em <= 16384 or ascender <= 0:
+        return None
+    return FontMetrics(units_per_em, ascender, descender, line_gap, avg_char_width)
+
+
+def _percent(value: float) -> str:
+    return f'{value * 100:.2f}%'
+
+
+def fallback_font_face(family: str, metrics: FontMetrics, generic: str = 'sans-serif') -> str:
+    """The `@font-face` rule of '<family> Fallback': a system font adjusted to `metrics`."""
+    local_names, system = SYSTEM_FALLBACKS.get(generic, SYSTEM_FALLBACKS['sans-serif'])
+    size_adjust = 1.0
+    if metrics.avg_char_width > 0:
+        size_adjust = (metrics.avg_char_width / metrics.units_per_em) / (system.avg_char_width / system.units_per_em)
+    em = metrics.units_per_em * size_adjust
+    src = ', '.join(f"local('{name}')" for name in local_names)
+    return f"""
+                    @font-face {{
+                        font-family: '{fallback_family(family)}';
+                        src: {src};
+                        size-adjust: {_percent(size_adjust)};
+                        ascent-override: {_percent(metrics.ascender / em)};
+                        descent-override: {_percent(abs(metrics.descender) / em)};
+                        line-gap-override: {_percent(metrics.line_gap / em)};
+                    }}
+                    """
+
+
+def fallback_family(family: str) -> str:
+    return f'{family} Fallback'
@@ -0,0 +1,138 @@
+"""
+Build step for local font files: WOFF2 conversion and unicode-range subsetting.
+
+Each font is split into the subsets below (only those it has glyphs for) and
+saved as WOFF2 in a cache folder keyed by the file's content hash, so a font is
+only processed once. The `@font-face` rules then reference one file per subset
+with its `unicode-range`: browsers only download the subsets a page renders
+(usually just 'latin').
+
+Opt-in (`load_design_system(optimize_fonts=True)`) and requires the optional
+`fonts` extra (fontTools + brotli); without it, or when a font cannot be parsed,
+the original file is served as-is.
+
+    pip install nice_design[fonts]
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..instrumentation import span
+
+try:
+    from fontTools.ttLib import TTFont
+    from fontTools.subset import Options, Subsetter
+    import brotli  # noqa: F401 (required by fontTools for WOFF2)
+    HAS_FONTTOOLS = True
+except ImportError:
+    HAS_FONTTOOLS = False
+
+# URL under which the cache folder is served (see load_design_system)
+FONT_CACHE_ROUTE = '/nd_fonts'
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'nice_design' / 'fonts'
+
+# Subsets in the order they are declared (the same split as Google Fonts)
+UNICODE_RANGES: Dict[str, str] = {
+    'latin': 'U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+0304, U+0308, '
+             'U+0329, U+2000-206F, U+20AC, U+2122, U+2191, U+2193, U+2212, U+2215, U+FEFF, U+FFFD',
+    'latin-ext': 'U+0100-02BA, U+02BD-02C5, U+02C7-02CC, U+02CE-02D7, U+02DD-02FF, U+0304, U+0308, U+0329, '
+                 'U+1D00-1DBF, U+1E00-1E9F, U+1EF2-1EFF, U+2020, U+20A0-20AB, U+20AD-20C0, U+2113, '
+                 'U+2C60-2C7F, U+A720-A7FF',
+    'cyrillic': 'U+0301, U+0400-045F, U+0490-0491, U+04B0-04B1, U+2116',
+    'greek': 'U+0370-0377, U+037A-037F, U+0384-038A, U+038C, U+038E-03A1, U+03A3-03FF',
+    'vietnamese': 'U+0102-0103, U+0110-0111, U+0128-0129, U+0168-0169, U+01A0-01A1, U+01AF-01B0, U+0300-0301, '
+                  'U+0303-0304, U+0308-0309, U+0323, U+0329, U+1EA0-1EF9, U+20AB',
+}
+
+
+@dataclass
+class FontSubset:
+    """One WOFF2 file of an optimized font."""
+    name: str           # key of UNICODE_RANGES
+    url: str
+    unicode_range: str
+
+
+def parse_unicode_range(value: str) -> List[int]:
+    """Code points of a CSS `unicode-range` value ('U+0000-00FF, U+0131, ...')."""
+    points: List[int] = []
+    for part in value.split(','):
+        part = part.strip()[2:]  # drop 'U+'
+        if '-' in part:
+            start, end = part.split('-')
+            points.extend(range(int(start, 16), int(end, 16) + 1))
+        elif part:
+            points.append(int(part, 16))
+    return points
+
+
+def content_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def _subset(path: Path, unicodes: List[int], target: Path):
+    font = TTFont(str(path))
+    options = Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    subsetter = Subsetter(options=options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+    font.flavor = 'woff2'
+    font.save(str(target))
+
+
+def _build(path: Path, folder: Path) -> List[Tuple[str, str]]:
+    """Writes the subsets of a font into `folder`. Returns (subset name, file name) pairs."""
+    font = TTFont(str(path), lazy=True)
+    covered = set(font.getBestCmap() or {})
+    font.close()
+
+    folder.mkdir(parents=True, exist_ok=True)
+    built = []
+    for name, unicode_range in UNICODE_RANGES.items():
+        unicodes = [u for u in parse_unicode_range(unicode_range) if u in covered]
+        if not unicodes:
+            continue
+        file_name = f'{path.stem}.{name}.woff2'
+        _subset(path, unicodes, folder / file_name)
+        built.append((name, file_name))
+    return built
+
+
+def optimize_font(path: Path, cache_dir: Path = DEFAULT_CACHE_DIR) -> Optional[List[FontSubset]]:
+    """
+    The WOFF2 subsets of a font file, built on first use and cached under
+    `cache_dir/<content hash>/`. Returns None when the file should be served as-is
+    (fontTools not installed, or the font could not be processed).
+    """
+    if not HAS_FONTTOOLS:
+        return None
+    path = Path(path)
+    digest = content_hash(path)
+    folder = Path(cache_dir) / digest
+    manifest = folder / 'manifest.json'
+
+    with span('font_pipeline.optimize', path=path.name) as s:
+        if manifest.exists():
+            built = json.loads(manifest.read_text())
+            s.set('cached', True)
+        else:
+            try:
+                built = _build(path, folder)
+            except Exception as e:
+                # Remembered (empty manifest) so the same file is not retried on every discovery
+                print(f"Failed to optimize font {path.name}, serving the original file: {e}")
+                built = []
+            folder.mkdir(parents=True, exist_ok=True)
+            manifest.write_text(json.dumps(built))
+            s.set('cached', False)
+
+    if not built:
+        return None
+    return [FontSubset(name=name, url=f'{FONT_CACHE_ROUTE}/{digest}/{file_name}', unicode_range=UNICODE_RANGES[name])
+            for name, file_name in built]
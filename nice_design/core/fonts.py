@@ -1,7 +1,12 @@
 import os
+import json
+import weakref
 from pathlib import Path
-from typing import List, Dict
-from nicegui import ui, app
+from typing import List, Dict, Iterable, Optional
+from nicegui import app, context
+from .definitions import Typography
+from .utils import add_head_html
+from ..instrumentation import span
 
 # A curated list of popular Google Fonts. 
 # In a real-world app, this could be fetched from Google Fonts API or a static JSON.
@@ -40,31 +45,163 @@ MORE_GOOGLE_FONTS = [
 
 ALL_GOOGLE_FONTS = sorted(list(set(GOOGLE_FONTS + MORE_GOOGLE_FONTS)))
 
+FONT_DISPLAY_VALUES = ('auto', 'block', 'swap', 'fallback', 'optional')
+
+
+def font_family_name(font_stack: str) -> str:
+    """The first family of a CSS font stack, e.g. "'Inter', sans-serif" -> 'Inter'."""
+    return font_stack.split(',')[0].strip().strip('\'"')
+
+
+def _google_font_id(family: str) -> str:
+    return f"font-{family.lower().replace(' ', '-')}"
+
+
+def _load_font_js(family: str, timeout: float) -> str:
+    """Resolves with the load time (ms) once `family` is usable, or null after `timeout`."""
+    return f'''
+        const start = performance.now();
+        const link = document.getElementById({json.dumps(_google_font_id(family))});
+        let faces = [];
+        const load = (async () => {{
+            // A Google font is only declared once its stylesheet has arrived
+            if (link && !link.sheet) {{
+                await new Promise((resolve) => {{
+                    link.addEventListener("load", resolve, {{ once: true }});
+                    link.addEventListener("error", resolve, {{ once: true }});
+                }});
+            }}
+            faces = await document.fonts.load({json.dumps(f'1em "{family}"')});
+        }})();
+        await Promise.race([load, new Promise((resolve) => setTimeout(resolve, {int(timeout * 1000)}))]);
+        return faces.length ? performance.now() - start : null;
+    '''
+
+
 class FontManager:
-    _loaded_fonts = set()
+    """
+    Injects fonts into the current client only when they are used or previewed:
+    @font-face rules of local font files and Google Fonts stylesheets, each once
+    per client. `font_display` is the `font-display` strategy of both.
+    """
+    font_display: str = 'swap'
+    _client_fonts = weakref.WeakKeyDictionary()  # client -> families already injected
+    _client_preloads = weakref.WeakKeyDictionary()  # client -> URLs already preloaded
+    _client_loaded = weakref.WeakKeyDictionary()  # client -> families awaited with ensure_loaded
+
+    @staticmethod
+    def configure(font_display: str = 'swap'):
+        """Sets the `font-display` strategy ('auto', 'block', 'swap', 'fallback' or 'optional')."""
+        if font_display not in FONT_DISPLAY_VALUES:
+            raise ValueError(f"Invalid font-display '{font_display}', expected one of {FONT_DISPLAY_VALUES}")
+        FontManager.font_display = font_display
 
     @staticmethod
     def load_font(font_name: str):
-        """Injects the Google Font CSS into the head if it's a Google Font."""
-        if font_name in ALL_GOOGLE_FONTS and font_name not in FontManager._loaded_fonts:
-            # Prepare URL (replace spaces with +)
-            url_name = font_name.replace(" ", "+")
-            url = f"https://fonts.googleapis.com/css2?family={url_name}:wght@100;200;300;400;500;600;700;800;900&display=swap"
-            font_id = f"font-{url_name.lower().replace('+', '-')}"
-            
-            # Using run_javascript to ensure it's injected even after page load
-            ui.run_javascript(f'''
-                if (!document.getElementById("{font_id}")) {{
-                    const link = document.createElement("link");
-                    link.id = "{font_id}";
-                    link.href = "{url}";
-                    link.rel = "stylesheet";
-                    document.head.appendChild(link);
-                    console.log("Loaded Google Font: {font_name}");
-                }}
-            ''')
-            FontManager._loaded_fonts.add(font_name)
-            
+        """Injects a local or Google font into the current client (once)."""
+        FontManager.ensure_fonts([font_name])
+
+    @staticmethod
+    def ensure_fonts(families: Iterable[str], preload: Optional[str] = None) -> int:
+        """
+        Injects the given font families into the current client, skipping the ones it
+        already has and families that are neither local files nor Google Fonts
+        (e.g. 'sans-serif'). `preload` additionally adds a `<link rel=preload>` for
+        that family's file (or a preconnect for a Google font), for the active main font.
+        Returns the number of families injected.
+        """
+        # Import here to avoid circular dependency
+        import nice_design as nice
+
+        client = context.client
+        sent = FontManager._client_fonts.setdefault(client, set())
+        injected = 0
+        for family in families:
+            if family in sent:
+                continue
+            css = nice.registry.get_font_css(family, display=FontManager.font_display)
+            if css:
+                add_head_html(f'<style id="nd-font-{family.lower()}">{css}</style>')
+            elif family in ALL_GOOGLE_FONTS:
+                url_name = family.replace(" ", "+")
+                url = (f"https://fonts.googleapis.com/css2?family={url_name}:wght@100;200;300;400;500;600;700;800;900"
+                       f"&display={FontManager.font_display}")
+                add_head_html(f'<link id="{_google_font_id(family)}" href="{url}" rel="stylesheet">')
+            else:
+                continue
+            sent.add(family)
+            injected += 1
+
+        if preload:
+            FontManager._preload(client, preload)
+        return injected
+
+    @staticmethod
+    def is_web_font(family: str) -> bool:
+        """True for local font files and Google Fonts (not for system/generic families)."""
+        import nice_design as nice
+
+        return nice.registry.get_font_file(family) is not None or family in ALL_GOOGLE_FONTS
+
+    @staticmethod
+    def is_loaded(family: str) -> bool:
+        """True if `ensure_loaded` already waited for this family on the current client."""
+        return family in FontManager._client_loaded.get(context.client, ())
+
+    @staticmethod
+    async def ensure_loaded(family: str, timeout: float = 3.0) -> Optional[float]:
+        """
+        Injects a font (see ensure_fonts) and waits until the browser has loaded it,
+        via the FontFace API (`document.fonts.load`). Returns the load time measured in
+        the browser (ms), or None if it did not load within `timeout` seconds or is not
+        a web font. Each wait is reported as a 'fonts.load' span.
+        """
+        if not FontManager.is_web_font(family):
+            return None
+        client = context.client
+        FontManager.ensure_fonts([family])
+        with span('fonts.load', family=family) as s:
+            s.incr('run_javascript')
+            try:
+                load_ms = await client.run_javascript(_load_font_js(family, timeout), timeout=timeout + 1.0)
+            except TimeoutError:
+                load_ms = None
+            s.set('load_ms', load_ms)
+        # Remembered even on timeout, so a slow font only delays the first swap
+        FontManager._client_loaded.setdefault(client, set()).add(family)
+        return load_ms
+
+    @staticmethod
+    def _preload(client, family: str):
+        import nice_design as nice
+
+        preloaded = FontManager._client_preloads.setdefault(client, set())
+        font_file = nice.registry.get_font_file(family)
+        if font_file:
+            url, fmt = font_file
+            mime = {'truetype': 'ttf', 'opentype': 'otf'}.get(fmt, fmt)
+            link = f'<link rel="preload" href="{url}" as="font" type="font/{mime}" crossorigin>'
+        elif family in ALL_GOOGLE_FONTS:
+            # The font file URL is only known from Google's stylesheet: warm up the connection instead
+            url = 'https://fonts.gstatic.com'
+            link = f'<link rel="preconnect" href="{url}" crossorigin>'
+        else:
+            return
+        if url not in preloaded:
+            preloaded.add(url)
+            add_head_html(link)
+
+    @staticmethod
+    def typography_families(typography: Typography) -> List[str]:
+        """The main and secondary families of a typography."""
+        return [font_family_name(typography.font_main), font_family_name(typography.font_secondary)]
+
+    @staticmethod
+    def ensure_typography(typography: Typography) -> int:
+        """Injects the main and secondary fonts of a typography, preloading the main one."""
+        families = FontManager.typography_families(typography)
+        return FontManager.ensure_fonts(families, preload=families[0])
+
     @staticmethod
     def get_font_options(local_fonts: List[str]):
         """Returns a combined list of local and google fonts for the select component."""
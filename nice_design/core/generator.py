@@ -0,0 +1,147 @@
+"""
+Seed-color palette generator.
+Builds complete dark and light Palettes from one or two brand colors.
+"""
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .definitions import Palette
+from .color import parse_hex, to_hex, rgb_to_oklch, oklch_to_rgb, contrast_ratio
+from .validation import fix_contrast
+
+# OKLCH hues of the 8 named colors (same order as the shipped palettes)
+NAMED_HUES: Dict[str, float] = {
+    'yellow': 95.0,
+    'orange': 55.0,
+    'red': 27.0,
+    'magenta': 350.0,
+    'violet': 300.0,
+    'blue': 255.0,
+    'cyan': 210.0,
+    'green': 145.0,
+}
+
+STATUS_HUES: Dict[str, float] = {
+    'success': 145.0,
+    'error': 27.0,
+    'warning': 85.0,
+    'info': 250.0,
+}
+
+# Per-mode lightness targets
+_MODE_TONES = {
+    'dark': {
+        'accent': 0.72, 'status': 0.72,
+        'surface_base': 0.17, 'surface_layer': 0.21, 'surface_overlay': 0.26,
+        'content_main': 0.96, 'content_muted': 0.80, 'content_subtle': 0.62,
+        'highlight': 0.92, 'shadow': 0.0,
+    },
+    'light': {
+        'accent': 0.60, 'status': 0.58,
+        'surface_base': 0.98, 'surface_layer': 1.0, 'surface_overlay': 0.94,
+        'content_main': 0.24, 'content_muted': 0.42, 'content_subtle': 0.58,
+        'highlight': 1.0, 'shadow': 0.35,
+    },
+}
+
+_NEUTRAL_CHROMA = 0.015
+_ON_PAIRS = (
+    ('primary', 'on_primary'),
+    ('secondary', 'on_secondary'),
+    ('success', 'on_success'),
+    ('error', 'on_error'),
+    ('warning', 'on_warning'),
+    ('info', 'on_info'),
+)
+
+
+def _mode_lch(mode: str, primary: np.ndarray, secondary: np.ndarray) -> Tuple[list, np.ndarray]:
+    """Returns the role names and their OKLCH values for one mode."""
+    tones = _MODE_TONES[mode]
+    hue = primary[2]
+    chroma = float(np.clip(primary[1], 0.08, 0.18))
+
+    roles, lch = [], []
+
+    def add(role, l, c, h):
+        roles.append(role)
+        lch.append((l, c, h))
+
+    # Accents keep the seed in light mode; in dark mode they are lifted for legibility
+    for role, seed in (('primary', primary), ('secondary', secondary)):
+        l = seed[0] if mode == 'light' else max(seed[0], tones['accent'])
+        add(role, l, seed[1], seed[2])
+
+    for name, h in NAMED_HUES.items():
+        add(f'colors.{name}', tones['accent'], chroma, h)
+    for name, h in STATUS_HUES.items():
+        add(name, tones['status'], max(chroma, 0.12), h)
+
+    for role in ('surface_base', 'surface_layer', 'surface_overlay'):
+        add(role, tones[role], _NEUTRAL_CHROMA, hue)
+    for role in ('content_main', 'content_muted', 'content_subtle'):
+        add(role, tones[role], _NEUTRAL_CHROMA, hue)
+
+    add('highlight', tones['highlight'], _NEUTRAL_CHROMA if mode == 'dark' else 0.0, hue)
+    add('shadow', tones['shadow'], _NEUTRAL_CHROMA if mode == 'light' else 0.0, hue)
+    return roles, np.array(lch)
+
+
+@lru_cache(maxsize=4096)
+def _generate(primary: str, secondary: Optional[str]) -> Dict[str, Dict[str, str]]:
+    """Computes mode -> role -> hex for a (normalized) seed pair. Cached."""
+    seeds = parse_hex([primary] + ([secondary] if secondary else []))
+    seed_lch = rgb_to_oklch(seeds)
+    p_lch = seed_lch[0]
+    if secondary:
+        s_lch = seed_lch[1]
+    else:
+        s_lch = np.array([p_lch[0], p_lch[1], (p_lch[2] + 150) % 360])
+
+    # 1. All base roles of both modes in one conversion
+    layout = {mode: _mode_lch(mode, p_lch, s_lch) for mode in ('dark', 'light')}
+    stacked = np.concatenate([lch for _, lch in layout.values()])
+    hexes = to_hex(oklch_to_rgb(stacked))
+
+    result, offset = {}, 0
+    for mode, (roles, lch) in layout.items():
+        result[mode] = dict(zip(roles, hexes[offset:offset + len(roles)]))
+        offset += len(roles)
+
+    # 2. on_* colors: tinted light or dark text, corrected to reach WCAG AA
+    modes = list(result)
+    bg = parse_hex([result[m][role] for m in modes for role, _ in _ON_PAIRS])
+    tinted = oklch_to_rgb(np.array([[0.98, _NEUTRAL_CHROMA, p_lch[2]], [0.22, _NEUTRAL_CHROMA, p_lch[2]]]))
+    use_light = contrast_ratio(bg, tinted[0]) >= contrast_ratio(bg, tinted[1])
+    fg = np.where(use_light[:, None], tinted[0], tinted[1])
+    on_hexes = to_hex(fix_contrast(bg, fg, 4.5))
+
+    for i, (mode, (_, on_role)) in enumerate((m, pair) for m in modes for pair in _ON_PAIRS):
+        result[mode][on_role] = on_hexes[i]
+    return result
+
+
+def _normalize(color: str) -> str:
+    return to_hex(parse_hex([color]))[0]
+
+
+def generate_palettes(name: str, primary: str, secondary: Optional[str] = None) -> Dict[str, Palette]:
+    """
+    Generates the 'dark' and 'light' variants of a palette from one or two seed colors.
+    Results are cached by seed, so repeated calls only build the Palette objects.
+    """
+    values = _generate(_normalize(primary), _normalize(secondary) if secondary else None)
+
+    palettes = {}
+    for mode, roles in values.items():
+        colors = {key.split('.', 1)[1]: value for key, value in roles.items() if key.startswith('colors.')}
+        fields = {key: value for key, value in roles.items() if not key.startswith('colors.')}
+        palettes[mode] = Palette(name=name, mode=mode, colors=colors, **fields)
+    return palettes
+
+
+def generate_palette(name: str, primary: str, secondary: Optional[str] = None, mode: str = 'dark') -> Palette:
+    """Generates a single palette variant from one or two seed colors."""
+    return generate_palettes(name, primary, secondary)[mode]
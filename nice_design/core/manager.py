@@ -1,8 +1,144 @@
-from typing import Optional
-from nicegui import ui
+from typing import Optional, Dict, List, Callable, Any, Iterable, Set, Tuple
+from nicegui import ui, context, background_tasks
+import asyncio
 import json
-from .definitions import Theme
-from .styles import generate_theme_css
+import weakref
+from .definitions import Theme, Palette, Texture
+from .styles import generate_theme_css, generate_bundle_css, split_rules
+from .fonts import FontManager
+from .utils import run_javascript, add_head_html
+from ..instrumentation import span
+
+def mode_js(mode: str, prefix: str = 'nd') -> str:
+    """Client-side snippet selecting 'light', 'dark' or 'auto' (follow the OS) via data-nd-mode."""
+    return f'document.documentElement.setAttribute("data-{prefix}-mode", {json.dumps(mode)})'
+
+def bundle_js(name: str) -> str:
+    """Client-side snippet switching to a precompiled bundle (see ThemeManager.enable_bundle_switching)."""
+    return f'window.ndSwitchBundle && window.ndSwitchBundle({json.dumps(name)})'
+
+# Client-side half of apply_theme, installed once per page. Takes the compact payload
+# {prefix, rules | delta, classes, low_power_classes, mode, instant}: the theme CSS lives in a constructable stylesheet
+# (document.adoptedStyleSheets) updated in place (`delta` maps rule indexes to new rules),
+# with a <style id="nd-dynamic-theme"> fallback for browsers without it.
+_JS_APPLY_THEME = '''
+    window.ndUpdateThemeSheet = (delta) => {
+        const rules = window.ndThemeRules;
+        if (!window.ndThemeSheet && "adoptedStyleSheets" in document && "replaceSync" in CSSStyleSheet.prototype) {
+            try {
+                window.ndThemeSheet = new CSSStyleSheet();
+                document.adoptedStyleSheets = [...document.adoptedStyleSheets, window.ndThemeSheet];
+                document.getElementById("nd-dynamic-theme")?.remove();
+            } catch (e) {
+                window.ndThemeSheet = null;
+            }
+        }
+        const sheet = window.ndThemeSheet;
+        if (!sheet) {
+            let style = document.getElementById("nd-dynamic-theme");
+            if (!style) {
+                style = document.createElement("style");
+                style.id = "nd-dynamic-theme";
+                document.head.appendChild(style);
+            }
+            style.textContent = rules.join("\\n");
+            return;
+        }
+        // Rule indexes only line up if the browser kept every rule
+        if (delta && sheet.cssRules.length === rules.length) {
+            try {
+                for (const [i, rule] of Object.entries(delta)) {
+                    sheet.deleteRule(+i);
+                    sheet.insertRule(rule, +i);
+                }
+                return;
+            } catch (e) {}
+        }
+        sheet.replaceSync(rules.join("\\n"));
+    };
+    window.ndApplyTheme = (t) => {
+        const root = document.documentElement;
+        if (t.instant) {
+            // No transitions until the new theme has been rendered once
+            root.classList.add("nd-theme-switching");
+            requestAnimationFrame(() => requestAnimationFrame(() => root.classList.remove("nd-theme-switching")));
+        }
+        if (t.rules) {
+            window.ndThemeRules = t.rules;
+            window.ndUpdateThemeSheet(null);
+        } else if (t.delta) {
+            Object.entries(t.delta).forEach(([i, rule]) => window.ndThemeRules[+i] = rule);
+            window.ndUpdateThemeSheet(t.delta);
+        }
+        root.removeAttribute(`data-${t.prefix}-theme`);
+        [...root.style].filter(name => name.startsWith(`--${t.prefix}-`)).forEach(name => root.style.removeProperty(name));
+        window.ndLowPower.classes = t.classes;
+        window.ndLowPower.fallbackClasses = t.low_power_classes;
+        window.ndApplyBodyClasses();
+        if (t.mode) root.setAttribute(`data-${t.prefix}-mode`, t.mode);
+    };
+    window.ndApplyBodyClasses = () => {
+        const lp = window.ndLowPower;
+        [...document.body.classList].forEach(cls => {
+            if (cls.startsWith('-nd-t-') || cls.startsWith('texture-') || cls === 'no-shadows' || cls.startsWith('mode-')) {
+                document.body.classList.remove(cls);
+            }
+        });
+        ((lp.active && lp.fallbackClasses) || lp.classes).forEach(cls => document.body.classList.add(cls));
+        document.body.classList.toggle("nd-low-power", lp.active);
+    };
+    // Low-power tier: a server policy (true/false) or the client's own signals ('auto')
+    window.ndLowPower = {policy: "auto", signal: false, slow: false, active: false, classes: [], fallbackClasses: null};
+    window.ndSetLowPower = (policy) => {
+        const lp = window.ndLowPower;
+        lp.policy = policy;
+        lp.active = policy === "auto" ? lp.signal : policy;
+        if (document.body) window.ndApplyBodyClasses();
+    };
+    window.ndInitLowPower = (policy, minFps) => {
+        const signal = (on) => {
+            window.ndLowPower.signal = on;
+            if (window.ndLowPower.policy === "auto") window.ndSetLowPower("auto");
+        };
+        const transparency = window.matchMedia && window.matchMedia("(prefers-reduced-transparency: reduce)");
+        if (transparency) {
+            transparency.addEventListener("change", (e) => signal(e.matches || window.ndLowPower.slow));
+            if (transparency.matches) window.ndLowPower.signal = true;
+        }
+        if (minFps > 0) {
+            // Count frames for a second; hidden tabs do not render, so those samples are discarded
+            let frames = 0, start = performance.now();
+            const count = (now) => {
+                if (document.hidden) { frames = 0; start = now; }
+                else frames++;
+                if (now - start < 1000) return requestAnimationFrame(count);
+                window.ndLowPower.slow = frames * 1000 / (now - start) < minFps;
+                if (window.ndLowPower.slow) signal(true);
+            };
+            requestAnimationFrame(count);
+        }
+        window.ndSetLowPower(policy);
+    };
+'''
+
+# Values of ThemeManager.configure_low_power
+LOW_POWER_POLICIES = ('auto', 'on', 'off')
+
+# Removes the body classes owned by the theme system (textures, shadows, modes)
+_JS_CLEAR_BODY_CLASSES = '''
+    [...document.body.classList].forEach(cls => {
+        if (cls.startsWith('-nd-t-') || cls.startsWith('texture-') || cls === 'no-shadows' || cls.startsWith('mode-')) {
+            document.body.classList.remove(cls);
+        }
+    });
+'''
+
+def _clear_variables_js(prefix: str = 'nd') -> str:
+    """Client-side snippet dropping the inline variable overrides of `set_variable`, so a stylesheet takes over again."""
+    return f'''
+        [...document.documentElement.style].filter(name => name.startsWith("--{prefix}-"))
+            .forEach(name => document.documentElement.style.removeProperty(name));
+    '''
 
 class ThemeManager:
     """
@@ -10,69 +146,314 @@ class ThemeManager:
     Handles theme application, dynamic CSS injection, and global component defaults.
     """
     def __init__(self):
-        self.current_theme: Optional[Theme] = None
+        self._default_theme: Tuple[Optional[Theme], Optional[Palette]] = (None, None)
+        self._client_themes: 'weakref.WeakKeyDictionary[Any, Tuple[Theme, Optional[Palette]]]' = weakref.WeakKeyDictionary()
+        self._client_bundles: 'weakref.WeakKeyDictionary[Any, Dict[str, Any]]' = weakref.WeakKeyDictionary()
+        self._bundle_css_cache: Dict[tuple, str] = {}
+        self._client_textures: 'weakref.WeakKeyDictionary[Any, Set[str]]' = weakref.WeakKeyDictionary()
+        self._client_applies: 'weakref.WeakKeyDictionary[Any, int]' = weakref.WeakKeyDictionary()
+        self._client_runtime: 'weakref.WeakSet[Any]' = weakref.WeakSet()
+        self._client_rules: 'weakref.WeakKeyDictionary[Any, List[str]]' = weakref.WeakKeyDictionary()
+        self._client_low_power: 'weakref.WeakKeyDictionary[Any, Any]' = weakref.WeakKeyDictionary()
+        self._client_variables: 'weakref.WeakKeyDictionary[Any, Dict[str, str]]' = weakref.WeakKeyDictionary()
+        self.low_power_policy = 'auto'
+        self.low_power_min_fps = 30
         
-    def apply_theme(self, theme: Theme):
+    @property
+    def current_theme(self) -> Optional[Theme]:
+        """The theme last applied on the current client (or at startup, outside of any page)."""
+        return self._current()[0]
+
+    @property
+    def current_alternate(self) -> Optional[Palette]:
+        """The alternate palette compiled along with `current_theme`."""
+        return self._current()[1]
+
+    def _current(self) -> Tuple[Optional[Theme], Optional[Palette]]:
+        try:
+            client = context.client
+        except RuntimeError:
+            return self._default_theme
+        return self._client_themes.get(client, self._default_theme)
+
+    def _set_current(self, theme: Theme, alternate: Optional[Palette]):
+        from nicegui import core
+        if core.loop and core.loop.is_running():
+            self._client_themes[context.client] = (theme, alternate)
+        else:
+            self._default_theme = (theme, alternate)
+
+    def apply_theme(self, theme: Theme, alternate: Optional[Palette] = None, mode: Optional[str] = None,
+                    wait_for_fonts: bool = False, font_timeout: float = 3.0, instant: bool = False):
         """
         Generates and injects the theme's CSS variables and utility classes.
         Also establishes the 'Variable Bridge' to Quasar and handles body classes.
-        """
-        self.current_theme = theme
-        p = theme.prefix
-        pal = theme.palette
-        
-        # 2. Quasar Color Integration
-        ui.colors(
-            primary=pal.primary,
-            secondary=pal.secondary,
-            accent=pal.highlight,
-            positive=pal.success,
-            negative=pal.error,
-            warning=pal.warning,
-            info=pal.info
-        )
-        core_css = generate_theme_css(theme)
-        full_css = core_css
-        
-        # 3. Dynamic Style Update
-        css_json = json.dumps(full_css)
-        js_apply_css = f'''
-            let style = document.getElementById("nd-dynamic-theme");
-            if (!style) {{
-                style = document.createElement("style");
-                style.id = "nd-dynamic-theme";
-                document.head.appendChild(style);
-            }}
-            style.textContent = {css_json};
-        '''
-        
-        # 4. Handle Body Classes (for Textures and Mode)
-        classes = [theme.texture.texture_cls]
-        if not theme.texture.shadows_enabled:
-            classes.append('no-shadows')
-            
-        classes_json = json.dumps(classes)
-        js_apply_classes = f'''
-            const body = document.body;
-            body.classList.forEach(cls => {{
-                if (cls.startsWith('texture-') || cls === 'no-shadows' || cls.startsWith('mode-')) {{
-                    body.classList.remove(cls);
-                }}
-            }});
-            {classes_json}.forEach(cls => body.classList.add(cls));
-        '''
+        Everything is sent as one compact JSON payload to `window.ndApplyTheme`,
+        which is installed on the page along with the first theme. After the first
+        apply, only the CSS rules that changed since the client's last theme are sent.
 
+        Args:
+            alternate: The theme palette's variant in the other mode. Both are compiled into
+                one stylesheet so light/dark follows `prefers-color-scheme` (or `data-nd-mode`)
+                entirely in the browser.
+            mode: Optionally sets `data-nd-mode` ('light', 'dark' or 'auto') along with the theme.
+            wait_for_fonts: Apply the theme only once the browser has loaded its web fonts
+                (at most `font_timeout` seconds, see FontManager.ensure_loaded), so the page
+                does not flash the fallback font. A theme applied in the meantime wins.
+            instant: Swap without transitions: they are disabled (`nd-theme-switching` class
+                on the root element) until the new theme has been rendered, instead of every
+                element animating to its new colors for `Layout.transition_speed`.
+        """
         from nicegui import core
         if core.loop and core.loop.is_running():
-            ui.run_javascript(js_apply_css)
-            ui.run_javascript(js_apply_classes)
-        else:
-            # During startup, inject via head HTML to ensure it's present on first load
-            ui.add_head_html(f'<style id="nd-dynamic-theme">{full_css}</style>')
-            # For classes, we can't easily target 'body' directly via add_head_html before it exists,
-            # but we can inject a script that runs on load.
-            ui.add_head_html(f'<script>document.addEventListener("DOMContentLoaded", () => {{ {js_apply_classes} }});</script>')
-        
+            client = context.client
+            seq = self._client_applies[client] = self._client_applies.get(client, 0) + 1
+            if wait_for_fonts:
+                pending = [f for f in FontManager.typography_families(theme.typography)
+                           if FontManager.is_web_font(f) and not FontManager.is_loaded(f)]
+                if pending:
+                    background_tasks.create(
+                        self._apply_when_loaded(client, seq, pending, font_timeout, theme, alternate, mode, instant),
+                        name='nd_apply_theme')
+                    return
+
+        with span('apply_theme', theme=theme.name, mode=mode) as s:
+            self._set_current(theme, alternate)
+            # 1. Compile
+            with span('apply_theme.compile'):
+                payload = self.build_payload(theme, alternate, mode)
+
+            # 2. Diff against the rules the client already has
+            client = context.client
+            rules = split_rules(payload['css'])
+            message = {k: v for k, v in payload.items() if k != 'css'}
+            if instant:
+                message['instant'] = True
+            previous = self._client_rules.get(client)
+            if previous is not None and len(previous) == len(rules):
+                message['delta'] = {i: rule for i, (old, rule) in enumerate(zip(previous, rules)) if old != rule}
+            else:
+                message['rules'] = rules
+            s.set('css_bytes', len(payload['css']))
+            s.set('rules_sent', len(message.get('delta', rules)))
+
+            # 3. One client call, preceded by the runtime on first use
+            # (Quasar's brand colors are mapped to the theme variables in the CSS)
+            runtime = '' if client in self._client_runtime else self._runtime_js(client)
+            self._client_runtime.add(client)
+
+            if core.loop and core.loop.is_running():
+                with span('apply_theme.json_encode'):
+                    message_json = json.dumps(message, separators=(',', ':'))
+                run_javascript(f'{runtime}window.ndApplyTheme({message_json});')
+                self._client_rules[client] = rules
+                self._client_variables.pop(client, None)  # ndApplyTheme drops the overrides
+            else:
+                # During startup, inject via head HTML to ensure it's present on first load;
+                # the body classes are applied once the body exists
+                add_head_html(f'<style id="nd-dynamic-theme">{payload["css"]}</style>')
+                rest = json.dumps({k: v for k, v in payload.items() if k != 'css'})
+                add_head_html(f'<script>{runtime}document.addEventListener("DOMContentLoaded", () => window.ndApplyTheme({rest}));</script>')
+
+            # 4. Texture CSS (and its low-power fallback's), on first use per client
+            texture_classes = [theme.texture.texture_cls] + (payload['low_power_classes'] or [])[:1]
+            s.incr('textures_injected', self.ensure_textures(texture_classes))
+            # 5. Fonts of the typography, on first use per client
+            s.incr('fonts_injected', FontManager.ensure_typography(theme.typography))
+
+    async def _apply_when_loaded(self, client, seq: int, families: List[str], timeout: float,
+                                 theme: Theme, alternate: Optional[Palette], mode: Optional[str], instant: bool):
+        async def load(family: str):
+            with client:  # gather() runs each load in its own task
+                await FontManager.ensure_loaded(family, timeout)
+
+        await asyncio.gather(*(load(family) for family in families))
+        # Skip if another theme was applied on this client while waiting
+        if not client.is_deleted and self._client_applies.get(client) == seq:
+            with client:
+                self.apply_theme(theme, alternate=alternate, mode=mode, instant=instant)
+
+    def build_payload(self, theme: Theme, alternate: Optional[Palette] = None, mode: Optional[str] = None) -> Dict[str, Any]:
+        """Compiles everything `apply_theme` sends to the client, without side effects."""
+        fallback = self._fallback_texture(theme.texture)
+        return {
+            'prefix': theme.prefix,
+            'css': generate_theme_css(theme, alternate),
+            'classes': self._body_classes(theme),
+            'low_power_classes': self._texture_classes(fallback) if fallback else None,
+            'mode': mode,
+        }
+
+    @staticmethod
+    def _body_classes(theme: Theme) -> List[str]:
+        return ThemeManager._texture_classes(theme.texture)
+
+    @staticmethod
+    def _texture_classes(texture: Texture) -> List[str]:
+        classes = [texture.texture_cls]
+        if not texture.shadows_enabled:
+            classes.append('no-shadows')
+        return classes
+
+    @staticmethod
+    def _fallback_texture(texture: Texture) -> Optional[Texture]:
+        """The registered low-power fallback of a texture, if it declares one."""
+        if not texture.fallback:
+            return None
+        # Import here to avoid circular dependency
+        import nice_design as nice
+        return nice.registry.get_texture(texture.fallback)
+
+    def _runtime_js(self, client) -> str:
+        """The client runtime, initialized with the client's low-power policy."""
+        enabled = self._client_low_power.get(client, self._policy_value(self.low_power_policy))
+        return f'{_JS_APPLY_THEME}window.ndInitLowPower({json.dumps(enabled)}, {int(self.low_power_min_fps)});'
+
+    @staticmethod
+    def _policy_value(policy: str):
+        return {'auto': 'auto', 'on': True, 'off': False}[policy]
+
+    def configure_low_power(self, policy: str = 'auto', min_fps: int = 30):
+        """
+        Sets the low-power tier policy of new pages. On low-power clients, textures with
+        a `fallback` are replaced by it and blur/filter effects are dropped
+        (`nd-low-power` body class, see textures.css).
+
+        Args:
+            policy: 'auto' (follow the client: `prefers-reduced-transparency`, or a frame
+                rate below `min_fps` right after loading), 'on' or 'off'.
+            min_fps: Frame rate threshold of the 'auto' policy (0 disables the measurement).
+        """
+        if policy not in LOW_POWER_POLICIES:
+            raise ValueError(f"Invalid low-power policy '{policy}', expected one of {LOW_POWER_POLICIES}")
+        self.low_power_policy = policy
+        self.low_power_min_fps = min_fps
+
+    def set_low_power(self, enabled: Optional[bool]):
+        """
+        Forces the low-power tier on (True) or off (False) for the current client,
+        e.g. from a server-side policy; None hands it back to the client's signals.
+        """
+        client = context.client
+        value = 'auto' if enabled is None else enabled
+        self._client_low_power[client] = value
+        if client in self._client_runtime:
+            run_javascript(f'window.ndSetLowPower({json.dumps(value)})')
+
+    def ensure_textures(self, texture_classes: Iterable[str]) -> int:
+        """
+        Injects the CSS of the given texture classes into the current client's page,
+        once per client. Classes without CSS of their own (e.g. the built-in textures
+        of textures.css) are skipped. Returns the number of stylesheets injected.
+        """
+        # Import here to avoid circular dependency
+        import nice_design as nice
+
+        client = context.client
+        sent = self._client_textures.setdefault(client, set())
+        injected = 0
+        for texture_cls in texture_classes:
+            if texture_cls in sent:
+                continue
+            sent.add(texture_cls)
+            css = nice.registry.get_texture_css(texture_cls)
+            if css:
+                add_head_html(f'<style id="nd-texture{texture_cls}">{css}</style>')
+                injected += 1
+        return injected
+
+    def enable_bundle_switching(self, themes: Dict[str, Theme],
+                                on_switch: Optional[Callable[[str, Theme], None]] = None):
+        """
+        Opt-in client-side bundle switching for the current page (e.g. kiosks).
+        The variable blocks of all `themes` are precompiled into one cached stylesheet
+        scoped by `[data-nd-theme="name"]`; switching (see `bundle_js` / `switch_bundle`)
+        is then a single attribute change in the browser, and the server is only
+        notified afterwards.
+
+        Note: Utility classes are not part of the bundle blocks. Their spacing, radius
+        and heading sizes follow the bundle (they are calc()s of its variables); the
+        rest keeps the values of the last theme applied through `apply_theme`.
+        """
+        client = context.client
+        key = tuple((name, repr(theme)) for name, theme in themes.items())
+        state = self._client_bundles.get(client)
+        if state is None:
+            state = self._client_bundles[client] = {'key': None, 'themes': {}, 'callbacks': []}
+            # One listener per client, whatever the number of callers
+            ui.on('nd_bundle_switched', lambda e: self._handle_bundle_switch(client, e.args))
+        if on_switch and on_switch not in state['callbacks']:
+            state['callbacks'].append(on_switch)
+        if state['key'] == key:
+            return
+        state['key'] = key
+        state['themes'] = themes
+
+        css = self._bundle_css_cache.get(key)
+        if css is None:
+            css = generate_bundle_css(themes)
+            self._bundle_css_cache[key] = css
+
+        prefix = next(iter(themes.values())).prefix if themes else 'nd'
+        classes = {name: self._body_classes(theme) for name, theme in themes.items()}
+        add_head_html(f'<style id="{prefix}-bundles">{css}</style>')
+        # Switching happens in the browser, so every bundle's texture and fonts must already be there
+        self.ensure_textures(theme.texture.texture_cls for theme in themes.values())
+        for theme in themes.values():
+            FontManager.ensure_typography(theme.typography)
+        run_javascript(f'''
+            window.ndBundles = {json.dumps(classes)};
+            window.ndSwitchBundle = (name) => {{
+                const classes = window.ndBundles[name];
+                if (!classes) return false;
+                document.documentElement.setAttribute("data-{prefix}-theme", name);
+                {_clear_variables_js(prefix)}
+                {_JS_CLEAR_BODY_CLASSES}
+                classes.forEach(cls => document.body.classList.add(cls));
+                emitEvent("nd_bundle_switched", name);
+                return true;
+            }};
+        ''')
+
+    def _handle_bundle_switch(self, client, name: str):
+        """The browser of `client` switched to bundle `name`."""
+        state = self._client_bundles.get(client)
+        theme = state['themes'].get(name) if state else None
+        if theme is None:
+            return
+        self._client_themes[client] = (theme, None)
+        self._client_variables.pop(client, None)  # ndSwitchBundle drops the overrides
+        for callback in state['callbacks']:
+            callback(name, theme)
+
+    def switch_bundle(self, name: str):
+        """Switches to a precompiled bundle on the current client (no CSS is sent)."""
+        run_javascript(bundle_js(name))
+
+    def set_variable(self, name: str, value: str, prefix: Optional[str] = None):
+        """
+        Overrides one theme variable on the current client, e.g.
+        `set_variable('space-unit', '0.3rem')`. Everything derived from it through
+        calc() (spacing, radius and heading sizes) follows in the browser; no CSS is
+        recompiled or resent. The override lasts until the next `apply_theme`.
+        Setting the value the client already has sends nothing.
+        """
+        if prefix is None:
+            prefix = self.current_theme.prefix if self.current_theme else 'nd'
+        variables = self._client_variables.setdefault(context.client, {})
+        if variables.get(f'{prefix}-{name}') == value:
+            return
+        variables[f'{prefix}-{name}'] = value
+        run_javascript(f'document.documentElement.style.setProperty("--{prefix}-{name}", {json.dumps(value)})')
+
+    def set_mode(self, mode: str):
+        """
+        Switches light/dark/auto on the current client. Requires the theme to have been
+        applied with an `alternate` palette; no CSS is recompiled or resent.
+        """
+        prefix = self.current_theme.prefix if self.current_theme else 'nd'
+        run_javascript(mode_js(mode, prefix))
+
     def configure_defaults(self):
         """
         Configures global defaults for NiceGUI components.
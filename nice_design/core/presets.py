@@ -40,7 +40,7 @@ SOLARIZED_PALETTE = Palette(
     content_subtle='#657b83', # Base00
     
     # Status
-    success='#green',         # This was a placeholder in my head, should use '#859900'
+    success='#859900',        # Green
     on_success='#002b36',     # Base03
     
     error='#dc322f',          # Red
@@ -57,9 +57,6 @@ SOLARIZED_PALETTE = Palette(
     shadow="#fdf6e3"          # Base3 (Using bright color for visible 'shadow' / glow on dark backgrounds)
 )
 
-# Re-assigning Status colors correctly (fixing the '#green' slip above)
-SOLARIZED_PALETTE.success = '#859900'
-
 # Define a standard Texture (includes Shape)
 STANDARD_TEXTURE = Texture(
     name="standard",
@@ -1,25 +1,117 @@
 import importlib.metadata
+import logging
 import yaml
 import copy
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from .definitions import Palette, Texture, Layout, Typography, Theme
+from .validation import PaletteReport, validate_palettes, apply_fixes, palette_key
+from .generator import generate_palettes
+from .font_pipeline import optimize_font, DEFAULT_CACHE_DIR
+from .font_metrics import read_metrics, fallback_font_face, fallback_family
+from ..instrumentation import span
+
+logger = logging.getLogger(__name__)
 
 class ThemeRegistry:
-    def __init__(self):
+    def __init__(self, validate: bool = True, fix_contrast: bool = False,
+                 themes_dir: Optional[Union[str, Path]] = None,
+                 optimize_fonts: bool = False, font_cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            validate: Check hex validity and WCAG contrast of every palette after discovery.
+            fix_contrast: Replace failing on_* colors with corrected ones (implies validate).
+            themes_dir: Folder scanned for palettes/, textures/, layouts/, fonts/ and bundles.
+                Defaults to the library's own themes/ folder.
+            optimize_fonts: Convert local fonts to WOFF2 unicode-range subsets, written to
+                `font_cache_dir` (requires the `fonts` extra, see font_pipeline). Off by
+                default: the original files are served.
+            font_cache_dir: Where optimized fonts are cached (by content hash).
+        """
+        self.themes_dir = Path(themes_dir) if themes_dir else Path(__file__).parent.parent / "themes"
+        self.optimize_fonts = optimize_fonts
+        self.font_cache_dir = Path(font_cache_dir) if font_cache_dir else DEFAULT_CACHE_DIR
+        self.validate = validate or fix_contrast
+        self.fix_contrast = fix_contrast
+
         self._palettes = {}    # name -> {mode: Palette}
         self._textures = {}    # name -> Texture
         self._layouts = {}     # name -> Layout
         self._typographies = {} # name -> Typography
         self._themes = {}      # name -> Theme (Combination)
         
-        self._font_css = [] # Generated CSS for fonts
-        self._texture_css = [] # Generated CSS for textures
+        self._font_files = {} # family -> (url, format) of local font files
+        self._font_subsets = {} # family -> [FontSubset] of optimized local fonts
+        self._font_fallbacks = {} # family -> metric-compatible fallback @font-face
+        self._texture_css = {} # texture_cls -> CSS of the texture
+
+        self._validation = {}       # name -> {mode: PaletteReport}
+        self._validation_cache = {} # (name, mode) -> (palette_key, PaletteReport)
         
     def discover_plugins(self):
         """Scans both entry points and local theme folders."""
-        self._discover_entry_points()
-        self._discover_theme_folders()
+        with span('registry.discover') as s:
+            if s:
+                s.set('themes_dir', str(self.themes_dir))
+            self._discover_entry_points()
+            self._discover_theme_folders()
+            if self.validate:
+                with span('registry.validate'):
+                    self._validate_palettes()
+
+    def _validate_palettes(self, palettes: Optional[List[Palette]] = None):
+        """
+        Validates palettes in one batch, reusing cached reports for unchanged ones.
+        Without `palettes`, the whole index is rebuilt from all registered palettes
+        and cached reports of palettes no longer registered are dropped.
+        Problems are logged as one warning; the reports are available via get_validation().
+        """
+        if palettes is None:
+            palettes = [p for variations in self._palettes.values() for p in variations.values()]
+            self._validation = {}
+            registered = {(p.name, p.mode) for p in palettes}
+            self._validation_cache = {k: v for k, v in self._validation_cache.items() if k in registered}
+        keys = [palette_key(p) for p in palettes]
+        pending = [(k, p) for k, p in zip(keys, palettes)
+                   if self._validation_cache.get((p.name, p.mode), (None,))[0] != k]
+
+        if pending:
+            reports = validate_palettes([p for _, p in pending], fix=self.fix_contrast)
+            for (key, palette), report in zip(pending, reports):
+                self._validation_cache[(palette.name, palette.mode)] = (key, report)
+
+        problems = []
+        for palette in palettes:
+            _, report = self._validation_cache[(palette.name, palette.mode)]
+            self._validation.setdefault(palette.name, {})[palette.mode] = report
+            fixed = report.fixes if self.fix_contrast else {}
+            if fixed:
+                self._palettes[palette.name][palette.mode] = apply_fixes(palette, report)
+            if report.invalid or any(pair.split('/')[1] not in fixed for pair in report.failures):
+                problems.append(report)
+
+        if problems:
+            logger.warning("%d palette(s) failed validation: %s",
+                           len(problems), '; '.join(report.describe() for report in problems))
+
+    def register_seed_palette(self, name: str, primary: str, secondary: Optional[str] = None) -> Dict[str, Palette]:
+        """
+        Generates the dark and light variants of a palette from seed colors and
+        registers them like a discovered palette. Generation is cached by seed.
+        """
+        palettes = generate_palettes(name, primary, secondary)
+        for palette in palettes.values():
+            self._register_instance(palette, self._palettes)
+        if self.validate:
+            self._validate_palettes(list(palettes.values()))
+        return palettes
+
+    def get_validation(self, name: str, mode: Optional[str] = None) -> Optional[PaletteReport]:
+        """Returns the cached validation report of a palette variant (same mode resolution as get_palette)."""
+        variations = self._validation.get(name)
+        if not variations: return None
+        if mode: return variations.get(mode)
+        return variations.get('dark') or variations.get('light') or next(iter(variations.values()))
 
     def _discover_entry_points(self):
         entry_points = importlib.metadata.entry_points()
@@ -50,8 +142,7 @@ class ThemeRegistry:
     def _discover_theme_folders(self):
         """Discovers themes organized by folders: palettes/, textures/, layouts/, fonts/."""
         try:
-            root_dir = Path(__file__).parent.parent
-            themes_dir = root_dir / "themes"
+            themes_dir = self.themes_dir
             
             if not themes_dir.exists():
                 return
@@ -71,108 +162,119 @@ class ThemeRegistry:
     def _discover_palettes(self, path: Path):
         if not path.exists(): return
         for yaml_file in path.glob("*.yaml"):
-            try:
-                with open(yaml_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    if isinstance(data, list):
-                        for p_data in data:
-                            self._register_raw_data(p_data, Palette, self._palettes)
-                    elif isinstance(data, dict):
-                        if 'palettes' in data:
-                             for p_data in data['palettes']:
-                                 self._register_raw_data(p_data, Palette, self._palettes)
-                        else:
-                             self._register_raw_data(data, Palette, self._palettes)
-            except Exception as e:
-                print(f"Failed to load palette {yaml_file.name}: {e}")
+            with span('registry.file', kind='palette', path=yaml_file.name):
+                try:
+                    with open(yaml_file, 'r') as f:
+                        data = yaml.safe_load(f)
+                        if isinstance(data, list):
+                            for p_data in data:
+                                self._register_raw_data(p_data, Palette, self._palettes)
+                        elif isinstance(data, dict):
+                            if 'palettes' in data:
+                                 for p_data in data['palettes']:
+                                     self._register_raw_data(p_data, Palette, self._palettes)
+                            else:
+                                 self._register_raw_data(data, Palette, self._palettes)
+                except Exception as e:
+                    print(f"Failed to load palette {yaml_file.name}: {e}")
 
     def _discover_layouts(self, path: Path):
         if not path.exists(): return
         for yaml_file in path.glob("*.yaml"):
-            try:
-                with open(yaml_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    if isinstance(data, list):
-                        for d in data: self._register_raw_data(d, Layout, self._layouts)
-                    else:
-                        self._register_raw_data(data, Layout, self._layouts)
-            except Exception as e:
-                print(f"Failed to load layout {yaml_file.name}: {e}")
+            with span('registry.file', kind='layout', path=yaml_file.name):
+                try:
+                    with open(yaml_file, 'r') as f:
+                        data = yaml.safe_load(f)
+                        if isinstance(data, list):
+                            for d in data: self._register_raw_data(d, Layout, self._layouts)
+                        else:
+                            self._register_raw_data(data, Layout, self._layouts)
+                except Exception as e:
+                    print(f"Failed to load layout {yaml_file.name}: {e}")
 
     def _discover_textures(self, path: Path):
         if not path.exists(): return
         for css_file in path.glob("*.css"):
-            name = css_file.stem
-            texture_cls = f"-nd-t-{name}"
-            instance = Texture(name=name, texture_cls=texture_cls)
-            self._register_instance(instance, self._textures)
-            with open(css_file, 'r') as f:
-                self._texture_css.append(f.read())
+            with span('registry.file', kind='texture_css', path=css_file.name):
+                name = css_file.stem
+                texture_cls = f"-nd-t-{name}"
+                instance = Texture(name=name, texture_cls=texture_cls)
+                self._register_instance(instance, self._textures)
+                with open(css_file, 'r') as f:
+                    self._texture_css[texture_cls] = f.read()
 
         for yaml_file in path.glob("*.yaml"):
-            try:
-                with open(yaml_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    if isinstance(data, list):
-                        for d in data: self._register_raw_data(d, Texture, self._textures)
-                    else:
-                        self._register_raw_data(data, Texture, self._textures)
-            except Exception as e:
-                print(f"Failed to load texture metadata {yaml_file.name}: {e}")
+            with span('registry.file', kind='texture', path=yaml_file.name):
+                try:
+                    with open(yaml_file, 'r') as f:
+                        data = yaml.safe_load(f)
+                        if isinstance(data, list):
+                            for d in data: self._register_raw_data(d, Texture, self._textures)
+                        else:
+                            self._register_raw_data(data, Texture, self._textures)
+                except Exception as e:
+                    print(f"Failed to load texture metadata {yaml_file.name}: {e}")
 
     def _discover_fonts(self, path: Path):
         if not path.exists(): return
-        self._font_css = []
+        self._font_files = {}
+        self._font_subsets = {}
+        self._font_fallbacks = {}
         extensions = ('.ttf', '.otf', '.woff', '.woff2')
         for font_file in path.iterdir():
             if font_file.suffix.lower() in extensions:
-                font_name = font_file.stem.replace('-', ' ').replace('_', ' ').title()
-                family_name = font_name.replace(' ', '')
-                
-                instance = Typography(name=font_name, font_main=f"'{family_name}', sans-serif")
-                self._register_instance(instance, self._typographies)
+                with span('registry.file', kind='font', path=font_file.name):
+                    font_name = font_file.stem.replace('-', ' ').replace('_', ' ').title()
+                    family_name = font_name.replace(' ', '')
+
+                    # A fallback face with the font's metrics avoids layout shift when it swaps in
+                    font_stack = f"'{family_name}', sans-serif"
+                    metrics = read_metrics(font_file.read_bytes())
+                    if metrics:
+                        self._font_fallbacks[family_name] = fallback_font_face(family_name, metrics)
+                        font_stack = f"'{family_name}', '{fallback_family(family_name)}', sans-serif"
                 
-                ext = font_file.suffix.lower()[1:]
-                fmt = "truetype" if ext == "ttf" else "opentype" if ext == "otf" else ext
+                    instance = Typography(name=font_name, font_main=font_stack)
+                    self._register_instance(instance, self._typographies)
                 
-                css = f"""
-                @font-face {{
-                    font-family: '{family_name}';
-                    src: url('/nd_themes/fonts/{font_file.name}') format('{fmt}');
-                    font-weight: normal;
-                    font-style: normal;
-                }}
-                """
-                self._font_css.append(css)
+                    ext = font_file.suffix.lower()[1:]
+                    fmt = "truetype" if ext == "ttf" else "opentype" if ext == "otf" else ext
+                    # @font-face rules are generated on demand (see get_font_css)
+                    self._font_files[family_name] = (f'/nd_themes/fonts/{font_file.name}', fmt)
+                    if self.optimize_fonts:
+                        subsets = optimize_font(font_file, self.font_cache_dir)
+                        if subsets:
+                            self._font_subsets[family_name] = subsets
 
     def _discover_bundles(self, path: Path):
         """Looks for YAML files that specify 'theme' combinations or pillar lists."""
         if not path.exists(): return
         for yaml_file in path.glob("*.yaml"):
-            try:
-                with open(yaml_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    if not isinstance(data, dict): continue
+            with span('registry.file', kind='bundle', path=yaml_file.name):
+                try:
+                    with open(yaml_file, 'r') as f:
+                        data = yaml.safe_load(f)
+                        if not isinstance(data, dict): continue
                     
-                    # 1. Check for pillar lists (Legacy Bundle)
-                    if 'palettes' in data:
-                        for p_data in data['palettes']: self._register_raw_data(p_data, Palette, self._palettes)
-                    if 'textures' in data:
-                        for d in data['textures']: self._register_raw_data(d, Texture, self._textures)
-                    if 'layouts' in data:
-                        for d in data['layouts']: self._register_raw_data(d, Layout, self._layouts)
-                    if 'typographies' in data:
-                        for d in data['typographies']: self._register_raw_data(d, Typography, self._typographies)
+                        # 1. Check for pillar lists (Legacy Bundle)
+                        if 'palettes' in data:
+                            for p_data in data['palettes']: self._register_raw_data(p_data, Palette, self._palettes)
+                        if 'textures' in data:
+                            for d in data['textures']: self._register_raw_data(d, Texture, self._textures)
+                        if 'layouts' in data:
+                            for d in data['layouts']: self._register_raw_data(d, Layout, self._layouts)
+                        if 'typographies' in data:
+                            for d in data['typographies']: self._register_raw_data(d, Typography, self._typographies)
                         
-                    # 2. Check for 'theme' definition (The Combination Pillar)
-                    if 'theme' in data:
-                        theme_data = data['theme']
-                        theme_name = theme_data.get('name', yaml_file.stem)
-                        # Store the raw combination data; we'll resolve it when requested
-                        self._themes[theme_name] = theme_data
+                        # 2. Check for 'theme' definition (The Combination Pillar)
+                        if 'theme' in data:
+                            theme_data = data['theme']
+                            theme_name = theme_data.get('name', yaml_file.stem)
+                            # Store the raw combination data; we'll resolve it when requested
+                            self._themes[theme_name] = theme_data
                         
-            except Exception as e:
-                print(f"Failed to load bundle {yaml_file.name}: {e}")
+                except Exception as e:
+                    print(f"Failed to load bundle {yaml_file.name}: {e}")
 
     def get_theme(self, name: str) -> Optional[Theme]:
         """Resolves a named theme by combining its referenced pillars."""
@@ -207,11 +309,60 @@ class ThemeRegistry:
     def list_themes(self) -> List[str]:
         return list(self._themes.keys())
 
-    def get_font_css(self) -> str:
-        return "\n".join(self._font_css)
+    def get_font_css(self, family: Optional[str] = None, display: str = 'swap') -> str:
+        """
+        The @font-face rule of one local font family ('' if it is not a local font),
+        or the rules of all local fonts. `display` is the `font-display` strategy.
+        Includes the family's metric-compatible fallback face, when known.
+        """
+        families = [family] if family is not None else list(self._font_files)
+        rules = []
+        for name in families:
+            if name not in self._font_files:
+                continue
+            if name in self._font_fallbacks:
+                rules.append(self._font_fallbacks[name])
+            if name in self._font_subsets:
+                # One rule per subset: the browser only fetches the ranges it renders
+                for subset in self._font_subsets[name]:
+                    rules.append(f"""
+                    @font-face {{
+                        font-family: '{name}';
+                        src: url('{subset.url}') format('woff2');
+                        font-weight: normal;
+                        font-style: normal;
+                        font-display: {display};
+                        unicode-range: {subset.unicode_range};
+                    }}
+                    """)
+                continue
+            url, fmt = self._font_files[name]
+            rules.append(f"""
+                    @font-face {{
+                        font-family: '{name}';
+                        src: url('{url}') format('{fmt}');
+                        font-weight: normal;
+                        font-style: normal;
+                        font-display: {display};
+                    }}
+                    """)
+        return "\n".join(rules)
+
+    def get_font_file(self, family: str) -> Optional[tuple]:
+        """The (url, format) of a local font family, if any (its first subset when optimized)."""
+        if family in self._font_subsets:
+            return (self._font_subsets[family][0].url, 'woff2')
+        return self._font_files.get(family)
+
+    def list_font_families(self) -> List[str]:
+        """Families of the discovered local font files."""
+        return list(self._font_files.keys())
         
-    def get_texture_css(self) -> str:
-        return "\n".join(self._texture_css)
+    def get_texture_css(self, texture_cls: Optional[str] = None) -> str:
+        """The CSS of one texture class ('' if it has none), or of all textures."""
+        if texture_cls is not None:
+            return self._texture_css.get(texture_cls, '')
+        return "\n".join(self._texture_css.values())
 
     def get_palette(self, name: str, mode: Optional[str] = None) -> Optional[Palette]:
         variations = self._palettes.get(name)
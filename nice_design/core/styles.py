@@ -1,14 +1,36 @@
-from .definitions import Theme
+from typing import Dict, List, Optional
+from .definitions import Theme, Palette, Texture, Typography, Layout
+from .color import hex_to_rgb
 
-def generate_theme_css(theme: Theme) -> str:
-    p = theme.prefix
-    pal = theme.palette
-    tex = theme.texture
-    typ = theme.typography
-    lay = theme.layout
-    
-    # 1. CSS Variables
-    lines = [":root {"]
+# Quasar brand colors driven by the theme variables
+QUASAR_BRAND = {
+    'primary': 'primary',
+    'secondary': 'secondary',
+    'accent': 'highlight',
+    'positive': 'status-success',
+    'negative': 'status-error',
+    'warning': 'status-warning',
+    'info': 'status-info',
+}
+
+# Heading levels of the type scale: h6 is the base size, each level up multiplies by --nd-type-ratio
+HEADINGS = ['h6', 'h5', 'h4', 'h3', 'h2', 'h1']
+
+def space_unit(layout: Layout) -> str:
+    """Value of --nd-space-unit: the step of the spacing utilities (size 1)."""
+    return f"{layout.base_space * 0.25}rem"
+
+def radius_base(texture: Texture) -> str:
+    """Value of --nd-radius-base: the 'md' radius."""
+    return f"{texture.roundness * 0.5}rem"
+
+def type_ratio(typography: Typography) -> str:
+    """Value of --nd-type-ratio: the size ratio between consecutive heading levels."""
+    return f"{typography.scale_ratio}"
+
+def _palette_variable_lines(pal: Palette, p: str) -> List[str]:
+    """CSS variable declarations for every color role of a palette."""
+    lines = []
 
     # --- COLORS: ACCENTS ---
     lines.append("  /* --- Accents --- */")
@@ -18,6 +40,7 @@ def generate_theme_css(theme: Theme) -> str:
     lines.append(f"  --{p}-on-secondary: {pal.on_secondary};")
     lines.append(f"  --{p}-highlight: {pal.highlight};")
     lines.append(f"  --{p}-shadow: {pal.shadow};")
+    lines.append(f"  --{p}-shadow-rgb: {', '.join(map(str, hex_to_rgb(pal.shadow)))};")  # For rgba(var(...), a)
 
     # --- COLORS: SURFACES ---
     lines.append("  /* --- Surfaces --- */")
@@ -45,13 +68,87 @@ def generate_theme_css(theme: Theme) -> str:
     lines.append(f"  --{p}-on-status-warning: {pal.on_warning};")
     lines.append(f"  --{p}-status-info: {pal.info};")
     lines.append(f"  --{p}-on-status-info: {pal.on_info};")
+    return lines
+
+def _theme_variable_lines(theme: Theme) -> List[str]:
+    """CSS variable declarations of a whole theme (palette, shape and type)."""
+    p = theme.prefix
+    tex = theme.texture
+    typ = theme.typography
+    lines = _palette_variable_lines(theme.palette, p)
 
     # --- SHAPE & TYPOGRAPHY ---
     lines.append("  /* --- Shape & Type --- */")
-    lines.append(f"  --{p}-radius-base: {tex.roundness * 0.5}rem;")
+    lines.append(f"  --{p}-radius-base: {radius_base(tex)};")
     lines.append(f"  --{p}-border-width: {tex.border_width}px;")
     lines.append(f"  --{p}-font-main: {typ.font_main};")
     lines.append(f"  --{p}-font-mono: {typ.font_mono};")
+
+    # --- SCALES: every derived size is a calc() of one of these ---
+    lines.append("  /* --- Scales --- */")
+    lines.append(f"  --{p}-space-unit: {space_unit(theme.layout)};")
+    lines.append(f"  --{p}-transition-speed: {theme.layout.transition_speed}s;")
+    lines.append(f"  --{p}-transition-properties: {theme.layout.transition_properties};")
+    lines.append(f"  --{p}-type-ratio: {type_ratio(typ)};")
+    lines.append(f"  --{p}-font-size-{HEADINGS[0]}: 1rem;")
+    for lower, level in zip(HEADINGS, HEADINGS[1:]):
+        lines.append(f"  --{p}-font-size-{level}: calc(var(--{p}-font-size-{lower}) * var(--{p}-type-ratio));")
+    return lines
+
+def generate_bundle_css(themes: Dict[str, Theme], prefix: str = 'nd') -> str:
+    """
+    Compiles the variable block of every theme bundle, scoped by
+    `:root[data-nd-theme="name"]`, so bundles can be switched by changing one attribute.
+    The selector repeats the attribute to outrank the light/dark blocks of the applied
+    theme (`:root[data-nd-mode=...]`, same specificity otherwise), which come later in
+    the cascade.
+    """
+    lines = ["/* --- Theme Bundles --- */"]
+    for name, theme in themes.items():
+        lines.append(f':root[data-{prefix}-theme][data-{prefix}-theme="{name}"] {{')
+        lines.extend(_theme_variable_lines(theme))
+        lines.append("}")
+    return "\n".join(lines)
+
+def generate_mode_css(palette: Palette, alternate: Palette, prefix: str = 'nd') -> str:
+    """
+    Compiles the alternate light/dark variant of a palette under a `prefers-color-scheme`
+    media query, with an explicit `data-nd-mode` override on the root element.
+    `palette` is expected in the base :root block; `alternate` takes over when:
+      - the OS prefers its mode and data-nd-mode does not force the other one, or
+      - data-nd-mode explicitly selects its mode.
+    """
+    p = prefix
+    base_mode, alt_mode = palette.mode, alternate.mode
+    alt_lines = [f"  color-scheme: {alt_mode};"] + _palette_variable_lines(alternate, p)
+
+    lines = ["/* --- Color Scheme Variants --- */"]
+    lines.append(f":root {{ color-scheme: {base_mode}; }}")
+    lines.append(f"@media (prefers-color-scheme: {alt_mode}) {{")
+    lines.append(f'  :root:not([data-{p}-mode="{base_mode}"]) {{')
+    lines.extend(f"  {line}" for line in alt_lines)
+    lines.append("  }")
+    lines.append("}")
+    lines.append(f':root[data-{p}-mode="{alt_mode}"] {{')
+    lines.extend(alt_lines)
+    lines.append("}")
+    return "\n".join(lines)
+
+def generate_theme_css(theme: Theme, alternate: Optional[Palette] = None) -> str:
+    """
+    Generates the theme's CSS variables and utility classes.
+    Spacing, radius and heading sizes are `calc()` expressions of --nd-space-unit,
+    --nd-radius-base and --nd-type-ratio, so changing one of those (see
+    ThemeManager.set_variable) restyles them all without recompiling.
+    If `alternate` (the same palette in the other mode) is given, both variants are
+    compiled and the active one follows `prefers-color-scheme` / `data-nd-mode`.
+    """
+    p = theme.prefix
+    pal = theme.palette
+    
+    # 1. CSS Variables
+    lines = [":root {"]
+    lines.extend(_theme_variable_lines(theme))
     lines.append("}")
 
     # 2. Utility Classes
@@ -59,11 +156,10 @@ def generate_theme_css(theme: Theme) -> str:
     
     # --- Spacing Utilities ---
     # Sizes: 0, 1, 2, 3, 4, 5, 6, 8, 10, 12
-    base_space = lay.base_space
     sizes = [0, 1, 2, 3, 4, 5, 6, 8, 10, 12]
     
     for size in sizes:
-        val = f"{size * 0.25 * base_space}rem"
+        val = f"calc(var(--{p}-space-unit) * {size})"
         # Padding
         lines.append(f".-{p}-u-p-{size} {{ padding: {val} !important; }}")
         lines.append(f".-{p}-u-pt-{size} {{ padding-top: {val} !important; }}")
@@ -122,12 +218,11 @@ def generate_theme_css(theme: Theme) -> str:
 
     # --- Radius Utilities ---
     # sm, md, lg, full, none
-    base_r = tex.roundness * 0.5 # rem
     radii = {
         'none': '0px',
-        'sm': f"{base_r * 0.5}rem",
-        'md': f"{base_r}rem",
-        'lg': f"{base_r * 2}rem",
+        'sm': f"calc(var(--{p}-radius-base) * 0.5)",
+        'md': f"var(--{p}-radius-base)",
+        'lg': f"calc(var(--{p}-radius-base) * 2)",
         'full': '9999px'
     }
     
@@ -138,4 +233,39 @@ def generate_theme_css(theme: Theme) -> str:
     lines.append(f".-{p}-u-border {{ border: var(--{p}-border-width) solid var(--{p}-border-color, currentColor) !important; }}")
     lines.append(f".-{p}-u-border-primary {{ border-color: var(--{p}-primary) !important; }}")
 
-    return "\n".join(lines)
\ No newline at end of file
+    # --- Quasar Bridge ---
+    # Quasar's brand colors (--q-*) follow the theme variables (and thus bundles and modes)
+    brand = " ".join(f"--q-{q}: var(--{p}-{nd}) !important;" for q, nd in QUASAR_BRAND.items())
+    lines.append(f"body {{ {brand} }}")
+
+    # --- Type Scale ---
+    # Opt-in: `.-nd-u-text-h1` on an element, or `.-nd-u-type-scale` on a container for its headings
+    for level in HEADINGS:
+        lines.append(f".-{p}-u-text-{level}, .-{p}-u-type-scale {level} {{ font-size: var(--{p}-font-size-{level}) !important; }}")
+
+    if alternate is not None and alternate.mode != pal.mode:
+        lines.append(generate_mode_css(pal, alternate, p))
+
+    return "\n".join(lines)
+
+def split_rules(css: str) -> List[str]:
+    """
+    The top-level rules of a stylesheet generated here, in the order the CSSOM indexes
+    them (`sheet.cssRules`); comments between rules are dropped. Works line by line,
+    so a rule spanning lines must start on its own line (as everything above does).
+    """
+    rules: List[str] = []
+    block: List[str] = []
+    depth = 0
+    for line in css.splitlines():
+        stripped = line.strip()
+        if not block and (not stripped or stripped.startswith('/*')):
+            continue
+        block.append(line)
+        depth += line.count('{') - line.count('}')
+        if depth <= 0:
+            rules.append("\n".join(block))
+            block, depth = [], 0
+    if block:
+        rules.append("\n".join(block))
+    return rules
@@ -1,15 +1,21 @@
 """Utility functions for the NiceDesign core."""
+# Color helpers now live in `core.color`; re-exported here for compatibility.
+from .color import hex_to_rgb
 
-def hex_to_rgb(hex_color: str) -> tuple:
-    """Convert hex color to RGB tuple.
-    
-    Args:
-        hex_color: Hex color string (e.g., '#FF5733' or 'FF5733')
-        
-    Returns:
-        Tuple of (r, g, b) values as integers (0-255)
+from nicegui import ui
+from ..instrumentation import current_span
+
+
+def run_javascript(code: str):
+    """`ui.run_javascript`, counted as 'run_javascript' on the enclosing span."""
+    current_span().incr('run_javascript')
+    ui.run_javascript(code)
+
+
+def add_head_html(code: str):
+    """
+    `ui.add_head_html`, counted as 'add_head_html' on the enclosing span. Once the page
+    has been sent, NiceGUI delivers it like a `run_javascript` call (one message).
     """
-    h = hex_color.lstrip('#')
-    if len(h) == 3:
-        h = ''.join([c*2 for c in h])
-    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+    current_span().incr('add_head_html')
+    ui.add_head_html(code)
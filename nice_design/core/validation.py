@@ -0,0 +1,144 @@
+"""
+Batch validation of palettes: hex validity and WCAG contrast of every role pair.
+"""
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .definitions import Palette
+from .color import parse_hex, to_hex, contrast_ratio, mix
+
+# (background role, foreground role, minimum WCAG ratio)
+CONTRAST_PAIRS: Tuple[Tuple[str, str, float], ...] = (
+    ('primary', 'on_primary', 4.5),
+    ('secondary', 'on_secondary', 4.5),
+    ('success', 'on_success', 4.5),
+    ('error', 'on_error', 4.5),
+    ('warning', 'on_warning', 4.5),
+    ('info', 'on_info', 4.5),
+    ('surface_base', 'content_main', 4.5),
+    ('surface_layer', 'content_main', 4.5),
+    ('surface_overlay', 'content_main', 3.0),
+    ('surface_base', 'content_muted', 3.0),
+)
+
+# Every single-color role of a Palette
+COLOR_ROLES: Tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(Palette) if f.type is str and f.name not in ('name', 'mode')
+)
+
+_BG_ROLES = [bg for bg, _, _ in CONTRAST_PAIRS]
+_FG_ROLES = [fg for _, fg, _ in CONTRAST_PAIRS]
+_MINIMUMS = np.array([ratio for _, _, ratio in CONTRAST_PAIRS])
+
+
+@dataclass
+class PaletteReport:
+    """Validation result of a single palette variant."""
+    name: str
+    mode: str
+    invalid: List[str] = field(default_factory=list)        # roles (or 'colors.<name>') with invalid hex
+    contrast: Dict[str, float] = field(default_factory=dict)  # 'bg/fg' -> ratio
+    failures: List[str] = field(default_factory=list)       # 'bg/fg' pairs below their minimum
+    fixes: Dict[str, str] = field(default_factory=dict)     # on_* role -> corrected hex
+
+    @property
+    def ok(self) -> bool:
+        return not self.invalid and not self.failures
+
+    def describe(self) -> str:
+        """One-line summary, e.g. "metro (light): invalid highlight, primary/on_primary 3.2 < 4.5"."""
+        minimums = {f'{bg}/{fg}': minimum for bg, fg, minimum in CONTRAST_PAIRS}
+        problems = [f'invalid {role}' for role in self.invalid]
+        for pair in self.failures:
+            fix = self.fixes.get(pair.split('/')[1])
+            problems.append(f'{pair} {self.contrast[pair]} < {minimums[pair]}' + (f' (fixed: {fix})' if fix else ''))
+        return f"{self.name} ({self.mode}): {', '.join(problems) or 'ok'}"
+
+
+def palette_key(palette: Palette) -> tuple:
+    """Hashable fingerprint of a palette's content, used to cache reports."""
+    return (palette.name, palette.mode,
+            tuple(getattr(palette, role) for role in COLOR_ROLES),
+            tuple(palette.colors.items()))
+
+
+def fix_contrast(bg: np.ndarray, fg: np.ndarray, minimum, *, headroom: float = 0.05) -> np.ndarray:
+    """
+    Moves each foreground towards black or white (whichever contrasts more with its
+    background) just far enough to reach `minimum`, preserving its hue where possible.
+    `headroom` is added to the target so results still pass once rounded to hex.
+    The search assumes contrast grows towards the extreme; results that don't pass
+    (e.g. a non-monotonic path through OKLab) fall back to pure black or white.
+    """
+    bg = np.asarray(bg, dtype=float)
+    fg = np.asarray(fg, dtype=float)
+    minimum = np.broadcast_to(np.asarray(minimum, dtype=float) + headroom, fg.shape[:-1])
+
+    white, black = np.ones(3), np.zeros(3)
+    towards_white = contrast_ratio(bg, white) >= contrast_ratio(bg, black)
+    extreme = np.where(towards_white[..., None], white, black)
+
+    lo = np.zeros(fg.shape[:-1])
+    hi = np.ones(fg.shape[:-1])
+    for _ in range(12):
+        mid = (lo + hi) / 2
+        passes = contrast_ratio(bg, mix(fg, extreme, mid, space='oklab')) >= minimum
+        hi = np.where(passes, mid, hi)
+        lo = np.where(passes, lo, mid)
+    fixed = np.clip(mix(fg, extreme, hi, space='oklab'), 0.0, 1.0)
+    passes = contrast_ratio(bg, fixed) >= minimum
+    return np.where(passes[..., None], fixed, extreme)
+
+
+def validate_palettes(palettes: Sequence[Palette], *, fix: bool = False) -> List[PaletteReport]:
+    """
+    Validates many palettes at once. All role pairs of all palettes are evaluated
+    as a single ``(palettes, pairs)`` contrast matrix.
+    With `fix`, failing on_* roles receive a corrected color in `PaletteReport.fixes`.
+    """
+    reports = [PaletteReport(name=p.name, mode=p.mode) for p in palettes]
+    if not palettes:
+        return reports
+
+    # 1. Hex validity of roles and named colors
+    for palette, report in zip(palettes, reports):
+        values = [getattr(palette, role) for role in COLOR_ROLES] + list(palette.colors.values())
+        labels = list(COLOR_ROLES) + [f'colors.{name}' for name in palette.colors]
+        rgb = parse_hex(values, strict=False)
+        report.invalid = [labels[i] for i in np.flatnonzero(np.isnan(rgb).any(axis=-1))]
+
+    # 2. Contrast matrix
+    n_pairs = len(CONTRAST_PAIRS)
+    bg = parse_hex([getattr(p, role) for p in palettes for role in _BG_ROLES], strict=False).reshape(-1, n_pairs, 3)
+    fg = parse_hex([getattr(p, role) for p in palettes for role in _FG_ROLES], strict=False).reshape(-1, n_pairs, 3)
+    ratios = contrast_ratio(bg, fg)
+    failing = ratios < _MINIMUMS  # NaN (invalid hex) compares False; reported above
+
+    for i, report in enumerate(reports):
+        for j, (bg_role, fg_role, _) in enumerate(CONTRAST_PAIRS):
+            key = f'{bg_role}/{fg_role}'
+            if not np.isnan(ratios[i, j]):
+                report.contrast[key] = round(float(ratios[i, j]), 2)
+            if failing[i, j]:
+                report.failures.append(key)
+
+    # 3. Corrected on_* colors
+    if fix:
+        fixable = failing & np.array([fg.startswith('on_') for fg in _FG_ROLES])
+        rows, cols = np.nonzero(fixable)
+        if len(rows):
+            fixed = to_hex(fix_contrast(bg[rows, cols], fg[rows, cols], _MINIMUMS[cols]))
+            for i, j, value in zip(rows, cols, fixed):
+                reports[i].fixes[_FG_ROLES[j]] = value
+
+    return reports
+
+
+def apply_fixes(palette: Palette, report: PaletteReport) -> Palette:
+    """Returns a copy of `palette` with the report's corrected on_* colors."""
+    if not report.fixes:
+        return palette
+    return dataclasses.replace(palette, **report.fixes)
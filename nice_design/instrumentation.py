@@ -0,0 +1,180 @@
+"""
+Lightweight timing/event hooks for the theming hot paths.
+
+Code under measurement opens spans::
+
+    with instrumentation.span('apply_theme', theme=theme.name) as s:
+        ...
+        s.set('css_bytes', len(css))
+
+Finished spans are delivered as `SpanEvent`s to every subscriber. Without
+subscribers `span()` returns a shared no-op object, so no clock is read and no
+span or event is created. The keyword arguments are still evaluated by the
+caller, so attributes that are costly to compute are set behind `if s:`.
+
+    exporter = InMemoryExporter()
+    with exporter:
+        theme_manager.apply_theme(theme)
+    exporter.find('apply_theme')[0].attributes['css_bytes']
+"""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class SpanEvent:
+    """A finished span."""
+    name: str
+    start: float                    # time.perf_counter() at entry
+    duration_ms: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    parent: Optional[str] = None    # name of the enclosing span
+    error: Optional[str] = None     # exception type if the span exited with one
+
+
+Subscriber = Callable[[SpanEvent], None]
+
+_subscribers: List[Subscriber] = []
+_current: ContextVar[Optional['_Span']] = ContextVar('nd_current_span', default=None)
+
+
+def subscribe(callback: Subscriber) -> Callable[[], None]:
+    """Registers `callback` for every finished span. Returns a function that unsubscribes it."""
+    _subscribers.append(callback)
+    return lambda: unsubscribe(callback)
+
+
+def unsubscribe(callback: Subscriber):
+    if callback in _subscribers:
+        _subscribers.remove(callback)
+
+
+def enabled() -> bool:
+    """True if at least one subscriber is registered."""
+    return bool(_subscribers)
+
+
+class _Span:
+    __slots__ = ('name', 'attributes', 'start', 'parent', '_token')
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+
+    def set(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def incr(self, key: str, amount: int = 1):
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def __bool__(self):
+        return True
+
+    def __enter__(self):
+        parent = _current.get()
+        self.parent = parent.name if parent else None
+        self._token = _current.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = (time.perf_counter() - self.start) * 1e3
+        _current.reset(self._token)
+        event = SpanEvent(
+            name=self.name,
+            start=self.start,
+            duration_ms=duration,
+            attributes=self.attributes,
+            parent=self.parent,
+            error=exc_type.__name__ if exc_type else None,
+        )
+        for callback in list(_subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Instrumentation subscriber failed: {e}")
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span used while nobody is subscribed. Falsy, so costly attributes can be skipped."""
+    __slots__ = ()
+
+    def set(self, key: str, value: Any):
+        pass
+
+    def incr(self, key: str, amount: int = 1):
+        pass
+
+    def __bool__(self):
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **attributes):
+    """Opens a timed span (a context manager). A no-op when there are no subscribers."""
+    if not _subscribers:
+        return _NULL_SPAN
+    return _Span(name, attributes)
+
+
+def current_span():
+    """The innermost open span of the current context (the no-op span if none)."""
+    return _current.get() or _NULL_SPAN
+
+
+class InMemoryExporter:
+    """
+    Collects span events in a list, for tests and offline analysis.
+    Use as a context manager, or call `start()` / `stop()`.
+    """
+    def __init__(self):
+        self.events: List[SpanEvent] = []
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+    def __call__(self, event: SpanEvent):
+        self.events.append(event)
+
+    def start(self) -> 'InMemoryExporter':
+        if self._unsubscribe is None:
+            self._unsubscribe = subscribe(self)
+        return self
+
+    def stop(self):
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def find(self, name: str) -> List[SpanEvent]:
+        """All recorded events named `name`, in completion order."""
+        return [e for e in self.events if e.name == name]
+
+    def clear(self):
+        self.events.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, total and max duration (ms) per span name."""
+        stats: Dict[str, Dict[str, float]] = {}
+        for e in self.events:
+            s = stats.setdefault(e.name, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            s['count'] += 1
+            s['total_ms'] += e.duration_ms
+            s['max_ms'] = max(s['max_ms'], e.duration_ms)
+        return stats
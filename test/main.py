@@ -8,6 +8,7 @@ import copy
 configure_global_styles()
 from nice_design.core.definitions import Theme, Palette, Texture, Layout, Typography
 from nice_design.core.presets import SOLARIZED_PALETTE, STANDARD_TEXTURE, STANDARD_LAYOUT, STANDARD_TYPO
+from nice_design.core.styles import space_unit, radius_base, type_ratio
 
 # Create custom texture (includes shape) to demonstrate the new systems
 custom_texture = copy.deepcopy(STANDARD_TEXTURE)
@@ -37,8 +38,21 @@ theme = Theme(
 # 2. Setup the Design System
 nice.setup(theme)
 
+# Sliders backed by a single theme variable: no recompilation while dragging
+SCALE_VARIABLES = {
+    'spacing': lambda e: ('space-unit', space_unit(e['layout'])),
+    'roundness': lambda e: ('radius-base', radius_base(e['texture'])),
+    'scale': lambda e: ('type-ratio', type_ratio(e['typography'])),
+}
+
 # Handle Theme Change
 def handle_theme_change(e: Dict[str, Any]):
+    changed = e.get('changed') or []
+    if changed and all(key in SCALE_VARIABLES for key in changed):
+        for key in changed:
+            nice.theme_manager.set_variable(*SCALE_VARIABLES[key](e))
+        return
+
     # Build a new Theme from the 4 categorical pillars
     new_theme = Theme(
         name="Dynamic Theme",
@@ -47,8 +61,8 @@ def handle_theme_change(e: Dict[str, Any]):
         typography=e['typography'],
         layout=e['layout']
     )
-    # Apply it globally
-    nice.apply_theme(new_theme)
+    # Apply it globally (with the other light/dark variant so mode flips stay client-side)
+    nice.apply_theme(new_theme, alternate=e.get('alternate'), mode=e.get('mode'))
 
 # 3. Build the UI
 with ui.column().classes('w-full items-center nd-p-xl nd-gap-xl'):